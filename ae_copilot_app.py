@@ -5,6 +5,7 @@ Focused on structured enrichment + ROI calculation (no narrative generation).
 
 import streamlit as st
 import sys
+import json
 from pathlib import Path
 import os
 
@@ -25,17 +26,20 @@ def load_custom_assets():
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.schemas import ROIInputs, ROIOutputs, ExtractedSignals, CRMContext
-from src.roi_calculator import calculate_roi
+from src.schemas import ROIInputs, ROIOutputs, ExtractedSignals, CRMContext, ParameterDistribution
+from src.roi_calculator import calculate_roi, simulate_roi
+from src.sensitivity import get_sensitivity_grid, tornado_analysis
 from src.gong_client import GongClient
 from src.crm_client import HubSpotClient
+from src.crm_cache import CachedCRMClient, DEFAULT_CACHE_PATH
+from src.http_transport import get_transport
 from src.export import create_narrative_pack, export_narrative_pack
 from src.business_case import generate_business_case
 from src.storage import (
     save_roi_calculator, save_business_case,
     get_roi_calculators, get_business_cases,
     load_roi_calculator, load_business_case,
-    get_companies
+    get_companies, get_pipeline_summary
 )
 
 
@@ -352,6 +356,8 @@ if "roi_inputs" not in st.session_state:
     st.session_state.roi_inputs = None
 if "roi_outputs" not in st.session_state:
     st.session_state.roi_outputs = None
+if "roi_simulation" not in st.session_state:
+    st.session_state.roi_simulation = None
 if "gong_signals" not in st.session_state:
     st.session_state.gong_signals = None
 if "crm_context" not in st.session_state:
@@ -442,6 +448,7 @@ def render_roi_calculator():
                 
                 st.session_state.roi_inputs = inputs
                 st.session_state.roi_outputs = outputs
+                st.session_state.roi_simulation = None
                 
                 st.success("✅ ROI calculated successfully!")
                 st.rerun()
@@ -480,6 +487,9 @@ def render_roi_calculator():
             else:
                 st.metric("Payback Period", "N/A")
         
+        render_roi_sensitivity()
+        render_roi_simulation()
+        
         # Save ROI Calculator
         st.markdown("---")
         company_name_for_save = st.text_input(
@@ -511,14 +521,12 @@ def render_roi_calculator():
                             roi_inputs=st.session_state.roi_inputs,
                             roi_outputs=st.session_state.roi_outputs,
                             gong_signals=st.session_state.gong_signals,
-                            crm_context=st.session_state.crm_context
+                            crm_context=st.session_state.crm_context,
+                            roi_simulation=st.session_state.roi_simulation
                         )
                         
                         # Get version from saved ROI calculator
-                        import json
-                        with open(roi_path, 'r') as f:
-                            roi_data = json.load(f)
-                            version = roi_data.get("version", 1)
+                        version = load_roi_calculator(str(roi_path)).get("version", 1)
                         
                         bc_path = save_business_case(
                             company_name=company_name_for_save,
@@ -533,6 +541,147 @@ def render_roi_calculator():
                         st.error(f"Error saving: {str(e)}")
 
 
+def render_roi_sensitivity():
+    """Render what-if sensitivity analysis from the precomputed ROI grid."""
+    inputs = st.session_state.roi_inputs
+    if not inputs:
+        return
+    
+    with st.expander("📈 Sensitivity Analysis", expanded=False):
+        # Grid is cached by the inputs held fixed, so slider changes are lookups
+        grid = get_sensitivity_grid(inputs)
+        
+        st.markdown("**What-if**")
+        col1, col2 = st.columns(2)
+        with col1:
+            what_if_adoption = st.slider(
+                "Adoption Rate",
+                min_value=0.0,
+                max_value=1.0,
+                value=min(max(round(inputs.adoption_rate / 0.05) * 0.05, 0.0), 1.0),
+                step=0.05,
+                key="what_if_adoption"
+            )
+        with col2:
+            what_if_hours = st.slider(
+                "Hours Saved per Engineer per Week",
+                min_value=0.0,
+                max_value=20.0,
+                value=min(round(inputs.hours_saved_per_engineer_per_week * 2) / 2, 20.0),
+                step=0.5,
+                key="what_if_hours"
+            )
+        
+        what_if = grid.lookup(round(what_if_adoption, 2), what_if_hours)
+        if what_if:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric(
+                    "Net Annual Value",
+                    f"${what_if.net_annual_value:,.0f}",
+                    delta=f"${what_if.net_annual_value - st.session_state.roi_outputs.net_annual_value:,.0f}"
+                )
+            with col2:
+                if what_if.payback_months != float('inf'):
+                    st.metric("Payback Period", f"{what_if.payback_months:.1f} months")
+                else:
+                    st.metric("Payback Period", "N/A")
+        
+        st.markdown("**Net Annual Value by Adoption Rate (columns) × Hours Saved (rows)**")
+        st.dataframe(grid.table("net_annual_value")[::2], use_container_width=True, hide_index=True)
+        
+        st.markdown("**Tornado: impact of ±20% on each input**")
+        bars = tornado_analysis(inputs)
+        st.bar_chart(
+            {
+                "Input": [bar["field"].replace("_", " ").title() for bar in bars],
+                "Impact ($)": [bar["spread"] for bar in bars],
+            },
+            x="Input",
+            y="Impact ($)"
+        )
+
+
+def render_roi_simulation():
+    """Render the Monte Carlo simulation over uncertain ROI inputs."""
+    inputs = st.session_state.roi_inputs
+    if not inputs:
+        return
+    
+    with st.expander("🎲 Monte Carlo Simulation", expanded=False):
+        st.caption(
+            "Each input is drawn from a triangular distribution between the range below, "
+            "peaking at the calculator value. Saved business cases include the results."
+        )
+        # Default ranges, snapped to the slider steps
+        adoption = round(inputs.adoption_rate / 0.05) * 0.05
+        hours = inputs.hours_saved_per_engineer_per_week
+        hours_low, hours_high = round(hours * 0.5 * 2) / 2, round(hours * 1.25 * 2) / 2
+        with st.form("roi_simulation_form"):
+            adoption_low, adoption_high = st.slider(
+                "Adoption Rate Range",
+                min_value=0.0,
+                max_value=1.0,
+                value=(max(round(adoption - 0.2, 2), 0.0), min(round(adoption + 0.1, 2), 1.0)),
+                step=0.05
+            )
+            hours_low, hours_high = st.slider(
+                "Hours Saved per Engineer per Week Range",
+                min_value=0.0,
+                max_value=max(20.0, hours_high),
+                value=(hours_low, hours_high),
+                step=0.5
+            )
+            cost_spread = st.slider(
+                "Fully Loaded Cost Uncertainty (±%)",
+                min_value=0,
+                max_value=50,
+                value=10,
+                step=5
+            )
+            run = st.form_submit_button("Run Simulation", use_container_width=True)
+        
+        if run:
+            try:
+                cost = inputs.fully_loaded_cost_per_engineer
+                st.session_state.roi_simulation = simulate_roi(
+                    inputs,
+                    adoption_rate=ParameterDistribution(kind="triangular", low=adoption_low, high=adoption_high),
+                    hours_saved_per_engineer_per_week=ParameterDistribution(
+                        kind="triangular", low=hours_low, high=hours_high
+                    ),
+                    fully_loaded_cost_per_engineer=ParameterDistribution(
+                        kind="triangular", low=cost * (1 - cost_spread / 100), high=cost * (1 + cost_spread / 100)
+                    )
+                )
+            except Exception as e:
+                st.error(f"Error running simulation: {str(e)}")
+        
+        simulation = st.session_state.roi_simulation
+        if simulation:
+            st.metric("Chance of Positive Net Value", f"{simulation.probability_positive_value * 100:.1f}%")
+            st.dataframe(
+                {
+                    "Percentile": [label.upper() for label in simulation.net_annual_value],
+                    "Net Annual Value ($)": list(simulation.net_annual_value.values()),
+                    "Payback (months)": list(simulation.payback_months.values()),
+                },
+                use_container_width=True,
+                hide_index=True
+            )
+
+
+def render_transport_stats(name: str):
+    """Render request latency and connection reuse for a client's API transport."""
+    stats = get_transport(name).stats()
+    if stats["requests"]:
+        st.caption(
+            f"API: {stats['requests']} requests · avg {stats['avg_latency_ms']:.0f} ms · "
+            f"max {stats['max_latency_ms']:.0f} ms · {stats['retries']} retries · "
+            f"{stats['connections_reused']} reused / {stats['connections_opened']} opened connections"
+        )
+
+
 def render_gong_integration():
     """Render Gong transcript enrichment section."""
     st.markdown("""
@@ -578,6 +727,8 @@ def render_gong_integration():
         except Exception as e:
             st.error(f"Error fetching transcript: {str(e)}")
     
+    render_transport_stats("gong")
+    
     # Display transcript preview
     if "gong_transcript" in st.session_state:
         with st.expander("📄 Transcript Preview", expanded=False):
@@ -642,6 +793,7 @@ def render_gong_integration():
                     
                     # Recalculate ROI
                     st.session_state.roi_outputs = calculate_roi(updated_inputs)
+                    st.session_state.roi_simulation = None
                     st.success("✅ Signals applied to ROI calculator!")
                     st.rerun()
                 else:
@@ -653,12 +805,29 @@ def render_gong_integration():
                             cursor_annual_cost=0.0  # User will need to fill this
                         )
                         st.session_state.roi_inputs = new_inputs
+                        st.session_state.roi_simulation = None
                         st.success("✅ Signals applied! Please fill in remaining ROI inputs.")
                         st.rerun()
                     else:
                         st.warning("⚠️ Need team size and hours saved to apply signals.")
 
 
+@st.cache_resource
+def _cached_crm_client(mock_mode: bool, token: str) -> CachedCRMClient:
+    """One cached HubSpot client per (mode, token), shared across reruns and sessions.
+
+    Mock lookups get their own cache file so they never answer a real one.
+    """
+    db_path = DEFAULT_CACHE_PATH.with_name("crm_cache_mock.db") if mock_mode else DEFAULT_CACHE_PATH
+    return CachedCRMClient(HubSpotClient(private_app_token=token, mock_mode=mock_mode), db_path=db_path)
+
+
+def get_crm_client() -> CachedCRMClient:
+    """Cached HubSpot client for the current sidebar CRM settings."""
+    mock_mode = os.getenv("CRM_MOCK_MODE", "false").lower() == "true"
+    return _cached_crm_client(mock_mode, os.getenv("HUBSPOT_PRIVATE_APP_TOKEN", ""))
+
+
 def render_crm_integration():
     """Render CRM enrichment section."""
     st.markdown("""
@@ -674,12 +843,15 @@ def render_crm_integration():
         help="Company name or domain to search in CRM"
     )
     
+    refresh_crm = st.checkbox("Bypass cache", help="Refetch from HubSpot instead of using cached account context")
     fetch_crm = st.button("Fetch CRM Context", use_container_width=True)
     
     if fetch_crm and crm_account_input:
         try:
             with st.spinner("Fetching CRM data..."):
-                crm_client = HubSpotClient()
+                crm_client = get_crm_client()
+                if refresh_crm:
+                    crm_client.invalidate(crm_account_input)
                 context = crm_client.fetch_account_context(crm_account_input)
                 
                 st.session_state.crm_context = context
@@ -690,6 +862,17 @@ def render_crm_integration():
         except Exception as e:
             st.error(f"Error fetching CRM data: {str(e)}")
     
+    render_transport_stats("hubspot")
+    try:
+        cache_stats = get_crm_client().stats()
+    except ValueError:
+        cache_stats = None
+    if cache_stats and (cache_stats["hits"] or cache_stats["stale_hits"] or cache_stats["misses"]):
+        st.caption(
+            f"Cache: {cache_stats['hits']} hits · {cache_stats['stale_hits']} stale · "
+            f"{cache_stats['misses']} misses · {cache_stats['hit_rate']:.0%} hit rate"
+        )
+    
     # Display CRM context
     if st.session_state.crm_context:
         st.markdown("---")
@@ -832,6 +1015,15 @@ def render_saved_roi_calculators():
             st.info(f"No ROI calculators found for {selected_company}.")
         return
     
+    if selected_company == "All Companies":
+        summary = get_pipeline_summary()
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Pipeline Net Value", f"${summary['total_net_annual_value']:,.0f}")
+        col2.metric("Companies", summary["companies"])
+        avg_payback = summary["avg_payback_months"]
+        col3.metric("Avg Payback", f"{avg_payback:.1f} months" if avg_payback is not None else "N/A")
+        st.caption("Totals use each company's latest ROI calculator.")
+    
     # Group by company
     from collections import defaultdict
     grouped = defaultdict(list)
@@ -858,15 +1050,14 @@ def render_saved_roi_calculators():
                 
                 with col3:
                     if st.button("📥 Download", key=f"dl_roi_{company}_{calc['version']}", use_container_width=True):
-                        with open(calc["file_path"], 'r') as f:
-                            st.download_button(
-                                "Download",
-                                f.read(),
-                                file_name=f"{company.replace(' ', '-')}-v{calc['version']}.json",
-                                mime="application/json",
-                                key=f"dl_btn_roi_{company}_{calc['version']}",
-                                use_container_width=True
-                            )
+                        st.download_button(
+                            "Download",
+                            json.dumps(load_roi_calculator(calc["file_path"]), indent=2, default=str),
+                            file_name=f"{company.replace(' ', '-')}-v{calc['version']}.json",
+                            mime="application/json",
+                            key=f"dl_btn_roi_{company}_{calc['version']}",
+                            use_container_width=True
+                        )
     
     # View selected ROI calculator
     if "viewing_roi" in st.session_state and st.session_state.viewing_roi:
@@ -940,15 +1131,14 @@ def render_saved_business_cases():
                 
                 with col3:
                     if st.button("📥 Download", key=f"dl_bc_{company}_{case['version']}", use_container_width=True):
-                        with open(case["file_path"], 'r', encoding='utf-8') as f:
-                            st.download_button(
-                                "Download",
-                                f.read(),
-                                file_name=f"{company.replace(' ', '-')}-v{case['version']}.md",
-                                mime="text/markdown",
-                                key=f"dl_btn_bc_{company}_{case['version']}",
-                                use_container_width=True
-                            )
+                        st.download_button(
+                            "Download",
+                            load_business_case(case["file_path"]),
+                            file_name=f"{company.replace(' ', '-')}-v{case['version']}.md",
+                            mime="text/markdown",
+                            key=f"dl_btn_bc_{company}_{case['version']}",
+                            use_container_width=True
+                        )
     
     # View selected business case
     if "viewing_bc" in st.session_state and st.session_state.viewing_bc:
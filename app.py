@@ -6,17 +6,21 @@ import streamlit as st
 import sys
 from pathlib import Path
 import os
+from datetime import datetime, timedelta, timezone
 import re
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.renderer import render_account_brief
+from src.brief_pipeline import stream_account_brief
 from src.database import (
     create_user, authenticate_user, save_brief,
-    get_user_briefs, get_brief_content, delete_brief
+    list_user_briefs, count_user_briefs, search_user_briefs, get_brief_content, delete_brief
 )
 
+SAVED_BRIEFS_PAGE_SIZE = 20
+
 
 # Custom CSS for Figma-inspired dark appearance
 CURSOR_DARK_CSS = """
@@ -777,6 +781,8 @@ if "brief_generated" not in st.session_state:
     st.session_state.brief_generated = False
 if "current_brief" not in st.session_state:
     st.session_state.current_brief = None
+if "current_brief_inputs" not in st.session_state:
+    st.session_state.current_brief_inputs = None
 if "dark_mode" not in st.session_state:
     st.session_state.dark_mode = True  # Default to dark mode
 
@@ -888,23 +894,58 @@ def parse_user_input(text: str) -> dict:
     return extracted
 
 
-def generate_brief_response():
-    """Generate the account brief and return it."""
+def generate_brief_response(placeholder=None, prefix: str = ""):
+    """
+    Generate the account brief and return it.
+    
+    With a placeholder and streaming enabled, sections are rendered into the
+    placeholder (after prefix) as they finish, and time-to-first-content is
+    recorded in st.session_state.brief_timing.
+    """
+    brief_data = st.session_state.brief_data
     try:
-        brief = render_account_brief(
-            company=st.session_state.brief_data["company"],
-            persona=st.session_state.brief_data["persona"],
-            competitors=st.session_state.brief_data["competitors"],
-            use_research=st.session_state.brief_data["use_research"],
-            use_llm=st.session_state.brief_data["use_llm"],
-            llm_provider=st.session_state.brief_data["llm_provider"]
-        )
+        if placeholder is not None and brief_data.get("stream", True):
+            brief = ""
+            inputs = None
+            first_content = None
+            total = None
+            for update in stream_account_brief(
+                company=brief_data["company"],
+                persona=brief_data["persona"],
+                competitors=brief_data["competitors"],
+                use_research=brief_data["use_research"],
+                use_llm=brief_data["use_llm"],
+                llm_provider=brief_data["llm_provider"],
+                use_llm_cache=brief_data.get("use_llm_cache", True)
+            ):
+                # The title is instant; first content is the first researched section
+                if first_content is None and update["section"] != "title":
+                    first_content = update["elapsed"]
+                brief = update["markdown"]
+                inputs = update["inputs"]
+                total = update["elapsed"]
+                placeholder.markdown(prefix + brief + ("" if update["final"] else " ▌"))
+            st.session_state.brief_timing = {"first_content": first_content, "total": total}
+        else:
+            brief = render_account_brief(
+                company=brief_data["company"],
+                persona=brief_data["persona"],
+                competitors=brief_data["competitors"],
+                use_research=brief_data["use_research"],
+                use_llm=brief_data["use_llm"],
+                llm_provider=brief_data["llm_provider"],
+                use_llm_cache=brief_data.get("use_llm_cache", True)
+            )
+            inputs = None
+            st.session_state.brief_timing = None
         st.session_state.brief_generated = True
         st.session_state.current_brief = brief
+        st.session_state.current_brief_inputs = inputs
         return brief
     except Exception as e:
         error_msg = f"❌ Error generating brief: {str(e)}\n\nPlease try again or check your API keys if using LLM features."
         st.session_state.current_brief = None
+        st.session_state.current_brief_inputs = None
         return error_msg
 
 
@@ -978,6 +1019,47 @@ def show_login_page():
                             st.error("Username already exists. Please choose a different username.")
 
 
+def render_saved_brief(brief: dict):
+    """Render one saved brief row with view and delete actions."""
+    with st.expander(f"📄 {brief['title']} • {brief['created_at'][:10]}", expanded=bool(brief.get("snippet"))):
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            if brief.get("snippet"):
+                st.markdown(f"<div>{brief['snippet']}</div>", unsafe_allow_html=True)
+            st.markdown(f"**Company:** `{brief['company']}`")
+            st.markdown(f"**Persona:** `{brief['persona']}`")
+            st.markdown(f"**Competitors:** `{', '.join(brief['competitors'])}`")
+            st.caption(f"Created: {brief['created_at']}")
+        
+        with col2:
+            if st.button("View", key=f"view_{brief['id']}", use_container_width=True):
+                brief_content = get_brief_content(brief['id'], st.session_state.user_id)
+                if brief_content:
+                    st.session_state.viewing_brief = brief_content
+                    st.session_state.viewing_brief_title = brief['title']
+            
+            if st.button("Delete", key=f"delete_{brief['id']}", use_container_width=True, type="secondary"):
+                if delete_brief(brief['id'], st.session_state.user_id):
+                    st.rerun()
+
+
+def show_viewing_brief():
+    """Show the brief opened with View, if any."""
+    if "viewing_brief" in st.session_state and st.session_state.viewing_brief:
+        st.markdown("---")
+        st.markdown(f"### 📄 {st.session_state.viewing_brief_title}")
+        st.markdown(st.session_state.viewing_brief)
+        
+        st.download_button(
+            label="📥 Download Brief",
+            data=st.session_state.viewing_brief,
+            file_name=f"{st.session_state.viewing_brief_title.replace(' ', '-')}.md",
+            mime="text/markdown",
+            use_container_width=True
+        )
+
+
 def show_saved_briefs_page():
     """Show saved briefs page with modern design."""
     # Apply theme CSS
@@ -994,48 +1076,90 @@ def show_saved_briefs_page():
     
     st.markdown("---")
     
-    briefs = get_user_briefs(st.session_state.user_id)
+    search_query = st.text_input(
+        "🔍 Search",
+        key="saved_search",
+        placeholder="Search brief content, e.g. kubernetes migration"
+    ).strip()
+    
+    if search_query:
+        results = search_user_briefs(st.session_state.user_id, search_query, limit=SAVED_BRIEFS_PAGE_SIZE)
+        if not results:
+            st.info(f"No saved briefs match \"{search_query}\".")
+        else:
+            st.markdown(f"Top **{len(results)}** match(es) for \"{search_query}\"")
+            st.markdown("<br>", unsafe_allow_html=True)
+            for brief in results:
+                render_saved_brief(brief)
+        show_viewing_brief()
+        return
+    
+    # Filters
+    fcol1, fcol2, fcol3 = st.columns([2, 2, 3])
+    with fcol1:
+        company_filter = st.text_input("Company", key="saved_company_filter").strip()
+    with fcol2:
+        persona_filter = st.text_input("Persona", key="saved_persona_filter").strip()
+    with fcol3:
+        date_range = st.date_input("Created between", value=(), key="saved_date_filter")
+    
+    created_from = created_to = None
+    if len(date_range) == 2:
+        # created_at is a UTC CURRENT_TIMESTAMP; the picked days are local
+        def utc_start(day):
+            return datetime.combine(day, datetime.min.time()).astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        created_from = utc_start(date_range[0])
+        # Inclusive of the end date
+        created_to = utc_start(date_range[1] + timedelta(days=1))
+    
+    filters = {
+        "company": company_filter or None,
+        "persona": persona_filter or None,
+        "created_from": created_from,
+        "created_to": created_to,
+    }
+    
+    # Keyset pagination: keep the cursor each visited page started from
+    if st.session_state.get("saved_briefs_filters") != filters:
+        st.session_state.saved_briefs_filters = filters
+        st.session_state.saved_briefs_cursors = [None]
+    cursors = st.session_state.saved_briefs_cursors
+    
+    briefs, next_cursor = list_user_briefs(
+        st.session_state.user_id,
+        limit=SAVED_BRIEFS_PAGE_SIZE,
+        cursor=cursors[-1],
+        **filters
+    )
     
     if not briefs:
-        st.info("💡 You haven't saved any briefs yet. Generate a brief in the chat and save it!")
+        if any(filters.values()):
+            st.info("No saved briefs match these filters.")
+        else:
+            st.info("💡 You haven't saved any briefs yet. Generate a brief in the chat and save it!")
         return
     
-    st.markdown(f"**{len(briefs)}** saved brief(s)")
+    total = count_user_briefs(st.session_state.user_id, **filters)
+    first = (len(cursors) - 1) * SAVED_BRIEFS_PAGE_SIZE + 1
+    st.markdown(f"Showing **{first}–{first + len(briefs) - 1}** of **{total}** saved brief(s)")
     st.markdown("<br>", unsafe_allow_html=True)
     
     for brief in briefs:
-        with st.expander(f"📄 {brief['title']} • {brief['created_at'][:10]}", expanded=False):
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.markdown(f"**Company:** `{brief['company']}`")
-                st.markdown(f"**Persona:** `{brief['persona']}`")
-                st.markdown(f"**Competitors:** `{', '.join(brief['competitors'])}`")
-                st.caption(f"Created: {brief['created_at']}")
-            
-            with col2:
-                if st.button("View", key=f"view_{brief['id']}", use_container_width=True):
-                    brief_content = get_brief_content(brief['id'], st.session_state.user_id)
-                    if brief_content:
-                        st.session_state.viewing_brief = brief_content
-                        st.session_state.viewing_brief_title = brief['title']
-                
-                if st.button("Delete", key=f"delete_{brief['id']}", use_container_width=True, type="secondary"):
-                    if delete_brief(brief['id'], st.session_state.user_id):
-                        st.rerun()
+        render_saved_brief(brief)
     
-    if "viewing_brief" in st.session_state and st.session_state.viewing_brief:
-        st.markdown("---")
-        st.markdown(f"### 📄 {st.session_state.viewing_brief_title}")
-        st.markdown(st.session_state.viewing_brief)
-        
-        st.download_button(
-            label="📥 Download Brief",
-            data=st.session_state.viewing_brief,
-            file_name=f"{st.session_state.viewing_brief_title.replace(' ', '-')}.md",
-            mime="text/markdown",
-            use_container_width=True
-        )
+    pcol1, pcol2, pcol3 = st.columns([1, 3, 1])
+    with pcol1:
+        if len(cursors) > 1 and st.button("← Newer", use_container_width=True, type="secondary"):
+            cursors.pop()
+            st.rerun()
+    with pcol2:
+        st.caption(f"Page {len(cursors)}")
+    with pcol3:
+        if next_cursor and st.button("Older →", use_container_width=True, type="secondary"):
+            cursors.append(next_cursor)
+            st.rerun()
+    
+    show_viewing_brief()
 
 
 def show_chat_page():
@@ -1095,6 +1219,12 @@ def show_chat_page():
             help="Use LLM for enhanced content"
         )
         
+        st.session_state.brief_data["stream"] = st.checkbox(
+            "Stream Output",
+            value=st.session_state.brief_data.get("stream", True),
+            help="Show brief sections as soon as each one is ready"
+        )
+        
         if st.session_state.brief_data["use_llm"]:
             st.session_state.brief_data["llm_provider"] = st.selectbox(
                 "LLM Provider",
@@ -1102,6 +1232,12 @@ def show_chat_page():
                 index=0 if st.session_state.brief_data["llm_provider"] == "openai" else 1
             )
             
+            st.session_state.brief_data["use_llm_cache"] = st.checkbox(
+                "Reuse Cached LLM Responses",
+                value=st.session_state.brief_data.get("use_llm_cache", True),
+                help="Skip the LLM call when the same prompt was answered recently"
+            )
+            
             if st.session_state.brief_data["llm_provider"] == "openai":
                 api_key = st.text_input(
                     "OpenAI API Key",
@@ -1129,7 +1265,9 @@ def show_chat_page():
                 "competitors": ["Unknown"],
                 "use_research": st.session_state.brief_data["use_research"],
                 "use_llm": st.session_state.brief_data["use_llm"],
-                "llm_provider": st.session_state.brief_data["llm_provider"]
+                "llm_provider": st.session_state.brief_data["llm_provider"],
+                "use_llm_cache": st.session_state.brief_data.get("use_llm_cache", True),
+                "stream": st.session_state.brief_data.get("stream", True)
             }
             st.session_state.brief_generated = False
             st.session_state.current_brief = None
@@ -1186,6 +1324,7 @@ def show_chat_page():
         needs_competitors = st.session_state.brief_data["competitors"] == ["Unknown"]
         
         # Determine response based on what we need
+        generate_now = False
         if needs_company:
             response = "I need a company name to generate the brief. Which company would you like me to research?"
         elif needs_persona:
@@ -1200,8 +1339,7 @@ def show_chat_page():
             if any(word in prompt_lower for word in ["skip", "none", "unknown", "no", "no competitors", "n/a"]):
                 # User wants to skip competitors - generate brief now
                 response = f"Got it! Generating account brief for **{st.session_state.brief_data['company']}** (Target: {st.session_state.brief_data['persona']})...\n\n"
-                brief_content = generate_brief_response()
-                response += brief_content
+                generate_now = True
             else:
                 # Ask about competitors
                 response = f"Perfect! I have:\n- **Company:** {st.session_state.brief_data['company']}\n- **Persona:** {st.session_state.brief_data['persona']}\n\n"
@@ -1213,12 +1351,20 @@ def show_chat_page():
             response += f"- **Persona:** {st.session_state.brief_data['persona']}\n"
             response += f"- **Competitors:** {', '.join(st.session_state.brief_data['competitors'])}\n\n"
             response += "🔍 Researching and generating your brief... This may take a moment.\n\n"
-            brief_content = generate_brief_response()
-            response += brief_content
+            generate_now = True
         
-        st.session_state.messages.append({"role": "assistant", "content": response})
         with st.chat_message("assistant"):
-            st.markdown(response)
+            if generate_now:
+                placeholder = st.empty()
+                placeholder.markdown(response)
+                response += generate_brief_response(placeholder, prefix=response)
+                placeholder.markdown(response)
+                timing = st.session_state.get("brief_timing")
+                if timing and timing["first_content"] is not None:
+                    st.caption(f"First content in {timing['first_content']:.1f}s · full brief in {timing['total']:.1f}s")
+            else:
+                st.markdown(response)
+        st.session_state.messages.append({"role": "assistant", "content": response})
     
     # Download and Save buttons
     if st.session_state.brief_generated and st.session_state.current_brief:
@@ -1242,7 +1388,8 @@ def show_chat_page():
                         company=st.session_state.brief_data["company"],
                         persona=st.session_state.brief_data["persona"],
                         competitors=st.session_state.brief_data["competitors"],
-                        brief_content=st.session_state.current_brief
+                        brief_content=st.session_state.current_brief,
+                        brief_inputs=st.session_state.current_brief_inputs
                     )
                     st.success("✅ Brief saved successfully!")
                 except Exception as e:
@@ -8,7 +8,10 @@ import re
 import sys
 from pathlib import Path
 
-from src.renderer import render_account_brief
+from src.brief_pipeline import run_account_brief_pipeline
+from src.brief_batch import DEFAULT_MANIFEST_PATH, load_batch_rows, print_progress, run_brief_batch
+from src.search_cache import CACHE_MODES, configure_search_cache
+from src.version_allocator import get_version_allocator
 
 
 def sanitize_filename(company: str) -> str:
@@ -32,7 +35,10 @@ def sanitize_filename(company: str) -> str:
 
 def get_next_version(company_dir: Path, company_name: str) -> int:
     """
-    Get the next version number for a company's account briefs.
+    Reserve the next version number for a company's account briefs.
+    
+    Versions come from the shared allocator, so concurrent runs never get
+    the same number; a directory's existing briefs seed its first allocation.
     
     Args:
         company_dir: Path to the company's directory
@@ -41,29 +47,7 @@ def get_next_version(company_dir: Path, company_name: str) -> int:
     Returns:
         Next version number (1 if no existing versions)
     """
-    if not company_dir.exists():
-        return 1
-    
-    # Find all existing version files
-    pattern = f"{company_name}-v*.md"
-    existing_files = list(company_dir.glob(pattern))
-    
-    if not existing_files:
-        return 1
-    
-    # Extract version numbers
-    versions = []
-    version_pattern = re.compile(rf"{re.escape(company_name)}-v(\d+)\.md")
-    
-    for file in existing_files:
-        match = version_pattern.match(file.name)
-        if match:
-            versions.append(int(match.group(1)))
-    
-    if not versions:
-        return 1
-    
-    return max(versions) + 1
+    return get_version_allocator().allocate(company_dir, company_name, "md")
 
 
 def get_output_path(company: str) -> Path:
@@ -95,8 +79,108 @@ def get_output_path(company: str) -> Path:
     return company_dir / filename
 
 
+def add_research_arguments(parser: argparse.ArgumentParser):
+    """Add research, LLM and cache options shared by single and batch runs."""
+    parser.add_argument(
+        "--no-research",
+        action="store_true",
+        help="Skip web research and use template placeholders only"
+    )
+    
+    parser.add_argument(
+        "--llm",
+        choices=["openai", "anthropic"],
+        default=None,
+        help="Use LLM to research persona names and enhance content (requires API key in OPENAI_API_KEY or ANTHROPIC_API_KEY env var)"
+    )
+    
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Call the LLM even if an identical prompt was answered recently"
+    )
+    
+    parser.add_argument(
+        "--search-cache",
+        choices=CACHE_MODES,
+        default=None,
+        help="Web search cache: on (default), off, or replay (cached results only, no network)"
+    )
+    
+    parser.add_argument(
+        "--search-cache-ttl",
+        type=float,
+        default=None,
+        help="Seconds cached search results stay fresh (default: 86400)"
+    )
+
+
+def batch_main(argv):
+    """Batch subcommand: render briefs for every row of a CSV/JSONL file."""
+    parser = argparse.ArgumentParser(
+        prog="main.py batch",
+        description="Generate account briefs for many accounts in one run",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Input rows need company and persona; competitors is optional (comma or
+semicolon separated in CSV, a list or string in JSONL).
+
+Examples:
+  python main.py batch accounts.csv --workers 8
+  python main.py batch accounts.jsonl --llm openai --manifest outputs/q3_batch.jsonl
+        """
+    )
+    
+    parser.add_argument("input", type=str, help="CSV or JSONL file of accounts")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Briefs rendered at once (default: 4)")
+    parser.add_argument(
+        "--manifest", "-m",
+        type=str,
+        default=str(DEFAULT_MANIFEST_PATH),
+        help="JSONL manifest of results; rerunning with it skips finished rows"
+    )
+    add_research_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    
+    try:
+        if args.search_cache or args.search_cache_ttl is not None:
+            configure_search_cache(mode=args.search_cache, ttl_seconds=args.search_cache_ttl)
+        
+        rows = load_batch_rows(Path(args.input))
+        stats = run_brief_batch(
+            rows,
+            output_path_for=get_output_path,
+            manifest_path=Path(args.manifest),
+            workers=args.workers,
+            use_research=not args.no_research,
+            use_llm=args.llm is not None,
+            llm_provider=args.llm or "openai",
+            use_llm_cache=not args.no_llm_cache,
+            progress=print_progress
+        )
+    except Exception as e:
+        print(f"Error running batch: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    print(
+        f"Batch complete: {stats['succeeded']} succeeded, {stats['failed']} failed, "
+        f"{stats['skipped']} already done in {stats['elapsed_seconds']:.1f}s "
+        f"({stats['briefs_per_minute']:.1f} briefs/min). Manifest: {args.manifest}",
+        file=sys.stderr
+    )
+    for error in stats["errors"]:
+        print(f"  - {error}", file=sys.stderr)
+    if stats["failed"]:
+        sys.exit(1)
+
+
 def main():
     """Main CLI entry point."""
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        batch_main(sys.argv[2:])
+        return
+    
     parser = argparse.ArgumentParser(
         description="Generate a structured markdown account brief",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -104,6 +188,7 @@ def main():
 Examples:
   python main.py --company "Acme Corp" --persona "CTO" --competitor "VendorX"
   python main.py -c "TechStart Inc" -p "VP Engineering" -co "CompetitorY"
+  python main.py batch accounts.csv --workers 8   (see: python main.py batch --help)
         """
     )
     
@@ -128,18 +213,7 @@ Examples:
         help="Competitor name(s), comma-separated for multiple (default: Unknown)"
     )
     
-    parser.add_argument(
-        "--no-research",
-        action="store_true",
-        help="Skip web research and use template placeholders only"
-    )
-    
-    parser.add_argument(
-        "--llm",
-        choices=["openai", "anthropic"],
-        default=None,
-        help="Use LLM to research persona names and enhance content (requires API key in OPENAI_API_KEY or ANTHROPIC_API_KEY env var)"
-    )
+    add_research_arguments(parser)
     
     args = parser.parse_args()
     
@@ -147,13 +221,17 @@ Examples:
     competitors = [c.strip() for c in args.competitor.split(",")] if args.competitor else ["Unknown"]
     
     try:
-        brief = render_account_brief(
+        if args.search_cache or args.search_cache_ttl is not None:
+            configure_search_cache(mode=args.search_cache, ttl_seconds=args.search_cache_ttl)
+        
+        brief, timings = run_account_brief_pipeline(
             company=args.company,
             persona=args.persona,
             competitors=competitors,
             use_research=not args.no_research,
             use_llm=args.llm is not None,
-            llm_provider=args.llm or "openai"
+            llm_provider=args.llm or "openai",
+            use_llm_cache=not args.no_llm_cache
         )
         
         # Get output path with versioning
@@ -163,6 +241,8 @@ Examples:
         output_file.write_text(brief, encoding='utf-8')
         
         print(f"Account brief saved to: {output_file}", file=sys.stderr)
+        stage_timings = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items())
+        print(f"Stage timings: {stage_timings}", file=sys.stderr)
         
     except Exception as e:
         print(f"Error generating account brief: {e}", file=sys.stderr)
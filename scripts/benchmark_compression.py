@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Size and read-latency benchmark for saved brief storage.
+
+First stores the briefs with the original schema (the users and
+saved_briefs tables only, no search index) as the baseline. Then fills a
+scratch database with plain-text briefs (as saved before compression),
+measures file size and get_brief_content latency, runs the
+compress_saved_briefs migration plus VACUUM, then measures again. Finally
+saves the same briefs as inputs only (BRIEF_STORAGE=inputs) into a third
+database. Sizes are whole database files, search index included, compared
+with the baseline. Every brief and a search round-trip are checked unchanged.
+
+    python scripts/benchmark_compression.py --briefs 20000
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmark_database import LEGACY_SCHEMA  # noqa: E402
+from src import database  # noqa: E402
+from src.renderer import brief_inputs, render_brief_inputs  # noqa: E402
+
+PERSONAS = ["CTO", "VP Engineering", "Head of Engineering", "Platform Lead", "Developer Experience Lead"]
+COMPETITORS = ["GitHub Copilot", "Windsurf", "Tabnine", "Codeium", "Unknown"]
+NOTE_WORDS = (
+    "kubernetes migration monorepo latency onboarding compliance soc2 budget renewal pilot security review "
+    "terraform golang rust python java typescript incident backlog velocity headcount reorg procurement"
+).split()
+
+
+def generate(count: int) -> list:
+    """Brief inputs with per-account web research (as research_company returns it), and their rendered Markdown."""
+    random.seed(7)
+    briefs = []
+    for i in range(count):
+        company = f"Company{i} {random.choice(['Labs', 'Inc', 'Systems', 'AI', 'Cloud'])}"
+        results = {
+            key: [
+                {"title": f"{company} {key}", "url": f"https://example.com/{i}/{key}/{n}",
+                 "body": " ".join(random.choices(NOTE_WORDS, k=25))}
+                for n in range(count_)
+            ]
+            for key, count_ in (("recent_news", 5), ("funding_info", 3), ("description", 3))
+        }
+        research = {**results, "hiring_trends": None,
+                    "all_snippets": [r["body"] for key in results for r in results[key]]}
+        inputs = brief_inputs(company, random.choice(PERSONAS), random.sample(COMPETITORS, 2),
+                              "2024-01-01 00:00:00", research_data=research)
+        briefs.append((inputs, render_brief_inputs(inputs)))
+    return briefs
+
+
+def build_baseline(briefs: list, db_path: Path) -> tuple:
+    """Store briefs with the original schema; return its size and p50/p95 read latency."""
+    conn = sqlite3.connect(str(db_path))
+    for statement in LEGACY_SCHEMA:
+        conn.execute(statement)
+    with conn:
+        conn.executemany(
+            "INSERT INTO saved_briefs (user_id, title, company, persona, competitors, brief_content) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(1, f"{inputs['company']} - {inputs['persona']}", inputs["company"], inputs["persona"], "[]", brief)
+             for inputs, brief in briefs]
+        )
+    conn.execute("VACUUM")
+    timings = []
+    for brief_id in random.choices(range(1, len(briefs) + 1), k=2000):
+        t = time.perf_counter()
+        conn.execute("SELECT brief_content FROM saved_briefs WHERE id = ? AND user_id = 1", (brief_id,)).fetchone()
+        timings.append((time.perf_counter() - t) * 1e6)
+    conn.close()
+    timings.sort()
+    return db_path.stat().st_size, (statistics.median(timings), timings[int(len(timings) * 0.95) - 1])
+
+
+def build_plain(briefs: list) -> None:
+    """Insert plain-text briefs the way save_brief stored them before compression, then index them."""
+    conn = database.get_db_connection()
+    with conn:
+        conn.executemany(
+            "INSERT INTO saved_briefs (user_id, title, company, persona, competitors, brief_content) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(1, f"{inputs['company']} - {inputs['persona']}", inputs["company"], inputs["persona"], "[]", brief)
+             for inputs, brief in briefs]
+        )
+    database.rebuild_search_index()
+
+
+def build_inputs(briefs: list) -> None:
+    """Save briefs through save_brief with their inputs, so only the inputs are stored."""
+    for inputs, brief in briefs:
+        database.save_brief(1, inputs["company"], inputs["persona"], inputs["competitors"], brief, inputs)
+
+
+def compact() -> int:
+    """Checkpoint and VACUUM, returning the database size in bytes."""
+    conn = database.get_db_connection()
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.execute("VACUUM")
+    return database.DB_PATH.stat().st_size
+
+
+def read_latency(ids: list) -> tuple:
+    """p50/p95 get_brief_content latency in microseconds."""
+    timings = []
+    for brief_id in ids:
+        t = time.perf_counter()
+        database.get_brief_content(brief_id, 1)
+        timings.append((time.perf_counter() - t) * 1e6)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1]
+
+
+def check(briefs: list) -> None:
+    """Every brief reads back unchanged and search finds rendered text."""
+    mismatched = sum(database.get_brief_content(i, 1) != brief for i, (_, brief) in enumerate(briefs, 1))
+    found = database.search_user_briefs(1, "Company42")
+    print(f"         round-trip: {mismatched} mismatched briefs; search 'Company42' -> {len(found)} hit(s)")
+
+
+def report(label: str, size: int, latency: tuple, baseline: int) -> None:
+    print(f"{label:<8} {size / 1e6:8.1f} MB ({baseline / size:4.1f}x smaller than baseline)   "
+          f"read p50 {latency[0]:6.1f} us  p95 {latency[1]:6.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compressed brief storage")
+    parser.add_argument("--briefs", type=int, default=20000, help="Briefs to store (default: 20000)")
+    parser.add_argument("--reads", type=int, default=5000, help="Timed reads per run (default: 5000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        briefs = generate(args.briefs)
+        ids = random.choices(range(1, args.briefs + 1), k=args.reads)
+
+        baseline, latency = build_baseline(briefs, Path(tmp) / "baseline.db")
+        report("baseline", baseline, latency, baseline)
+
+        database.DB_PATH = Path(tmp) / "briefs.db"
+        build_plain(briefs)
+        report("plain", compact(), read_latency(ids), baseline)
+
+        start = time.perf_counter()
+        stats = database.compress_saved_briefs()
+        elapsed = time.perf_counter() - start
+        report("zlib", compact(), read_latency(ids), baseline)
+        check(briefs)
+        database.close_db_connection()
+
+        database.DB_PATH = Path(tmp) / "inputs.db"
+        database.BRIEF_STORAGE = "inputs"
+        build_inputs(briefs)
+        report("inputs", compact(), read_latency(ids), baseline)
+        inputs_bytes = database.get_db_connection().execute(
+            "SELECT SUM(length(brief_inputs)) FROM saved_briefs"
+        ).fetchone()[0]
+        check(briefs)
+        database.close_db_connection()
+
+        print(
+            f"Migrated {stats['rows']:,} briefs in {elapsed:.1f}s. Brief storage: markdown "
+            f"{stats['bytes_before'] / 1e6:,.1f} MB, zlib {stats['bytes_after'] / 1e6:,.1f} MB "
+            f"({stats['bytes_before'] / max(stats['bytes_after'], 1):.1f}x), inputs {inputs_bytes / 1e6:,.1f} MB "
+            f"({stats['bytes_before'] / max(inputs_bytes, 1):.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
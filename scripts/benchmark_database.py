@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for src/database.py.
+
+Runs reader and writer threads against a scratch database for a fixed
+time and reports reads/s, writes/s and errors, first with the old
+per-call pattern (new connection + schema DDL, rollback journal), then
+with the pooled WAL connections.
+
+    python scripts/benchmark_database.py --readers 8 --writers 4 --seconds 5
+"""
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import database  # noqa: E402
+
+BRIEF = "# Account Brief\n\n" + "Lorem ipsum dolor sit amet. " * 150
+
+
+# Schema DDL as create_tables ran it on every call before pooling: just
+# the two tables, no indexes, search index or dictionary table
+LEGACY_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS saved_briefs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        company TEXT NOT NULL,
+        persona TEXT NOT NULL,
+        competitors TEXT,
+        brief_content TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(id)
+    )
+    """,
+]
+
+
+def legacy_connect() -> sqlite3.Connection:
+    """get_db_connection as it was: new connection, schema DDL and commit."""
+    conn = sqlite3.connect(str(database.DB_PATH))
+    conn.row_factory = sqlite3.Row
+    for statement in LEGACY_SCHEMA:
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+def legacy_save_brief(user_id: int) -> None:
+    """save_brief as it was: open, create tables, insert, commit, close."""
+    conn = legacy_connect()
+    conn.execute(
+        "INSERT INTO saved_briefs (user_id, title, company, persona, competitors, brief_content) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (user_id, "Acme - CTO", "Acme", "CTO", "[]", BRIEF)
+    )
+    conn.commit()
+    conn.close()
+
+
+def legacy_get_user_briefs(user_id: int) -> None:
+    """get_user_briefs as it was: open, create tables, select, close."""
+    conn = legacy_connect()
+    conn.execute(
+        "SELECT id, title, company, persona, competitors, created_at FROM saved_briefs "
+        "WHERE user_id = ? ORDER BY created_at DESC LIMIT 20",
+        (user_id,)
+    ).fetchall()
+    conn.close()
+
+
+def pooled_get_user_briefs(user_id: int) -> None:
+    database.get_db_connection().execute(
+        "SELECT id, title, company, persona, competitors, created_at FROM saved_briefs "
+        "WHERE user_id = ? ORDER BY created_at DESC LIMIT 20",
+        (user_id,)
+    ).fetchall()
+
+
+def pooled_save_brief(user_id: int) -> None:
+    database.save_brief(user_id, "Acme", "CTO", [], BRIEF)
+
+
+def run(label: str, read, write, readers: int, writers: int, seconds: float) -> None:
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    stop = time.perf_counter() + seconds
+
+    def worker(op, stat: str, user_id: int):
+        done = errors = 0
+        while time.perf_counter() < stop:
+            try:
+                op(user_id)
+                done += 1
+            except sqlite3.OperationalError:
+                errors += 1
+        with lock:
+            counts[stat] += done
+            counts["errors"] += errors
+        database.close_db_connection()
+
+    threads = [threading.Thread(target=worker, args=(read, "reads", i % 10 + 1)) for i in range(readers)]
+    threads += [threading.Thread(target=worker, args=(write, "writes", i % 10 + 1)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(
+        f"{label:<8} {counts['reads'] / seconds:>10,.0f} reads/s {counts['writes'] / seconds:>8,.0f} writes/s "
+        f"{counts['errors']:>6} errors"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent reads/writes on the briefs database")
+    parser.add_argument("--readers", type=int, default=8, help="Reader threads (default: 8)")
+    parser.add_argument("--writers", type=int, default=4, help="Writer threads (default: 4)")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration of each run (default: 5)")
+    args = parser.parse_args()
+
+    print(f"{args.readers} readers, {args.writers} writers, {args.seconds:.0f}s per run")
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_PATH = Path(tmp) / "legacy.db"
+        legacy_save_brief(1)
+        run("legacy", legacy_get_user_briefs, legacy_save_brief, args.readers, args.writers, args.seconds)
+
+        database.DB_PATH = Path(tmp) / "pooled.db"
+        pooled_save_brief(1)
+        run("pooled", pooled_get_user_briefs, pooled_save_brief, args.readers, args.writers, args.seconds)
+        database.close_db_connection()
+
+
+if __name__ == "__main__":
+    main()
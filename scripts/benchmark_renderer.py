@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Render throughput benchmark for assemble_account_brief.
+
+Renders a batch-run mix of accounts (many companies, a handful of personas
+and competitor sets) from already-gathered inputs, with no network, and
+reports briefs per second for template-only, web-research and LLM-enriched
+briefs.
+
+    python scripts/benchmark_renderer.py --briefs 50000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.renderer import assemble_account_brief  # noqa: E402
+
+PERSONAS = ["CTO", "VP Engineering", "Head of Engineering", "Platform Lead", "Developer Experience Lead"]
+COMPETITOR_SETS = [["GitHub Copilot"], ["GitHub Copilot", "Windsurf"], ["Tabnine", "Codeium", "Windsurf"]]
+RESEARCH = {"all_snippets": ["Raised a $40M Series B to expand the platform team", "Announces new product launch"]}
+LLM_DATA = {
+    "persona_name": "Jordan Lee",
+    "company_description": "Developer platform for regulated industries",
+    "company_employees": "800",
+    "company_funding": "$40M Series B",
+    "company_headquarters": "Austin, TX",
+}
+EMAILS = {
+    "email1_subject": "Platform velocity", "email1_body": "Hi Jordan, ...",
+    "email2_body": "Following up ...", "email3_body": "Last note ...", "linkedin_message": "Hi Jordan ...",
+}
+
+CASES = {
+    "template": {},
+    "research": {"research_data": RESEARCH},
+    "llm": {"research_data": RESEARCH, "llm_data": LLM_DATA, "email_sequences": EMAILS, "use_llm": True},
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark account brief rendering throughput")
+    parser.add_argument("--briefs", type=int, default=50000, help="Briefs rendered per case (default: 50000)")
+    args = parser.parse_args()
+
+    random.seed(7)
+    accounts = [
+        (f"Company{i}", random.choice(PERSONAS), random.choice(COMPETITOR_SETS))
+        for i in range(args.briefs)
+    ]
+
+    for name, kwargs in CASES.items():
+        start = time.perf_counter()
+        for company, persona, competitors in accounts:
+            assemble_account_brief(company, persona, competitors, "2024-01-01 00:00:00", **kwargs)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<10} {args.briefs / elapsed:>10,.0f} briefs/s  {elapsed / args.briefs * 1e6:6.1f} us/brief")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Search latency benchmark for saved briefs (SQLite FTS5).
+
+Fills a scratch database with rendered briefs spread across users, then
+times search_user_briefs for rare, common and prefix queries and reports
+p50/p95/max latency against the 50 ms budget.
+
+    python scripts/benchmark_search.py --briefs 100000 --users 50
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import database  # noqa: E402
+from src.renderer import assemble_account_brief  # noqa: E402
+
+PERSONAS = ["CTO", "VP Engineering", "Head of Engineering", "Platform Lead", "Developer Experience Lead"]
+COMPETITORS = ["GitHub Copilot", "Windsurf", "Tabnine", "Codeium", "Unknown"]
+NOTE_WORDS = (
+    "kubernetes migration monorepo latency onboarding compliance soc2 budget renewal pilot security review "
+    "terraform golang rust python java typescript incident backlog velocity headcount reorg procurement"
+).split()
+QUERIES = ["kubernetes migration", "windsurf", "engineering", "soc2 pilot", "cloud labs", "terra*", "Company42*"]
+BUDGET_MS = 50.0
+
+
+def build(count: int, users: int) -> None:
+    random.seed(7)
+    conn = database.get_db_connection()
+    rows = []
+    for i in range(count):
+        company = f"Company{i % 5000} {random.choice(['Labs', 'Inc', 'Systems', 'AI', 'Cloud'])}"
+        persona = random.choice(PERSONAS)
+        competitors = random.sample(COMPETITORS, 2)
+        brief = assemble_account_brief(company, persona, competitors, "2024-01-01 00:00:00", use_llm=False)
+        brief += "\n## Notes\n\n" + " ".join(random.choices(NOTE_WORDS, k=12)) + "\n"
+        rows.append((i % users + 1, f"{company} - {persona}", company, persona, '["%s"]' % competitors[0], brief))
+        if len(rows) == 5000:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO saved_briefs (user_id, title, company, persona, competitors, brief_content) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+            rows = []
+    if rows:
+        with conn:
+            conn.executemany(
+                "INSERT INTO saved_briefs (user_id, title, company, persona, competitors, brief_content) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+    # Bulk inserts bypass save_brief, so index them in one pass
+    database.rebuild_search_index()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full-text search over saved briefs")
+    parser.add_argument("--briefs", type=int, default=100000, help="Briefs to index (default: 100000)")
+    parser.add_argument("--users", type=int, default=50, help="Users the briefs are spread across (default: 50)")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per query (default: 20)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_PATH = Path(tmp) / "search.db"
+        start = time.perf_counter()
+        build(args.briefs, args.users)
+        size_mb = database.DB_PATH.stat().st_size / 1e6
+        print(f"Indexed {args.briefs:,} briefs for {args.users} users in {time.perf_counter() - start:.1f}s "
+              f"({size_mb:,.0f} MB)")
+
+        worst = 0.0
+        for query in QUERIES:
+            timings = []
+            for run in range(args.repeat + 1):
+                t = time.perf_counter()
+                results = database.search_user_briefs(run % args.users + 1, query)
+                if run:  # first run warms the page cache
+                    timings.append((time.perf_counter() - t) * 1000)
+            timings.sort()
+            p95 = timings[int(len(timings) * 0.95) - 1]
+            worst = max(worst, timings[-1])
+            print(f"{query!r:<24} {len(results):>3} hits  p50 {statistics.median(timings):6.1f} ms  "
+                  f"p95 {p95:6.1f} ms  max {timings[-1]:6.1f} ms")
+
+        print(f"{'PASS' if worst < BUDGET_MS else 'FAIL'}: slowest query {worst:.1f} ms (budget {BUDGET_MS:.0f} ms)")
+        database.close_db_connection()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Keyword detection benchmark for SignalMatcher.
+
+Compares SignalMatcher.first_offsets (one C-level str.find per keyword)
+with single-pass detectors over the same keyword table: a longest-first
+alternation regex and a trie-shaped regex. Both resume one character after
+each match start, so overlapping keywords ("github copilot" / "copilot")
+are still found, and narrow to the keywords still missing after each hit.
+Every detector is checked against str.find before it is timed.
+
+    python scripts/benchmark_signal_matcher.py --words 50000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, FrozenSet
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.gong_client import _SIGNAL_MATCHER, PAIN_KEYWORDS, TOOLING_KEYWORDS  # noqa: E402
+
+FILLER = (
+    "the a we our team is looking at how to ship faster and reduce toil with better tooling across "
+    "services every sprint release review deploy on call customer roadmap quarter planning"
+).split()
+
+
+def alternation(keywords) -> str:
+    """Longest-first alternation of escaped keywords."""
+    return "|".join(re.escape(k) for k in sorted(keywords, key=lambda k: (-len(k), k)))
+
+
+def trie(keywords) -> str:
+    """Trie-shaped regex (shared prefixes factored out), longest branch first."""
+    root: Dict = {}
+    for keyword in keywords:
+        node = root
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        branches.sort(key=len, reverse=True)
+        if "" in node:
+            return f"(?:{'|'.join(branches)})?" if branches else ""
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    return build(root)
+
+
+class SinglePassDetector:
+    """First offset of each keyword from one left-to-right regex scan."""
+
+    def __init__(self, builder):
+        self.builder = builder
+        self.cache: Dict[FrozenSet[str], tuple] = {}
+
+    def compiled(self, keywords: FrozenSet[str]) -> tuple:
+        if keywords not in self.cache:
+            prefixes = {k: [o for o in keywords if o != k and k.startswith(o)] for k in keywords}
+            self.cache[keywords] = (re.compile(self.builder(keywords)), prefixes)
+        return self.cache[keywords]
+
+    def first_offsets(self, text: str, wanted) -> Dict[str, int]:
+        found: Dict[str, int] = {}
+        remaining = frozenset(wanted)
+        position = 0
+        while remaining:
+            regex, prefixes = self.compiled(remaining)
+            match = regex.search(text, position)
+            if match is None:
+                break
+            # Longest keyword starting here; shorter ones starting here are its prefixes
+            for hit in (match.group(), *prefixes[match.group()]):
+                found[hit] = match.start()
+            remaining = remaining.difference(found)
+            position = match.start() + 1
+        return found
+
+
+def transcript(words: int, sprinkle) -> str:
+    tokens = random.choices(FILLER, k=words)
+    for keyword in sprinkle:
+        tokens.insert(random.randrange(len(tokens)), keyword)
+    return " ".join(tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark keyword detection strategies")
+    parser.add_argument("--words", type=int, default=50000, help="Transcript length in words (default: 50000)")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per detector (default: 20)")
+    args = parser.parse_args()
+
+    random.seed(7)
+    wanted = TOOLING_KEYWORDS + PAIN_KEYWORDS
+    texts = {
+        "sparse": transcript(args.words, ["cursor", "slow"]),
+        "dense": transcript(args.words, ["issue", "problem", "github copilot", "copilot"] * 300),
+    }
+    detectors = {
+        "str.find (shipped)": _SIGNAL_MATCHER,
+        "alternation regex": SinglePassDetector(alternation),
+        "trie regex": SinglePassDetector(trie),
+    }
+
+    for label, text in texts.items():
+        expected = _SIGNAL_MATCHER.first_offsets(text, wanted)
+        print(f"{label} transcript ({len(text) / 1000:,.0f} KB, {len(expected)} of {len(wanted)} keywords present)")
+        for name, detector in detectors.items():
+            if detector.first_offsets(text, wanted) != expected:
+                raise SystemExit(f"{name} disagrees with str.find on the {label} transcript")
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                detector.first_offsets(text, wanted)
+            print(f"  {name:<20} {(time.perf_counter() - start) / args.repeat * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
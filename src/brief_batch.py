@@ -0,0 +1,229 @@
+"""
+Batch account brief generation - many briefs in one process.
+
+Reads (company, persona, competitors) rows from CSV or JSONL, renders briefs
+on a bounded thread pool that shares the process-wide search cache, LLM
+cache and clients, and records each result in a resumable JSONL manifest.
+"""
+
+import csv
+import json
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+from .brief_pipeline import run_account_brief_pipeline
+
+
+DEFAULT_MANIFEST_PATH = Path("outputs") / "batch_manifest.jsonl"
+
+
+def _split_competitors(value) -> List[str]:
+    """Parse competitors from a list or a comma/semicolon-separated string."""
+    if isinstance(value, list):
+        competitors = [str(c).strip() for c in value]
+    else:
+        competitors = [c.strip() for c in re.split(r"[;,]", value or "")]
+    competitors = [c for c in competitors if c]
+    return competitors or ["Unknown"]
+
+
+def load_batch_rows(input_path: Path) -> List[Dict]:
+    """
+    Read batch rows from a CSV (header: company, persona, competitors) or JSONL file.
+
+    Args:
+        input_path: .csv or .jsonl/.json file
+
+    Returns:
+        List of dicts with company, persona and competitors (list)
+
+    Raises:
+        ValueError: If a row has no company or persona
+    """
+    input_path = Path(input_path)
+    with open(input_path, 'r', encoding='utf-8') as f:
+        if input_path.suffix.lower() == ".csv":
+            records = list(csv.DictReader(f))
+        else:
+            records = [json.loads(line) for line in f if line.strip()]
+
+    rows = []
+    for line_number, record in enumerate(records, start=1):
+        record = {str(k).strip().lower(): v for k, v in record.items() if k}
+        company = (record.get("company") or "").strip()
+        persona = (record.get("persona") or "").strip()
+        if not company or not persona:
+            raise ValueError(f"Row {line_number} of {input_path} needs both company and persona")
+        rows.append({
+            "company": company,
+            "persona": persona,
+            "competitors": _split_competitors(record.get("competitors", record.get("competitor"))),
+        })
+    return rows
+
+
+def row_key(row: Dict, use_research: bool = True, use_llm: bool = False, llm_provider: str = "openai") -> str:
+    """
+    Stable identity of a batch row and the settings it was rendered with, used to resume.
+
+    A row that succeeded without research or LLM enrichment is not skipped
+    when the batch is rerun with them (and vice versa).
+    """
+    return json.dumps([
+        row["company"].lower(),
+        row["persona"].lower(),
+        [c.lower() for c in row["competitors"]],
+        {"research": use_research, "llm": llm_provider if use_llm else None},
+    ])
+
+
+def load_completed_keys(manifest_path: Path) -> Set[str]:
+    """
+    Read keys of rows that already completed successfully in a manifest.
+
+    Args:
+        manifest_path: Batch JSONL manifest
+
+    Returns:
+        Set of row keys
+    """
+    completed = set()
+    if not manifest_path.exists():
+        return completed
+
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("status") == "ok" and record.get("key"):
+                completed.add(record["key"])
+
+    return completed
+
+
+def run_brief_batch(
+    rows: List[Dict],
+    output_path_for: Callable[[str], Path],
+    manifest_path: Path = DEFAULT_MANIFEST_PATH,
+    workers: int = 4,
+    use_research: bool = True,
+    use_llm: bool = False,
+    llm_provider: str = "openai",
+    use_llm_cache: bool = True,
+    progress: Optional[Callable[[Dict, Dict], None]] = None
+) -> Dict:
+    """
+    Render briefs for many rows, skipping rows already done in the manifest
+    with the same research/LLM settings.
+
+    Args:
+        rows: Rows from load_batch_rows
+        output_path_for: Returns the next versioned output path for a company
+            (main.get_output_path)
+        manifest_path: JSONL manifest to append results to
+        workers: Briefs rendered at once
+        use_research: Whether to use web research to populate briefs
+        use_llm: Whether to use LLM enhancement
+        llm_provider: LLM provider ("openai" or "anthropic")
+        use_llm_cache: Whether to reuse cached LLM responses
+        progress: Optional callback receiving (stats, record) after each row
+
+    Returns:
+        Stats dictionary with total, skipped, succeeded, failed, errors
+        (first 20 as "company: message"), elapsed_seconds and briefs_per_minute
+    """
+    manifest_path = Path(manifest_path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def key(row: Dict) -> str:
+        return row_key(row, use_research=use_research, use_llm=use_llm, llm_provider=llm_provider)
+
+    completed = load_completed_keys(manifest_path)
+    unique_rows = list({key(row): row for row in rows}.values())
+    pending = [row for row in unique_rows if key(row) not in completed]
+
+    stats = {
+        "total": len(unique_rows),
+        "skipped": len(unique_rows) - len(pending),
+        "succeeded": 0,
+        "failed": 0,
+        "errors": [],
+        "elapsed_seconds": 0.0,
+        "briefs_per_minute": 0.0,
+    }
+    start_time = time.perf_counter()
+
+    def render(row: Dict) -> Dict:
+        row_start = time.perf_counter()
+        brief, timings = run_account_brief_pipeline(
+            row["company"], row["persona"], row["competitors"],
+            use_research=use_research,
+            use_llm=use_llm,
+            llm_provider=llm_provider,
+            use_llm_cache=use_llm_cache
+        )
+        # get_output_path reserves a unique version, so workers write in parallel
+        output_file = output_path_for(row["company"])
+        output_file.write_text(brief, encoding='utf-8')
+        return {"output": str(output_file), "seconds": round(time.perf_counter() - row_start, 2), "timings": timings}
+
+    with open(manifest_path, 'a', encoding='utf-8') as manifest, \
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="brief-batch") as executor:
+        futures = {executor.submit(render, row): row for row in pending}
+        for future in as_completed(futures):
+            row = futures[future]
+            record = {
+                "key": key(row),
+                "company": row["company"],
+                "persona": row["persona"],
+                "competitors": row["competitors"],
+                "use_research": use_research,
+                "use_llm": use_llm,
+                "llm_provider": llm_provider if use_llm else None,
+                "completed_at": datetime.now().isoformat(),
+            }
+            try:
+                record.update(future.result())
+                record["status"] = "ok"
+                stats["succeeded"] += 1
+            except Exception as e:
+                record["status"] = "error"
+                record["error"] = str(e)
+                stats["failed"] += 1
+                if len(stats["errors"]) < 20:
+                    stats["errors"].append(f"{row['company']}: {e}")
+
+            manifest.write(json.dumps(record, default=str) + "\n")
+            manifest.flush()
+
+            elapsed = time.perf_counter() - start_time
+            stats["elapsed_seconds"] = round(elapsed, 2)
+            processed = stats["succeeded"] + stats["failed"]
+            stats["briefs_per_minute"] = round(processed / elapsed * 60, 2) if elapsed > 0 else 0.0
+            if progress:
+                progress(dict(stats), record)
+
+    elapsed = time.perf_counter() - start_time
+    processed = stats["succeeded"] + stats["failed"]
+    stats["elapsed_seconds"] = round(elapsed, 2)
+    stats["briefs_per_minute"] = round(processed / elapsed * 60, 2) if elapsed > 0 else 0.0
+    return stats
+
+
+def print_progress(stats: Dict, record: Dict):
+    """Print one progress line per finished row to stderr."""
+    processed = stats["succeeded"] + stats["failed"]
+    pending = stats["total"] - stats["skipped"]
+    outcome = record.get("output") if record["status"] == "ok" else f"ERROR {record.get('error')}"
+    print(
+        f"[{processed}/{pending}] {record['company']} ({record['persona']}): {outcome} "
+        f"| {stats['briefs_per_minute']:.1f} briefs/min",
+        file=sys.stderr
+    )
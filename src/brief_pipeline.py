@@ -0,0 +1,330 @@
+"""
+Async account brief pipeline - runs independent research stages
+concurrently and reports per-stage timings.
+
+Stages and their dependencies:
+
+    company_context ──┐
+                      ├──> emails ──┐
+    persona ──────────┘             ├──> render
+    web_research ───────────────────┘
+
+render_account_brief runs the same stages one after another; the pipeline
+starts persona research alongside company research instead of waiting to
+see whether company research already named the persona, so the Markdown is
+the same while the wall-clock time is roughly the longest chain.
+"""
+
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .llm_researcher import (
+    apply_company_context,
+    apply_persona_research,
+    empty_enhanced_content,
+    generate_email_sequence_with_llm,
+    parse_email_sequence,
+    research_company_context_with_llm,
+    research_persona_with_llm,
+    stream_email_sequence_with_llm,
+)
+from .prompts import format_competitors_display
+from .renderer import (
+    assemble_account_brief,
+    brief_inputs,
+    discovery_questions_section,
+    email_company_info,
+    email_sequence_section,
+    footer_section,
+    objection_handling_section,
+    overview_section,
+    pain_points_section,
+    title_section,
+    why_now_section,
+)
+from .researcher import get_persona_pain_points, research_company
+
+
+# Stage name -> names of stages whose results it needs
+STAGE_DEPENDENCIES = {
+    "company_context": (),
+    "persona": (),
+    "web_research": (),
+    "emails": ("company_context", "persona"),
+}
+
+
+async def _run_stages(
+    stages: Dict[str, Tuple[Tuple[str, ...], Callable[[Dict[str, Any]], Any]]],
+    timings: Dict[str, float]
+) -> Dict[str, Any]:
+    """
+    Run blocking stage functions in threads, each as soon as its dependencies finish.
+
+    A stage that raises is logged and yields None, so the rest of the brief
+    still renders (as render_account_brief does when LLM research fails).
+
+    Args:
+        stages: Stage name -> (dependency names, function taking the results so far)
+        timings: Dictionary receiving each stage's duration in seconds
+
+    Returns:
+        Stage name -> result
+    """
+    results: Dict[str, Any] = {}
+    tasks: Dict[str, Awaitable] = {}
+
+    async def run(name: str):
+        dependencies, func = stages[name]
+        for dependency in dependencies:
+            await tasks[dependency]
+        start = time.perf_counter()
+        try:
+            results[name] = await asyncio.to_thread(func, results)
+        except Exception as e:
+            print(f"Warning: brief stage {name} failed: {e}", file=sys.stderr)
+            results[name] = None
+        finally:
+            timings[name] = round(time.perf_counter() - start, 3)
+
+    for name in stages:
+        tasks[name] = asyncio.ensure_future(run(name))
+    await asyncio.gather(*tasks.values())
+    return results
+
+
+async def render_account_brief_async(
+    company: str,
+    persona: str,
+    competitors: List[str],
+    use_research: bool = True,
+    use_llm: bool = False,
+    llm_provider: str = "openai",
+    use_llm_cache: bool = True
+) -> Tuple[str, Dict[str, float]]:
+    """
+    Render an account brief, running independent stages concurrently.
+
+    Args:
+        company: The company name
+        persona: The target persona
+        competitors: List of competitor names
+        use_research: Whether to use web research to populate the brief
+        use_llm: Whether to use LLM to research persona names and enhance content
+        llm_provider: LLM provider ("openai" or "anthropic")
+        use_llm_cache: Whether to reuse cached LLM responses for identical prompts
+
+    Returns:
+        Tuple of (markdown brief, stage name -> seconds, including "total")
+    """
+    pipeline_start = time.perf_counter()
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    timings: Dict[str, float] = {}
+
+    def enhanced_content(results: Dict[str, Any]) -> Dict[str, Any]:
+        enhanced = empty_enhanced_content()
+        apply_company_context(enhanced, results.get("company_context") or {}, persona)
+        # Persona research ran speculatively; it only fills in a missing name
+        apply_persona_research(enhanced, results.get("persona") or {})
+        return enhanced
+
+    def emails(results: Dict[str, Any]) -> Dict[str, str]:
+        llm_data = enhanced_content(results)
+        company_info = email_company_info(llm_data)
+        if not company_info:
+            return {}
+        return generate_email_sequence_with_llm(
+            company, persona, llm_data.get("persona_name") or persona,
+            company_info, competitors,
+            get_persona_pain_points(persona) if use_research else [],
+            provider=llm_provider,
+            use_cache=use_llm_cache
+        )
+
+    stages = {}
+    if use_llm:
+        stages["company_context"] = (
+            STAGE_DEPENDENCIES["company_context"],
+            lambda results: research_company_context_with_llm(company, llm_provider, use_llm_cache)
+        )
+        stages["persona"] = (
+            STAGE_DEPENDENCIES["persona"],
+            lambda results: research_persona_with_llm(company, persona, llm_provider, use_llm_cache)
+        )
+        stages["emails"] = (STAGE_DEPENDENCIES["emails"], emails)
+    if use_research:
+        stages["web_research"] = (
+            STAGE_DEPENDENCIES["web_research"],
+            lambda results: research_company(company)
+        )
+
+    results = await _run_stages(stages, timings)
+
+    render_start = time.perf_counter()
+    brief = assemble_account_brief(
+        company, persona, competitors, timestamp,
+        llm_data=enhanced_content(results) if use_llm else {},
+        email_sequences=results.get("emails") or {},
+        # research_company never returns None; a failed stage falls back to no snippets
+        research_data=(results.get("web_research") or {}) if use_research else None,
+        use_llm=use_llm
+    )
+    timings["render"] = round(time.perf_counter() - render_start, 3)
+    timings["total"] = round(time.perf_counter() - pipeline_start, 3)
+    return brief, timings
+
+
+def run_account_brief_pipeline(
+    company: str,
+    persona: str,
+    competitors: List[str],
+    use_research: bool = True,
+    use_llm: bool = False,
+    llm_provider: str = "openai",
+    use_llm_cache: bool = True
+) -> Tuple[str, Dict[str, float]]:
+    """
+    Synchronous wrapper around render_account_brief_async for CLI and
+    Streamlit callers (must not be called from a running event loop).
+
+    Args:
+        company: The company name
+        persona: The target persona
+        competitors: List of competitor names
+        use_research: Whether to use web research to populate the brief
+        use_llm: Whether to use LLM to research persona names and enhance content
+        llm_provider: LLM provider ("openai" or "anthropic")
+        use_llm_cache: Whether to reuse cached LLM responses for identical prompts
+
+    Returns:
+        Tuple of (markdown brief, stage name -> seconds, including "total")
+    """
+    return asyncio.run(render_account_brief_async(
+        company, persona, competitors,
+        use_research=use_research,
+        use_llm=use_llm,
+        llm_provider=llm_provider,
+        use_llm_cache=use_llm_cache
+    ))
+
+
+def stream_account_brief(
+    company: str,
+    persona: str,
+    competitors: List[str],
+    use_research: bool = True,
+    use_llm: bool = False,
+    llm_provider: str = "openai",
+    use_llm_cache: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """
+    Render an account brief progressively, section by section.
+
+    Research stages start concurrently as in render_account_brief_async.
+    Sections are emitted in document order as soon as their inputs are
+    ready, and the email sequence streams token by token while the LLM
+    writes it. The final update's markdown equals render_account_brief's
+    output.
+
+    Args:
+        company: The company name
+        persona: The target persona
+        competitors: List of competitor names
+        use_research: Whether to use web research to populate the brief
+        use_llm: Whether to use LLM to research persona names and enhance content
+        llm_provider: LLM provider ("openai" or "anthropic")
+        use_llm_cache: Whether to reuse cached LLM responses for identical prompts
+
+    Yields:
+        Dictionaries with "section" (name of the section just added, or
+        "email_draft" for streamed email text), "markdown" (the brief so
+        far), "elapsed" (seconds since start), "final" (True once, last)
+        and "inputs" (on the final update, the brief_inputs the brief can be
+        re-rendered from; None before)
+    """
+    start = time.perf_counter()
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    competitors_display = format_competitors_display(competitors)
+    parts: List[str] = []
+
+    def update(section: str, preview: str = "", final: bool = False,
+               inputs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {
+            "section": section,
+            "markdown": "".join(parts) + preview,
+            "elapsed": round(time.perf_counter() - start, 3),
+            "final": final,
+            "inputs": inputs,
+        }
+
+    def result(future) -> Any:
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"Warning: brief stage failed: {e}", file=sys.stderr)
+            return None
+
+    executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="brief-stage")
+    try:
+        company_future = persona_future = research_future = None
+        if use_llm:
+            company_future = executor.submit(research_company_context_with_llm, company, llm_provider, use_llm_cache)
+            persona_future = executor.submit(research_persona_with_llm, company, persona, llm_provider, use_llm_cache)
+        if use_research:
+            research_future = executor.submit(research_company, company)
+
+        parts.append(title_section(company))
+        yield update("title")
+
+        llm_data = {}
+        if use_llm:
+            llm_data = empty_enhanced_content()
+            apply_company_context(llm_data, result(company_future) or {}, persona)
+            apply_persona_research(llm_data, result(persona_future) or {})
+        parts.append(overview_section(company, persona, competitors_display, llm_data))
+        yield update("overview")
+
+        research_data = (result(research_future) or {}) if use_research else None
+        parts.append(why_now_section(company, research_data))
+        yield update("why_now")
+        parts.append(pain_points_section(persona, use_research))
+        parts.append(discovery_questions_section(persona, company, competitors, use_research))
+        yield update("discovery_questions")
+
+        email_sequences = {}
+        company_info = email_company_info(llm_data) if use_llm else None
+        if company_info:
+            greeting = llm_data.get("persona_name") or "[First Name]"
+            chunks = []
+            try:
+                for chunk in stream_email_sequence_with_llm(
+                    company, persona, llm_data.get("persona_name") or persona,
+                    company_info, competitors,
+                    get_persona_pain_points(persona) if use_research else [],
+                    provider=llm_provider,
+                    use_cache=use_llm_cache
+                ):
+                    chunks.append(chunk)
+                    yield update("email_draft", "## 3-Email Outbound Sequence\n\n" + "".join(chunks))
+                email_sequences = parse_email_sequence("".join(chunks), greeting)
+            except Exception as e:
+                print(f"Warning: LLM email generation failed: {e}", file=sys.stderr)
+        parts.append(email_sequence_section(company, persona, competitors_display,
+                                            llm_data.get("persona_name"), email_sequences, use_llm))
+        yield update("emails")
+
+        parts.append(objection_handling_section(persona, competitors_display))
+        parts.append(footer_section(timestamp))
+        yield update("objection_handling", final=True, inputs=brief_inputs(
+            company, persona, competitors, timestamp,
+            llm_data=llm_data,
+            email_sequences=email_sequences,
+            research_data=research_data,
+            use_llm=use_llm
+        ))
+    finally:
+        executor.shutdown(wait=False)
@@ -4,7 +4,7 @@ Business case generator - creates one-pager business case with ROI in appendix.
 
 from datetime import datetime
 from typing import Optional
-from .schemas import ROIInputs, ROIOutputs, ExtractedSignals, CRMContext
+from .schemas import ROIInputs, ROIOutputs, ROISimulationOutputs, ExtractedSignals, CRMContext
 
 
 def generate_business_case(
@@ -12,7 +12,8 @@ def generate_business_case(
     roi_inputs: ROIInputs,
     roi_outputs: ROIOutputs,
     gong_signals: Optional[ExtractedSignals] = None,
-    crm_context: Optional[CRMContext] = None
+    crm_context: Optional[CRMContext] = None,
+    roi_simulation: Optional[ROISimulationOutputs] = None
 ) -> str:
     """
     Generate a one-pager business case for Cursor adoption.
@@ -23,6 +24,7 @@ def generate_business_case(
         roi_outputs: ROI calculation outputs
         gong_signals: Optional Gong signals
         crm_context: Optional CRM context
+        roi_simulation: Optional Monte Carlo simulation results for the appendix
         
     Returns:
         Markdown-formatted business case
@@ -132,6 +134,25 @@ def generate_business_case(
         lines.append(f"| Payback Period | N/A (no savings) |")
     lines.append("")
     
+    if roi_simulation:
+        lines.append("## ROI Simulation (Monte Carlo)")
+        lines.append("")
+        lines.append(f"Based on {roi_simulation.samples:,} simulated scenarios. Net annual value is positive in {roi_simulation.probability_positive_value*100:.1f}% of scenarios.")
+        lines.append("")
+        # Low percentiles are the worst case for value but the best case for
+        # payback, so the two are reported separately rather than side by side
+        lines.append("| Net Annual Value Percentile (low = worst case) | Net Annual Value |")
+        lines.append("|------------------------------------------------|------------------|")
+        for label, net_value in roi_simulation.net_annual_value.items():
+            lines.append(f"| {label.upper()} | ${net_value:,.2f} |")
+        lines.append("")
+        lines.append("| Payback Percentile (low = fastest payback) | Payback Period |")
+        lines.append("|--------------------------------------------|----------------|")
+        for label, payback in roi_simulation.payback_months.items():
+            payback_display = f"{payback:.2f} months" if payback != float('inf') else "N/A (no savings)"
+            lines.append(f"| {label.upper()} | {payback_display} |")
+        lines.append("")
+    
     # Calculation Methodology
     lines.append("## Calculation Methodology")
     lines.append("")
@@ -0,0 +1,287 @@
+"""
+Caching layer for CRM account lookups - in-memory LRU with an optional
+SQLite tier, TTLs, stale-while-revalidate and hit/miss statistics.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from .crm_client import CRMClient
+from .schemas import CRMContext
+
+
+DEFAULT_CACHE_PATH = Path("data") / "crm_cache.db"
+
+
+def normalize_account_key(identifier: Optional[str]) -> str:
+    """
+    Normalize an account name, domain or URL into a cache key.
+
+    "https://www.Acme.com/about", "acme.com" and " ACME.COM " share a key;
+    names are lowercased with whitespace collapsed.
+
+    Args:
+        identifier: Account name, domain, URL or CRM ID
+
+    Returns:
+        Normalized key ("" for empty input)
+    """
+    key = (identifier or "").strip().lower()
+    key = re.sub(r"^[a-z]+://", "", key)
+    if "." in key and " " not in key:
+        key = key.split("/", 1)[0]
+        if key.startswith("www."):
+            key = key[4:]
+    return re.sub(r"\s+", " ", key).rstrip("/")
+
+
+class CachedCRMClient(CRMClient):
+    """
+    CRMClient wrapper that caches fetch_account_context results.
+
+    Entries are fresh for ttl_seconds. For a further stale_seconds the cached
+    context is still returned immediately while one background refresh
+    updates it; older entries are refetched synchronously. Each context is
+    stored under the identifier it was requested by and its CRM domain, so a
+    lookup by name warms a later lookup by domain.
+    """
+
+    def __init__(
+        self,
+        client: CRMClient,
+        ttl_seconds: float = 900.0,
+        stale_seconds: float = 3600.0,
+        max_entries: int = 256,
+        db_path: Optional[Union[str, Path]] = None
+    ):
+        """
+        Initialize cached CRM client.
+
+        Args:
+            client: CRM client to fetch from on a miss
+            ttl_seconds: Seconds an entry is served without refreshing
+            stale_seconds: Extra seconds a stale entry is served while it refreshes
+            max_entries: In-memory LRU capacity
+            db_path: Optional SQLite file for a cache shared across processes
+                and restarts (e.g. DEFAULT_CACHE_PATH)
+        """
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.db_path = Path(db_path) if db_path else None
+
+        self._memory: "OrderedDict[str, Tuple[CRMContext, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._refreshing = set()
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+            "evictions": 0,
+        }
+
+        if self.db_path:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS crm_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        domain_key TEXT,
+                        context TEXT NOT NULL,
+                        fetched_at REAL NOT NULL
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_crm_cache_domain ON crm_cache(domain_key)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection to the disk tier, committing and closing on exit."""
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def _get(self, key: str) -> Optional[Tuple[CRMContext, float]]:
+        """Look up an entry in memory, then on disk (promoting disk hits)."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+        if not self.db_path:
+            return None
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT context, fetched_at FROM crm_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        entry = (CRMContext(**json.loads(row[0])), row[1])
+        self._count("disk_hits")
+        self._put_memory(key, entry)
+        return entry
+
+    def _put_memory(self, key: str, entry: Tuple[CRMContext, float]):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _store(self, key: str, context: CRMContext):
+        """Cache a context under its lookup key and its domain."""
+        fetched_at = time.time()
+        domain_key = normalize_account_key(context.domain) or None
+        keys = {key, domain_key} - {None, ""}
+
+        for cache_key in keys:
+            self._put_memory(cache_key, (context, fetched_at))
+
+        if self.db_path:
+            payload = context.model_dump_json()
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO crm_cache (cache_key, domain_key, context, fetched_at) VALUES (?, ?, ?, ?)",
+                    [(cache_key, domain_key, payload, fetched_at) for cache_key in keys]
+                )
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            if key not in self._key_locks:
+                self._key_locks[key] = threading.Lock()
+            return self._key_locks[key]
+
+    def _fetch(self, key: str, account_identifier: str) -> CRMContext:
+        """Fetch from the wrapped client and cache non-empty results."""
+        context = self.client.fetch_account_context(account_identifier)
+        # Don't pin "not found" - the account may be created in the CRM shortly
+        if context.account_name or context.domain:
+            self._store(key, context)
+        return context
+
+    def _refresh_in_background(self, key: str, account_identifier: str):
+        """Start one background refresh per key."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._fetch(key, account_identifier)
+                self._count("refreshes")
+            except Exception:
+                # Keep serving the stale entry; the next lookup retries
+                self._count("refresh_errors")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def fetch_account_context(self, account_identifier: str) -> CRMContext:
+        """
+        Fetch account context, from cache when possible.
+
+        Args:
+            account_identifier: Account name, domain, or CRM ID
+
+        Returns:
+            CRMContext with account and contact information
+        """
+        key = normalize_account_key(account_identifier)
+        if not key:
+            return self.client.fetch_account_context(account_identifier)
+
+        entry = self._get(key)
+        if entry is not None:
+            context, fetched_at = entry
+            age = time.time() - fetched_at
+            if age < self.ttl_seconds:
+                self._count("hits")
+                return context
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._count("stale_hits")
+                self._refresh_in_background(key, account_identifier)
+                return context
+
+        # Concurrent misses for one account share a single fetch
+        with self._key_lock(key):
+            entry = self._get(key)
+            if entry is not None and time.time() - entry[1] < self.ttl_seconds:
+                self._count("hits")
+                return entry[0]
+            self._count("misses")
+            return self._fetch(key, account_identifier)
+
+    def invalidate(self, account_identifier: Optional[str] = None):
+        """
+        Drop cached entries.
+
+        Args:
+            account_identifier: Account to drop, including every key that maps
+                to the same CRM domain; None clears the whole cache
+        """
+        if account_identifier is None:
+            with self._lock:
+                self._memory.clear()
+            if self.db_path:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM crm_cache")
+            return
+
+        key = normalize_account_key(account_identifier)
+        entry = self._get(key)
+        domain_keys = {key}
+        if entry is not None and entry[0].domain:
+            domain_keys.add(normalize_account_key(entry[0].domain))
+
+        with self._lock:
+            for cache_key, (context, _) in list(self._memory.items()):
+                if cache_key in domain_keys or normalize_account_key(context.domain) in domain_keys:
+                    del self._memory[cache_key]
+
+        if self.db_path:
+            placeholders = ", ".join("?" for _ in domain_keys)
+            with self._connect() as conn:
+                conn.execute(
+                    f"DELETE FROM crm_cache WHERE cache_key IN ({placeholders}) OR domain_key IN ({placeholders})",
+                    list(domain_keys) * 2
+                )
+
+    def stats(self) -> Dict:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dictionary with hits, stale_hits, disk_hits, misses, refreshes,
+            refresh_errors, evictions, size (in-memory entries) and hit_rate
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._memory)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["stale_hits"]) / lookups, 3) if lookups else 0.0
+        return stats
@@ -5,9 +5,10 @@ CRM client interface and implementations for HubSpot and Salesforce.
 import os
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 from pathlib import Path
-import requests
+from .http_transport import HTTPTransport, get_transport
 from .schemas import CRMContext, CRMContact
 
 
@@ -31,21 +32,26 @@ class CRMClient(ABC):
 class HubSpotClient(CRMClient):
     """HubSpot CRM client."""
     
-    def __init__(self, private_app_token: Optional[str] = None, mock_mode: bool = False):
+    def __init__(self, private_app_token: Optional[str] = None, mock_mode: bool = False,
+                 transport: Optional[HTTPTransport] = None, base_url: Optional[str] = None):
         """
         Initialize HubSpot client.
         
         Args:
             private_app_token: HubSpot private app access token
             mock_mode: If True, use mock data instead of API calls
+            transport: HTTP transport (defaults to the shared "hubspot" connection pool)
+            base_url: API base URL (defaults to HUBSPOT_BASE_URL or api.hubapi.com;
+                point it at src.hubspot_stub for local runs)
         """
         self.mock_mode = mock_mode or os.getenv("CRM_MOCK_MODE", "false").lower() == "true"
+        self.transport = transport or get_transport("hubspot")
         self.private_app_token = private_app_token or os.getenv("HUBSPOT_PRIVATE_APP_TOKEN")
         
         if not self.mock_mode and not self.private_app_token:
             raise ValueError("HubSpot private app token required when not in mock mode")
         
-        self.base_url = "https://api.hubapi.com"
+        self.base_url = (base_url or os.getenv("HUBSPOT_BASE_URL", "https://api.hubapi.com")).rstrip("/")
         self.headers = {
             "Authorization": f"Bearer {self.private_app_token}",
             "Content-Type": "application/json"
@@ -71,14 +77,15 @@ class HubSpotClient(CRMClient):
         
         company_id = company.get("id")
         
-        # Fetch company properties
-        company_props = self._get_company_properties(company_id)
-        
-        # Fetch associated contacts
-        contacts = self._get_company_contacts(company_id)
-        
-        # Fetch associated deals/opportunities
-        deals = self._get_company_deals(company_id)
+        # Properties, contacts and deals are independent, so fetch them
+        # concurrently: two round trips (associations, batch read) after search
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            props_future = executor.submit(self._get_company_properties, company_id)
+            contacts_future = executor.submit(self._get_company_contacts, company_id)
+            deals_future = executor.submit(self._get_company_deals, company_id)
+            company_props = props_future.result()
+            contacts = contacts_future.result()
+            deals = deals_future.result()
         
         # Build context
         context = CRMContext(
@@ -100,7 +107,7 @@ class HubSpotClient(CRMClient):
         """Search for company by name or domain."""
         # Try by domain first
         if "." in identifier:
-            response = requests.get(
+            response = self.transport.get(
                 f"{self.base_url}/crm/v3/objects/companies",
                 headers=self.headers,
                 params={"properties": "name,domain", "filterGroups": [{"filters": [{"propertyName": "domain", "operator": "EQ", "value": identifier}]}]}
@@ -110,14 +117,15 @@ class HubSpotClient(CRMClient):
                 if results:
                     return results[0]
         
-        # Try by name
-        response = requests.get(
+        # Try by name (the search endpoint is POST-only; it is read-only, so safe to retry)
+        response = self.transport.post(
             f"{self.base_url}/crm/v3/objects/companies/search",
             headers=self.headers,
             json={
                 "query": identifier,
                 "properties": ["name", "domain", "industry", "numberofemployees"]
-            }
+            },
+            retry=True
         )
         if response.status_code == 200:
             results = response.json().get("results", [])
@@ -128,7 +136,7 @@ class HubSpotClient(CRMClient):
     
     def _get_company_properties(self, company_id: str) -> dict:
         """Get company properties."""
-        response = requests.get(
+        response = self.transport.get(
             f"{self.base_url}/crm/v3/objects/companies/{company_id}",
             headers=self.headers,
             params={"properties": "name,domain,industry,numberofemployees,hs_analytics_region,notes_last_contacted"}
@@ -137,55 +145,72 @@ class HubSpotClient(CRMClient):
             return response.json().get("properties", {})
         return {}
     
-    def _get_company_contacts(self, company_id: str) -> List[CRMContact]:
-        """Get contacts associated with company."""
-        response = requests.get(
-            f"{self.base_url}/crm/v3/objects/companies/{company_id}/associations/contacts",
+    def _batch_read(self, object_type: str, object_ids: List[str], properties: List[str]) -> List[dict]:
+        """
+        Read several objects in one request via the batch read endpoint.
+        
+        Args:
+            object_type: HubSpot object type, e.g. "contacts" or "deals"
+            object_ids: Object IDs to read
+            properties: Properties to return
+            
+        Returns:
+            Objects in the order of object_ids (missing IDs are skipped)
+        """
+        if not object_ids:
+            return []
+        
+        response = self.transport.post(
+            f"{self.base_url}/crm/v3/objects/{object_type}/batch/read",
+            headers=self.headers,
+            json={
+                "properties": properties,
+                "inputs": [{"id": object_id} for object_id in object_ids]
+            },
+            retry=True
+        )
+        # 207 Multi-Status: some IDs failed, the rest are still in results
+        if response.status_code not in (200, 207):
+            return []
+        
+        by_id = {str(r.get("id")): r for r in response.json().get("results", [])}
+        return [by_id[str(object_id)] for object_id in object_ids if str(object_id) in by_id]
+    
+    def _get_associated_ids(self, company_id: str, object_type: str) -> List[str]:
+        """Get IDs of objects of a type associated with a company."""
+        response = self.transport.get(
+            f"{self.base_url}/crm/v3/objects/companies/{company_id}/associations/{object_type}",
             headers=self.headers
         )
         if response.status_code != 200:
             return []
+        return [r["id"] for r in response.json().get("results", [])]
+    
+    def _get_company_contacts(self, company_id: str) -> List[CRMContact]:
+        """Get contacts associated with company."""
+        contact_ids = self._get_associated_ids(company_id, "contacts")
         
-        contact_ids = [r["id"] for r in response.json().get("results", [])]
         contacts = []
-        
-        for contact_id in contact_ids[:5]:  # Limit to 5 contacts
-            contact_response = requests.get(
-                f"{self.base_url}/crm/v3/objects/contacts/{contact_id}",
-                headers=self.headers,
-                params={"properties": "firstname,lastname,email,jobtitle"}
-            )
-            if contact_response.status_code == 200:
-                props = contact_response.json().get("properties", {})
-                contacts.append(CRMContact(
-                    name=f"{props.get('firstname', '')} {props.get('lastname', '')}".strip(),
-                    title=props.get("jobtitle"),
-                    email=props.get("email")
-                ))
+        for contact in self._batch_read("contacts", contact_ids[:5], ["firstname", "lastname", "email", "jobtitle"]):  # Limit to 5 contacts
+            props = contact.get("properties", {})
+            contacts.append(CRMContact(
+                name=f"{props.get('firstname', '')} {props.get('lastname', '')}".strip(),
+                title=props.get("jobtitle"),
+                email=props.get("email")
+            ))
         
         return contacts
     
     def _get_company_deals(self, company_id: str) -> Optional[dict]:
         """Get deals/opportunities associated with company."""
-        response = requests.get(
-            f"{self.base_url}/crm/v3/objects/companies/{company_id}/associations/deals",
-            headers=self.headers
-        )
-        if response.status_code != 200:
-            return None
-        
-        deal_ids = [r["id"] for r in response.json().get("results", [])]
+        deal_ids = self._get_associated_ids(company_id, "deals")
         if not deal_ids:
             return None
         
         # Get most recent deal
-        deal_response = requests.get(
-            f"{self.base_url}/crm/v3/objects/deals/{deal_ids[0]}",
-            headers=self.headers,
-            params={"properties": "dealstage,amount,closedate"}
-        )
-        if deal_response.status_code == 200:
-            return deal_response.json().get("properties", {})
+        deals = self._batch_read("deals", deal_ids[:1], ["dealstage", "amount", "closedate"])
+        if deals:
+            return deals[0].get("properties", {})
         
         return None
     
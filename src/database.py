@@ -2,25 +2,113 @@
 Database module for user authentication and saved briefs.
 """
 
+import argparse
 import sqlite3
 import hashlib
 import json
+import functools
+import html
+import os
+import re
+import sys
+import threading
+import time
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
 DB_PATH = Path("data/account_briefs.db")
 
+# Retries for writes that still hit "database is locked" after busy_timeout
+BUSY_RETRIES = 5
+BUSY_BACKOFF_SECONDS = 0.05
 
-def get_db_connection():
-    """Create database connection and ensure tables exist."""
-    DB_PATH.parent.mkdir(exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH))
+# Rank weights for title, company, persona, brief_content, owner
+SEARCH_WEIGHTS = (10.0, 5.0, 2.0, 1.0, 0.0)
+
+# "inputs": save the brief's variable inputs (brief_inputs) and re-render on
+# read when the caller provides them; "markdown": always save the Markdown
+BRIEF_STORAGE = os.getenv("BRIEF_STORAGE", "inputs")
+
+# Saved brief_content is one header byte (the brief_dictionaries id, 0 for
+# none) followed by a zlib stream primed with that dictionary. Rows saved
+# before compression are plain TEXT and are returned unchanged.
+COMPRESSION_LEVEL = 9
+DICTIONARY_SIZE = 32768
+
+_local = threading.local()
+_fts_enabled = True
+# contentless_delete (SQLite 3.43+) lets the index drop a brief by rowid;
+# older builds can't, so deleted briefs stay indexed until --reindex-search
+_fts_rowid_delete = True
+_schema_lock = threading.Lock()
+_schema_ready = set()
+_dictionary_lock = threading.Lock()
+_dictionaries: Dict[Tuple[Path, int], bytes] = {}
+_current_dictionary: Dict[Path, int] = {}
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
+    """Open a connection with WAL and the pragmas tuned for many short transactions."""
+    conn = sqlite3.connect(str(db_path), timeout=5.0)
     conn.row_factory = sqlite3.Row
-    create_tables(conn)
+    # WAL lets readers run alongside the single writer
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA cache_size=-8000")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
+def get_db_connection():
+    """
+    Get this thread's database connection.
+    
+    Connections are opened once per thread and reused; the schema is
+    created once per process. Callers must not close the connection.
+    """
+    db_path = Path(DB_PATH)
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    
+    conn = connections.get(db_path)
+    if conn is None:
+        db_path.parent.mkdir(exist_ok=True)
+        conn = _open_connection(db_path)
+        with _schema_lock:
+            if db_path not in _schema_ready:
+                create_tables(conn)
+                _load_dictionaries(conn, db_path)
+                _schema_ready.add(db_path)
+        connections[db_path] = conn
+    return conn
+
+
+def close_db_connection():
+    """Close this thread's database connections (e.g. before a worker thread exits)."""
+    for conn in getattr(_local, "connections", {}).values():
+        conn.close()
+    _local.connections = {}
+
+
+def retry_on_busy(func):
+    """Retry a database function with backoff while SQLite reports the database locked or busy."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(BUSY_RETRIES):
+            try:
+                return func(*args, **kwargs)
+            except sqlite3.OperationalError as e:
+                message = str(e).lower()
+                if attempt == BUSY_RETRIES - 1 or ("locked" not in message and "busy" not in message):
+                    raise
+                time.sleep(BUSY_BACKOFF_SECONDS * (2 ** attempt))
+    return wrapper
+
+
 def create_tables(conn: sqlite3.Connection):
     """Create database tables if they don't exist."""
     cursor = conn.cursor()
@@ -46,13 +134,293 @@ def create_tables(conn: sqlite3.Connection):
             competitors TEXT,
             brief_content TEXT NOT NULL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            brief_inputs BLOB,
+            template_version INTEGER,
             FOREIGN KEY (user_id) REFERENCES users(id)
         )
     """)
+    # Briefs saved as inputs (brief_content left empty) and the template version they were generated with
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(saved_briefs)")}
+    if "brief_inputs" not in columns:
+        cursor.execute("ALTER TABLE saved_briefs ADD COLUMN brief_inputs BLOB")
+    if "template_version" not in columns:
+        cursor.execute("ALTER TABLE saved_briefs ADD COLUMN template_version INTEGER")
+    
+    # Listing order is (created_at, id) newest first, per user; keyset pages seek on it
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_saved_briefs_user_created
+        ON saved_briefs(user_id, created_at, id)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_saved_briefs_user_company
+        ON saved_briefs(user_id, company COLLATE NOCASE, created_at, id)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_saved_briefs_user_persona
+        ON saved_briefs(user_id, persona COLLATE NOCASE, created_at, id)
+    """)
+    
+    # zlib dictionaries saved briefs are compressed against; never modified, only added
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS brief_dictionaries (
+            id INTEGER PRIMARY KEY,
+            zdict BLOB NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    if cursor.execute("SELECT 1 FROM brief_dictionaries LIMIT 1").fetchone() is None:
+        cursor.execute("INSERT INTO brief_dictionaries (id, zdict) VALUES (1, ?)", (train_brief_dictionary(),))
+    
+    create_search_index(conn)
     
     conn.commit()
 
 
+def train_brief_dictionary() -> bytes:
+    """
+    Build a zlib dictionary from the brief template.
+    
+    Briefs are mostly the same scaffolding (section headings, discovery
+    questions, email sequences, objection handling), so priming zlib with
+    a few rendered placeholder briefs lets each row store little more than
+    what is specific to its account.
+    """
+    from .renderer import assemble_account_brief
+    
+    samples = [
+        assemble_account_brief(company, persona, competitors, "", use_llm=False)
+        for company, persona, competitors in (
+            ("Example Labs", "VP Engineering", ["Tabnine"]),
+            ("Example Inc", "CTO", ["GitHub Copilot", "Windsurf"]),
+        )
+    ]
+    # zlib favours the end of the dictionary, so the most typical sample goes last
+    return "\n".join(samples).encode("utf-8")[-DICTIONARY_SIZE:]
+
+
+def _load_dictionaries(conn: sqlite3.Connection, db_path: Path):
+    """Cache the brief dictionaries stored in db_path."""
+    rows = conn.execute("SELECT id, zdict FROM brief_dictionaries").fetchall()
+    with _dictionary_lock:
+        for dict_id, zdict in rows:
+            _dictionaries[(db_path, dict_id)] = bytes(zdict)
+        _current_dictionary[db_path] = max((row[0] for row in rows), default=0)
+
+
+def _get_dictionary(db_path: Path, dict_id: int) -> bytes:
+    """Get a brief dictionary, reading it from db_path if it isn't cached yet."""
+    key = (db_path, dict_id)
+    if key not in _dictionaries:
+        # Callers don't pass their connection, so read with a separate one
+        conn = sqlite3.connect(str(db_path), timeout=5.0)
+        try:
+            _load_dictionaries(conn, db_path)
+        finally:
+            conn.close()
+    return _dictionaries[key]
+
+
+def _compress_brief(content: str, db_path: Path) -> bytes:
+    """Compress brief Markdown against the database's current dictionary."""
+    dict_id = _current_dictionary.get(db_path, 0)
+    if dict_id:
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=_get_dictionary(db_path, dict_id))
+    else:
+        compressor = zlib.compressobj(COMPRESSION_LEVEL)
+    return bytes([dict_id]) + compressor.compress(content.encode("utf-8")) + compressor.flush()
+
+
+def _brief_text(content, inputs, db_path: Path) -> str:
+    """Markdown of a saved brief: re-rendered from its inputs, or its decompressed content."""
+    if inputs is not None:
+        from .renderer import render_brief_inputs_json
+        
+        # save_brief stores the inputs as json.dumps(..., sort_keys=True)
+        return render_brief_inputs_json(_decompress_brief(inputs, db_path))
+    return _decompress_brief(content, db_path)
+
+
+def _decompress_brief(value, db_path: Path):
+    """Return the Markdown of a stored brief_content (compressed BLOB or legacy TEXT)."""
+    if not isinstance(value, bytes):
+        return value
+    dict_id = value[0]
+    if dict_id:
+        decompressor = zlib.decompressobj(zdict=_get_dictionary(db_path, dict_id))
+    else:
+        decompressor = zlib.decompressobj()
+    return (decompressor.decompress(value[1:]) + decompressor.flush()).decode("utf-8")
+
+
+def create_search_index(conn: sqlite3.Connection):
+    """
+    Create the FTS5 index over saved briefs and the trigger that keeps it in sync.
+    
+    The index is contentless: it holds only the tokens of each brief, written
+    by save_brief, so the Markdown is not stored a second time next to the
+    compressed brief_content. detail=column drops token positions (no phrase
+    queries; ranking counts matching columns rather than occurrences), which
+    roughly halves the index. Snippets are built from the decompressed text
+    of the returned page (see search_user_briefs). An "owner" column
+    ("u<user_id>", a token no brief text shares) lets searches intersect
+    with the owner's briefs inside FTS. Builds without FTS5 fall back to
+    searching titles only.
+    """
+    global _fts_enabled, _fts_rowid_delete
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x, content='', contentless_delete=1)")
+        cursor.execute("DROP TABLE temp.fts5_probe")
+        _fts_rowid_delete = True
+    except sqlite3.OperationalError:
+        _fts_rowid_delete = False
+    options = "content='', contentless_delete=1" if _fts_rowid_delete else "content=''"
+    
+    existing = cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'saved_briefs_fts'"
+    ).fetchone()
+    if existing and ("content=''" not in existing[0] or ("contentless_delete" in existing[0]) != _fts_rowid_delete):
+        # Older index that read or stored the brief text (or was built for a
+        # different SQLite); replace it with a contentless one
+        for trigger in ("insert", "delete", "update"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS saved_briefs_fts_{trigger}")
+        cursor.execute("DROP TABLE saved_briefs_fts")
+        existing = None
+    cursor.execute("DROP VIEW IF EXISTS saved_briefs_search")
+    try:
+        cursor.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS saved_briefs_fts USING fts5(
+                title, company, persona, brief_content, owner,
+                {options}, detail=column, tokenize='porter unicode61'
+            )
+        """)
+    except sqlite3.OperationalError:
+        _fts_enabled = False
+        return
+    _fts_enabled = True
+    
+    if _fts_rowid_delete:
+        # Brief text can only be decoded in Python, so save_brief indexes new briefs
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS saved_briefs_fts_delete AFTER DELETE ON saved_briefs BEGIN
+                DELETE FROM saved_briefs_fts WHERE rowid = old.id;
+            END
+        """)
+    
+    # Briefs saved as inputs are indexed as rendered with the template
+    # version recorded here
+    from .renderer import BRIEF_TEMPLATE_VERSION
+    
+    cursor.execute("CREATE TABLE IF NOT EXISTS search_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    if not existing:
+        # Index briefs saved before search existed (or before the index stored its text)
+        conn.commit()
+        count = _index_saved_briefs(conn)
+        if count:
+            print(f"Indexed {count} saved briefs for search", file=sys.stderr)
+        cursor.execute(
+            "INSERT OR REPLACE INTO search_meta (key, value) VALUES ('template_version', ?)",
+            (str(BRIEF_TEMPLATE_VERSION),)
+        )
+        return
+    
+    # Re-rendering every input-only brief is too slow for connection setup,
+    # so a template change is left to the maintenance CLI. Until then those
+    # briefs match on their old wording.
+    indexed = cursor.execute("SELECT value FROM search_meta WHERE key = 'template_version'").fetchone()
+    if indexed is None or int(indexed[0]) != BRIEF_TEMPLATE_VERSION:
+        if cursor.execute("SELECT 1 FROM saved_briefs WHERE brief_inputs IS NOT NULL LIMIT 1").fetchone():
+            print(
+                f"Warning: search index was built with brief template version {indexed[0] if indexed else 'unknown'} "
+                f"(current: {BRIEF_TEMPLATE_VERSION}); run python -m src.database --reindex-search",
+                file=sys.stderr
+            )
+        else:
+            cursor.execute(
+                "INSERT OR REPLACE INTO search_meta (key, value) VALUES ('template_version', ?)",
+                (str(BRIEF_TEMPLATE_VERSION),)
+            )
+
+
+def rebuild_search_index() -> int:
+    """
+    Re-index every saved brief for search, e.g. after rows were inserted
+    outside save_brief or the brief templates changed.
+    
+    Returns:
+        Number of briefs indexed
+    """
+    from .renderer import BRIEF_TEMPLATE_VERSION
+    
+    conn = get_db_connection()
+    if not _fts_enabled:
+        return 0
+    count = _index_saved_briefs(conn)
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO search_meta (key, value) VALUES ('template_version', ?)",
+            (str(BRIEF_TEMPLATE_VERSION),)
+        )
+    return count
+
+
+def _index_saved_briefs(conn: sqlite3.Connection, batch_size: int = 500) -> int:
+    """
+    (Re)write every saved brief's search index entry from its stored content.
+    
+    With contentless_delete each batch of ids is replaced in its own
+    transaction, so the index stays complete and writers aren't blocked for
+    the whole run. Otherwise the index is cleared first and refilled.
+    
+    Returns:
+        Number of briefs indexed
+    """
+    db_path = Path(DB_PATH)
+    count = 0
+    last_id = 0
+    
+    if not _fts_rowid_delete:
+        with conn:
+            conn.execute("INSERT INTO saved_briefs_fts (saved_briefs_fts) VALUES ('delete-all')")
+    
+    while True:
+        rows = conn.execute("""
+            SELECT id, user_id, title, company, persona, brief_content, brief_inputs FROM saved_briefs
+            WHERE id > ?
+            ORDER BY id
+            LIMIT ?
+        """, (last_id, batch_size)).fetchall()
+        if not rows:
+            break
+        
+        entries = [
+            (row[0], row[2], row[3], row[4], _brief_text(row[5], row[6], db_path), f"u{row[1]}")
+            for row in rows
+        ]
+        retry_on_busy(_write_index_batch)(conn, last_id, rows[-1][0], entries)
+        
+        count += len(rows)
+        last_id = rows[-1][0]
+    
+    if _fts_rowid_delete:
+        # Entries past the last brief belong to rows deleted while unindexed
+        with conn:
+            conn.execute("DELETE FROM saved_briefs_fts WHERE rowid > ?", (last_id,))
+    return count
+
+
+def _write_index_batch(conn: sqlite3.Connection, first_id: int, last_id: int, entries: List[tuple]):
+    with conn:
+        if _fts_rowid_delete:
+            conn.execute("DELETE FROM saved_briefs_fts WHERE rowid > ? AND rowid <= ?", (first_id, last_id))
+        conn.executemany(
+            "INSERT INTO saved_briefs_fts (rowid, title, company, persona, brief_content, owner) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            entries
+        )
+
+
 def hash_password(password: str) -> str:
     """Hash a password using SHA256 (simple, for demo - use bcrypt in production)."""
     return hashlib.sha256(password.encode()).hexdigest()
@@ -63,6 +431,7 @@ def verify_password(password: str, password_hash: str) -> bool:
     return hash_password(password) == password_hash
 
 
+@retry_on_busy
 def create_user(username: str, password: str) -> bool:
     """
     Create a new user.
@@ -71,23 +440,21 @@ def create_user(username: str, password: str) -> bool:
         True if user was created, False if username already exists
     """
     conn = get_db_connection()
-    cursor = conn.cursor()
     
     try:
         password_hash = hash_password(password)
-        cursor.execute(
-            "INSERT INTO users (username, password_hash) VALUES (?, ?)",
-            (username, password_hash)
-        )
-        conn.commit()
+        with conn:
+            conn.execute(
+                "INSERT INTO users (username, password_hash) VALUES (?, ?)",
+                (username, password_hash)
+            )
         return True
     except sqlite3.IntegrityError:
         # Username already exists
         return False
-    finally:
-        conn.close()
 
 
+@retry_on_busy
 def authenticate_user(username: str, password: str) -> Optional[int]:
     """
     Authenticate a user.
@@ -96,59 +463,76 @@ def authenticate_user(username: str, password: str) -> Optional[int]:
         User ID if authentication successful, None otherwise
     """
     conn = get_db_connection()
-    cursor = conn.cursor()
     
-    cursor.execute(
+    user = conn.execute(
         "SELECT id, password_hash FROM users WHERE username = ?",
         (username,)
-    )
-    user = cursor.fetchone()
-    conn.close()
+    ).fetchone()
     
     if user and verify_password(password, user["password_hash"]):
         return user["id"]
     return None
 
 
-def save_brief(user_id: int, company: str, persona: str, competitors: List[str], brief_content: str) -> int:
+@retry_on_busy
+def save_brief(user_id: int, company: str, persona: str, competitors: List[str], brief_content: str,
+               brief_inputs: Optional[Dict] = None) -> int:
     """
     Save a brief for a user.
     
+    With brief_inputs (from renderer.brief_inputs) and BRIEF_STORAGE "inputs",
+    only the inputs are stored and get_brief_content re-renders the brief.
+    Otherwise, or if the inputs don't re-render to exactly brief_content,
+    the Markdown is stored compressed.
+    
     Returns:
         The ID of the saved brief
     """
     conn = get_db_connection()
-    cursor = conn.cursor()
     
     title = f"{company} - {persona}"
     competitors_str = json.dumps(competitors)
+    db_path = Path(DB_PATH)
+    inputs = template_version = None
+    if BRIEF_STORAGE == "inputs" and brief_inputs:
+        from .renderer import render_brief_inputs_json
+        
+        inputs_json = json.dumps(brief_inputs, sort_keys=True, default=str)
+        if render_brief_inputs_json(inputs_json) == brief_content:
+            inputs = _compress_brief(inputs_json, db_path)
+            template_version = brief_inputs.get("template_version")
+    content = _compress_brief(brief_content, db_path) if inputs is None else ""
     
-    cursor.execute("""
-        INSERT INTO saved_briefs (user_id, title, company, persona, competitors, brief_content)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (user_id, title, company, persona, competitors_str, brief_content))
-    
-    brief_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    with conn:
+        cursor = conn.execute("""
+            INSERT INTO saved_briefs
+                (user_id, title, company, persona, competitors, brief_content, brief_inputs, template_version)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (user_id, title, company, persona, competitors_str, content, inputs, template_version))
+        if _fts_enabled:
+            conn.execute(
+                "INSERT INTO saved_briefs_fts (rowid, title, company, persona, brief_content, owner) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (cursor.lastrowid, title, company, persona, brief_content, f"u{user_id}")
+            )
     
-    return brief_id
+    return cursor.lastrowid
 
 
+@retry_on_busy
 def get_user_briefs(user_id: int) -> List[Dict]:
     """Get all saved briefs for a user."""
     conn = get_db_connection()
-    cursor = conn.cursor()
     
-    cursor.execute("""
+    rows = conn.execute("""
         SELECT id, title, company, persona, competitors, created_at
         FROM saved_briefs
         WHERE user_id = ?
-        ORDER BY created_at DESC
-    """, (user_id,))
+        ORDER BY created_at DESC, id DESC
+    """, (user_id,)).fetchall()
     
     briefs = []
-    for row in cursor.fetchall():
+    for row in rows:
         briefs.append({
             "id": row["id"],
             "title": row["title"],
@@ -158,40 +542,355 @@ def get_user_briefs(user_id: int) -> List[Dict]:
             "created_at": row["created_at"]
         })
     
-    conn.close()
     return briefs
 
 
+def _brief_filters(
+    user_id: int,
+    company: Optional[str],
+    persona: Optional[str],
+    created_from: Optional[str],
+    created_to: Optional[str]
+) -> Tuple[str, List]:
+    """Build the WHERE clause shared by list_user_briefs and count_user_briefs."""
+    where = "user_id = ?"
+    params: List = [user_id]
+    if company:
+        where += " AND company = ? COLLATE NOCASE"
+        params.append(company)
+    if persona:
+        where += " AND persona = ? COLLATE NOCASE"
+        params.append(persona)
+    if created_from:
+        where += " AND created_at >= ?"
+        params.append(created_from)
+    if created_to:
+        where += " AND created_at < ?"
+        params.append(created_to)
+    return where, params
+
+
+@retry_on_busy
+def list_user_briefs(
+    user_id: int,
+    limit: int = 20,
+    cursor: Optional[Tuple[str, int]] = None,
+    company: Optional[str] = None,
+    persona: Optional[str] = None,
+    created_from: Optional[str] = None,
+    created_to: Optional[str] = None
+) -> Tuple[List[Dict], Optional[Tuple[str, int]]]:
+    """
+    Get one page of a user's saved briefs, newest first.
+    
+    Pages are keyset-paginated on (created_at, id), so each page is an
+    index seek whatever its position.
+    
+    Args:
+        user_id: Owner of the briefs
+        limit: Briefs per page
+        cursor: next_cursor from the previous page (None for the first page)
+        company: Only briefs for this company (case-insensitive)
+        persona: Only briefs for this persona (case-insensitive)
+        created_from: Only briefs created at or after this date ("YYYY-MM-DD[ HH:MM:SS]")
+        created_to: Only briefs created before this date
+        
+    Returns:
+        Tuple of (briefs, next_cursor); next_cursor is None on the last page
+    """
+    conn = get_db_connection()
+    
+    where, params = _brief_filters(user_id, company, persona, created_from, created_to)
+    if cursor:
+        where += " AND (created_at, id) < (?, ?)"
+        params += [cursor[0], cursor[1]]
+    
+    rows = conn.execute(f"""
+        SELECT id, title, company, persona, competitors, created_at
+        FROM saved_briefs
+        WHERE {where}
+        ORDER BY created_at DESC, id DESC
+        LIMIT ?
+    """, params + [limit + 1]).fetchall()
+    
+    briefs = [{
+        "id": row["id"],
+        "title": row["title"],
+        "company": row["company"],
+        "persona": row["persona"],
+        "competitors": json.loads(row["competitors"]) if row["competitors"] else [],
+        "created_at": row["created_at"]
+    } for row in rows[:limit]]
+    
+    next_cursor = (briefs[-1]["created_at"], briefs[-1]["id"]) if len(rows) > limit else None
+    return briefs, next_cursor
+
+
+@retry_on_busy
+def count_user_briefs(
+    user_id: int,
+    company: Optional[str] = None,
+    persona: Optional[str] = None,
+    created_from: Optional[str] = None,
+    created_to: Optional[str] = None
+) -> int:
+    """Count a user's saved briefs matching the list_user_briefs filters."""
+    conn = get_db_connection()
+    where, params = _brief_filters(user_id, company, persona, created_from, created_to)
+    return conn.execute(f"SELECT COUNT(*) FROM saved_briefs WHERE {where}", params).fetchone()[0]
+
+
+def _fts_query(text: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 query where every word must match.
+    
+    Words are quoted, so FTS5 operators typed by the user are searched
+    literally; a trailing * keeps a word as a prefix search ("terra*").
+    Words split where the tokenizer splits (including "_"), since the index
+    keeps no positions for multi-token phrases.
+    """
+    terms = [f'"{word}"{star}' for word, star in re.findall(r"([^\W_]+)(\*?)", text)]
+    return " ".join(terms) if terms else None
+
+
+@retry_on_busy
+def search_user_briefs(user_id: int, query: str, limit: int = 20) -> List[Dict]:
+    """
+    Full-text search over a user's saved briefs, best matches first.
+    
+    Args:
+        user_id: Owner of the briefs
+        query: Free text; every word (or stem) must appear, "word*" matches a prefix
+        limit: Maximum results
+        
+    Returns:
+        List of brief metadata dicts (as list_user_briefs) with "snippet",
+        an HTML-escaped excerpt with matches wrapped in <mark>, and "rank"
+        (lower is better)
+    """
+    match = _fts_query(query)
+    if not match:
+        return []
+    
+    conn = get_db_connection()
+    
+    if not _fts_enabled:
+        like = f"%{query.strip()}%"
+        rows = conn.execute("""
+            SELECT id, title, company, persona, competitors, created_at
+            FROM saved_briefs
+            WHERE user_id = ? AND title LIKE ?
+            ORDER BY created_at DESC, id DESC
+            LIMIT ?
+        """, (user_id, like, limit)).fetchall()
+        ranks = {row["id"]: 0.0 for row in rows}
+        snippets = {}
+    else:
+        # Restrict to the owner inside FTS, so ranking only scores their briefs.
+        # The EXISTS skips briefs deleted without contentless_delete.
+        match = f'owner:"u{int(user_id)}" AND ({match})'
+        weights = ", ".join(str(w) for w in SEARCH_WEIGHTS)
+        
+        # Rank first, then build snippets for the returned page only
+        ranks = dict(conn.execute(f"""
+            SELECT rowid, bm25(saved_briefs_fts, {weights}) FROM saved_briefs_fts
+            WHERE saved_briefs_fts MATCH ? AND EXISTS (SELECT 1 FROM saved_briefs WHERE id = saved_briefs_fts.rowid)
+            ORDER BY 2
+            LIMIT ?
+        """, (match, limit)).fetchall())
+        if not ranks:
+            return []
+        
+        placeholders = ", ".join("?" for _ in ranks)
+        rows = conn.execute(f"""
+            SELECT id, user_id, title, company, persona, competitors, created_at, brief_content, brief_inputs
+            FROM saved_briefs
+            WHERE id IN ({placeholders})
+        """, tuple(ranks)).fetchall()
+        rows = sorted(rows, key=lambda row: ranks[row["id"]])
+        snippets = _snippets(conn, rows, match)
+    
+    results = []
+    for row in rows:
+        snippet = html.escape(" ".join(snippets.get(row["id"], "").split()))
+        results.append({
+            "id": row["id"],
+            "title": row["title"],
+            "company": row["company"],
+            "persona": row["persona"],
+            "competitors": json.loads(row["competitors"]) if row["competitors"] else [],
+            "created_at": row["created_at"],
+            "snippet": snippet.replace("\x02", "<mark>").replace("\x03", "</mark>"),
+            "rank": ranks[row["id"]]
+        })
+    return results
+
+
+def _snippets(conn: sqlite3.Connection, rows: List[sqlite3.Row], match: str) -> Dict[int, str]:
+    """
+    Highlighted excerpts of brief_content for a page of search results.
+    
+    The index stores no text, so the page's briefs are decoded and run
+    through a connection-private FTS5 table with the same tokenizer, which
+    highlights exactly what the index matched. Matches are wrapped in
+    char(2)/char(3).
+    """
+    db_path = Path(DB_PATH)
+    conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS temp.saved_briefs_snippets USING fts5(
+            title, company, persona, brief_content, owner,
+            tokenize='porter unicode61'
+        )
+    """)
+    with conn:
+        conn.executemany(
+            "INSERT INTO temp.saved_briefs_snippets (rowid, title, company, persona, brief_content, owner) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(row["id"], row["title"], row["company"], row["persona"],
+              _brief_text(row["brief_content"], row["brief_inputs"], db_path), f"u{row['user_id']}")
+             for row in rows]
+        )
+        snippets = dict(conn.execute("""
+            SELECT rowid, snippet(saved_briefs_snippets, 3, char(2), char(3), '…', 16)
+            FROM temp.saved_briefs_snippets
+            WHERE saved_briefs_snippets MATCH ?
+        """, (match,)).fetchall())
+        conn.execute("DELETE FROM temp.saved_briefs_snippets")
+    return snippets
+
+
+@retry_on_busy
 def get_brief_content(brief_id: int, user_id: int) -> Optional[str]:
-    """Get the full content of a saved brief."""
+    """Get the full content of a saved brief (re-rendered if it was saved as inputs)."""
     conn = get_db_connection()
-    cursor = conn.cursor()
     
-    cursor.execute("""
-        SELECT brief_content FROM saved_briefs
+    row = conn.execute("""
+        SELECT brief_content, brief_inputs FROM saved_briefs
         WHERE id = ? AND user_id = ?
-    """, (brief_id, user_id))
-    
-    row = cursor.fetchone()
-    conn.close()
+    """, (brief_id, user_id)).fetchone()
     
     if row:
-        return row["brief_content"]
+        return _brief_text(row["brief_content"], row["brief_inputs"], Path(DB_PATH))
     return None
 
 
+@retry_on_busy
 def delete_brief(brief_id: int, user_id: int) -> bool:
     """Delete a saved brief."""
     conn = get_db_connection()
-    cursor = conn.cursor()
     
-    cursor.execute("""
-        DELETE FROM saved_briefs
-        WHERE id = ? AND user_id = ?
-    """, (brief_id, user_id))
+    with conn:
+        cursor = conn.execute("""
+            DELETE FROM saved_briefs
+            WHERE id = ? AND user_id = ?
+        """, (brief_id, user_id))
     
-    deleted = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
+    return cursor.rowcount > 0
+
+
+def compress_saved_briefs(batch_size: int = 500) -> Dict[str, int]:
+    """
+    Compress briefs saved before compression existed.
+    
+    Rows are rewritten in batches of batch_size, each in its own
+    transaction, so the app can keep serving while this runs. Safe to
+    rerun; already-compressed rows are skipped.
     
-    return deleted
+    Returns:
+        Dictionary with rows compressed, bytes_before and bytes_after
+        (brief_content sizes of those rows)
+    """
+    conn = get_db_connection()
+    db_path = Path(DB_PATH)
+    stats = {"rows": 0, "bytes_before": 0, "bytes_after": 0}
+    last_id = 0
+    
+    while True:
+        rows = conn.execute("""
+            SELECT id, brief_content FROM saved_briefs
+            WHERE id > ? AND typeof(brief_content) = 'text' AND brief_inputs IS NULL
+            ORDER BY id
+            LIMIT ?
+        """, (last_id, batch_size)).fetchall()
+        if not rows:
+            break
+        
+        updates = [(_compress_brief(row["brief_content"], db_path), row["id"]) for row in rows]
+        retry_on_busy(_write_compressed)(conn, updates)
+        
+        stats["rows"] += len(rows)
+        stats["bytes_before"] += sum(len(row["brief_content"].encode("utf-8")) for row in rows)
+        stats["bytes_after"] += sum(len(blob) for blob, _ in updates)
+        last_id = rows[-1]["id"]
+    
+    return stats
+
+
+def _write_compressed(conn: sqlite3.Connection, updates: List[Tuple[bytes, int]]):
+    with conn:
+        conn.executemany("UPDATE saved_briefs SET brief_content = ? WHERE id = ?", updates)
+
+
+def main():
+    """CLI entry point for maintaining the briefs database."""
+    global DB_PATH
+    
+    parser = argparse.ArgumentParser(
+        description="Maintain the accounts and saved briefs database",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m src.database --compress
+  python -m src.database --reindex-search
+  python -m src.database --compress --db /data/ae-copilot/account_briefs.db
+        """
+    )
+    
+    parser.add_argument("--compress", action="store_true", help="Compress briefs saved before compression, then VACUUM")
+    parser.add_argument("--reindex-search", action="store_true",
+                        help="Re-index all briefs for search (e.g. after a brief template change)")
+    parser.add_argument("--db", type=str, default=str(DB_PATH), help="Database file (default: data/account_briefs.db)")
+    
+    args = parser.parse_args()
+    
+    if not args.compress and not args.reindex_search:
+        parser.error("Nothing to do; pass --compress and/or --reindex-search")
+    
+    DB_PATH = Path(args.db)
+    if not DB_PATH.exists():
+        print(f"Error: {DB_PATH} does not exist", file=sys.stderr)
+        sys.exit(1)
+    
+    if args.reindex_search:
+        try:
+            count = rebuild_search_index()
+        except Exception as e:
+            print(f"Error re-indexing briefs: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Re-indexed {count} briefs for search", file=sys.stderr)
+    
+    if not args.compress:
+        close_db_connection()
+        return
+    
+    try:
+        size_before = DB_PATH.stat().st_size
+        stats = compress_saved_briefs()
+        conn = get_db_connection()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+        close_db_connection()
+        size_after = DB_PATH.stat().st_size
+    except Exception as e:
+        print(f"Error compressing briefs: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    print(
+        f"Compressed {stats['rows']} briefs ({stats['bytes_before']:,} -> {stats['bytes_after']:,} bytes); "
+        f"{DB_PATH} is {size_before:,} -> {size_after:,} bytes",
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
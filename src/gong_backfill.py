@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Bulk Gong transcript enrichment - backfill signals for many calls.
+
+Fetches transcripts with bounded thread concurrency, extracts signals in a
+process pool, and appends one JSON line per call to a resumable output file.
+
+Usage:
+    python -m src.gong_backfill --from 2024-01-01 --to 2024-03-31
+    python -m src.gong_backfill --call-ids-file calls.txt --output outputs/q1_signals.jsonl
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from .gong_client import GongClient
+
+
+DEFAULT_OUTPUT_PATH = Path("outputs") / "gong_backfill.jsonl"
+
+_extractor: Optional[GongClient] = None
+
+
+def _extract_signals_worker(transcript_data: dict) -> dict:
+    """Extract signals in a worker process (extraction needs no credentials)."""
+    global _extractor
+    if _extractor is None:
+        _extractor = GongClient(mock_mode=True)
+    return _extractor.extract_signals(transcript_data).model_dump()
+
+
+def load_completed_call_ids(output_path: Path) -> Set[str]:
+    """
+    Read call IDs that already completed successfully in an output file.
+
+    Failed calls and a torn final line (from a crash mid-write) are ignored,
+    so those calls are retried on the next run.
+
+    Args:
+        output_path: Backfill JSONL output file
+
+    Returns:
+        Set of completed call IDs
+    """
+    completed = set()
+    if not output_path.exists():
+        return completed
+
+    with open(output_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("status") == "ok" and record.get("call_id"):
+                completed.add(record["call_id"])
+
+    return completed
+
+
+def run_backfill(
+    call_ids: Iterable[str],
+    output_path: Path = DEFAULT_OUTPUT_PATH,
+    client: Optional[GongClient] = None,
+    fetch_concurrency: int = 8,
+    extract_processes: Optional[int] = None,
+    progress: Optional[Callable[[Dict], None]] = None
+) -> Dict:
+    """
+    Fetch and extract signals for many calls, appending results as they finish.
+
+    Calls already recorded as "ok" in output_path are skipped, so an
+    interrupted backfill resumes where it stopped. If the extraction pool
+    dies (e.g. a worker is killed), the remaining extractions run in this
+    process instead.
+
+    Args:
+        call_ids: Gong call IDs to enrich
+        output_path: JSONL file to append results to
+        client: GongClient used for fetching (defaults to env configuration)
+        fetch_concurrency: Maximum transcripts fetched at once
+        extract_processes: Worker processes for extraction (defaults to CPU count)
+        progress: Optional callback receiving the stats dict after each call
+
+    Returns:
+        Stats dictionary with total, skipped, succeeded, failed,
+        elapsed_seconds and calls_per_second
+    """
+    client = client or GongClient()
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    completed = load_completed_call_ids(output_path)
+    unique_ids = list(dict.fromkeys(call_ids))
+    pending = iter([call_id for call_id in unique_ids if call_id not in completed])
+
+    stats = {
+        "total": len(unique_ids),
+        "skipped": sum(1 for call_id in unique_ids if call_id in completed),
+        "succeeded": 0,
+        "failed": 0,
+        "elapsed_seconds": 0.0,
+        "calls_per_second": 0.0,
+    }
+    start_time = time.perf_counter()
+
+    # Start a fresh line if the previous run crashed mid-write
+    if output_path.exists() and output_path.stat().st_size > 0:
+        with open(output_path, 'rb') as f:
+            f.seek(-1, 2)
+            needs_newline = f.read(1) != b"\n"
+    else:
+        needs_newline = False
+
+    # Cap queued extractions so fetching can't outrun extraction unboundedly
+    max_extract_backlog = fetch_concurrency * 2
+
+    with open(output_path, 'a', encoding='utf-8') as out, \
+            ThreadPoolExecutor(max_workers=fetch_concurrency) as fetchers, \
+            ProcessPoolExecutor(
+                max_workers=extract_processes,
+                # Spawn, not fork: workers start while fetch threads may hold locks
+                mp_context=multiprocessing.get_context("spawn")
+            ) as extractors:
+        if needs_newline:
+            out.write("\n")
+
+        fetching = {}
+        # future -> (call_id, transcript_data), kept to rerun if the pool dies
+        extracting = {}
+        pool_broken = False
+
+        def write_record(call_id: str, signals: Optional[dict] = None, error: Optional[str] = None):
+            record = {
+                "call_id": call_id,
+                "status": "error" if error else "ok",
+                "signals": signals,
+                "error": error,
+                "completed_at": datetime.now().isoformat(),
+            }
+            out.write(json.dumps(record, default=str) + "\n")
+            out.flush()
+
+            if error:
+                stats["failed"] += 1
+            else:
+                stats["succeeded"] += 1
+            elapsed = time.perf_counter() - start_time
+            stats["elapsed_seconds"] = round(elapsed, 2)
+            processed = stats["succeeded"] + stats["failed"]
+            stats["calls_per_second"] = round(processed / elapsed, 2) if elapsed > 0 else 0.0
+            if progress:
+                progress(dict(stats))
+
+        def extract(call_id: str, transcript_data: dict):
+            nonlocal pool_broken
+            if not pool_broken:
+                try:
+                    extracting[extractors.submit(_extract_signals_worker, transcript_data)] = (call_id, transcript_data)
+                    return
+                except BrokenProcessPool as e:
+                    pool_failed(e)
+            try:
+                signals = _extract_signals_worker(transcript_data)
+            except Exception as e:
+                write_record(call_id, error=f"extraction failed: {e}")
+                return
+            write_record(call_id, signals=signals)
+
+        def pool_failed(error: BrokenProcessPool):
+            nonlocal pool_broken
+            if not pool_broken:
+                pool_broken = True
+                print(f"Warning: extraction worker pool died ({error}); extracting remaining calls in-process",
+                      file=sys.stderr)
+
+        def fill_fetch_slots():
+            while len(fetching) < fetch_concurrency and len(extracting) < max_extract_backlog:
+                call_id = next(pending, None)
+                if call_id is None:
+                    return
+                fetching[fetchers.submit(client.fetch_transcript, call_id)] = call_id
+
+        fill_fetch_slots()
+        while fetching or extracting:
+            done, _ = wait(set(fetching) | set(extracting), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in fetching:
+                    call_id = fetching.pop(future)
+                    try:
+                        transcript_data = future.result()
+                    except Exception as e:
+                        write_record(call_id, error=f"fetch failed: {e}")
+                        continue
+                    extract(call_id, transcript_data)
+                else:
+                    call_id, transcript_data = extracting.pop(future)
+                    try:
+                        signals = future.result()
+                    except BrokenProcessPool as e:
+                        pool_failed(e)
+                        extract(call_id, transcript_data)
+                        continue
+                    except Exception as e:
+                        write_record(call_id, error=f"extraction failed: {e}")
+                        continue
+                    write_record(call_id, signals=signals)
+            fill_fetch_slots()
+
+    elapsed = time.perf_counter() - start_time
+    processed = stats["succeeded"] + stats["failed"]
+    stats["elapsed_seconds"] = round(elapsed, 2)
+    stats["calls_per_second"] = round(processed / elapsed, 2) if elapsed > 0 else 0.0
+    return stats
+
+
+def main():
+    """CLI entry point for Gong backfill."""
+    parser = argparse.ArgumentParser(
+        description="Backfill Gong transcript signals for many calls",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m src.gong_backfill --from 2024-01-01 --to 2024-03-31
+  python -m src.gong_backfill --call-ids-file calls.txt --fetch-concurrency 16
+        """
+    )
+
+    parser.add_argument("--call-ids-file", type=str, help="File with one Gong call ID or URL per line")
+    parser.add_argument("--from", dest="from_date", type=str, help="Start date (ISO 8601) to list calls from")
+    parser.add_argument("--to", dest="to_date", type=str, help="End date (ISO 8601) to list calls to")
+    parser.add_argument("--output", "-o", type=str, default=str(DEFAULT_OUTPUT_PATH), help="JSONL output file (resumable)")
+    parser.add_argument("--fetch-concurrency", type=int, default=8, help="Maximum concurrent transcript fetches (default: 8)")
+    parser.add_argument("--processes", type=int, default=None, help="Extraction worker processes (default: CPU count)")
+    parser.add_argument("--mock", action="store_true", help="Use mock transcripts instead of the Gong API")
+
+    args = parser.parse_args()
+
+    if not args.call_ids_file and not (args.from_date and args.to_date):
+        parser.error("Provide --call-ids-file or both --from and --to")
+
+    try:
+        client = GongClient(mock_mode=args.mock)
+
+        if args.call_ids_file:
+            lines = Path(args.call_ids_file).read_text(encoding='utf-8').splitlines()
+            call_ids = [client.extract_call_id(line) for line in lines if line.strip()]
+        else:
+            call_ids = client.list_calls(args.from_date, args.to_date)
+
+        def report(stats: Dict):
+            processed = stats["succeeded"] + stats["failed"]
+            if processed % 100 == 0:
+                print(
+                    f"{processed}/{stats['total'] - stats['skipped']} calls "
+                    f"({stats['calls_per_second']:.1f} calls/s, {stats['failed']} failed)",
+                    file=sys.stderr
+                )
+
+        stats = run_backfill(
+            call_ids,
+            output_path=Path(args.output),
+            client=client,
+            fetch_concurrency=args.fetch_concurrency,
+            extract_processes=args.processes,
+            progress=report
+        )
+
+        print(
+            f"Backfill complete: {stats['succeeded']} succeeded, {stats['failed']} failed, "
+            f"{stats['skipped']} already done, {stats['calls_per_second']:.1f} calls/s. "
+            f"Results in {args.output}",
+            file=sys.stderr
+        )
+
+    except Exception as e:
+        print(f"Error running backfill: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
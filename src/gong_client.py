@@ -5,17 +5,49 @@ Gong API client for fetching call transcripts and extracting signals.
 import os
 import json
 import re
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
-import requests
+from .http_transport import HTTPTransport, get_transport
 from .schemas import ExtractedSignals, EvidenceQuote
+from .signal_matcher import SignalMatcher
+from .transcript_index import TranscriptIndex
+
+
+TEAM_SIZE_PATTERNS = [
+    r'(\d+)\s+engineers?',
+    r'team\s+of\s+(\d+)',
+    r'(\d+)\s+people\s+on\s+the\s+engineering\s+team',
+]
+
+HOURS_PATTERNS = [
+    r'(\d+(?:\.\d+)?)\s+hours?\s+per\s+week',
+    r'spend\s+(\d+(?:\.\d+)?)\s+hours?',
+    r'(\d+(?:\.\d+)?)\s+hours?\s+saved',
+]
+
+TOOLING_KEYWORDS = ["github copilot", "copilot", "cursor", "windsurf", "cody", "tabnine", "codeium"]
+
+PAIN_KEYWORDS = ["slow", "frustrating", "inefficient", "bottleneck", "problem", "issue", "challenge"]
+
+# Checked in order; the first stage with a matching word wins
+BUYING_STAGE_KEYWORDS = [
+    ("evaluating", ["evaluating", "evaluation", "comparing", "demo"]),
+    ("exploring", ["exploring", "looking into", "researching"]),
+    ("procurement", ["procurement", "purchase", "buying", "contract"]),
+]
+
+_SIGNAL_MATCHER = SignalMatcher(
+    keywords=TOOLING_KEYWORDS + PAIN_KEYWORDS + [word for _, words in BUYING_STAGE_KEYWORDS for word in words],
+    patterns=TEAM_SIZE_PATTERNS + HOURS_PATTERNS,
+)
 
 
 class GongClient:
     """Client for interacting with Gong API."""
     
     def __init__(self, base_url: Optional[str] = None, access_key: Optional[str] = None, 
-                 access_secret: Optional[str] = None, mock_mode: bool = False):
+                 access_secret: Optional[str] = None, mock_mode: bool = False,
+                 transport: Optional[HTTPTransport] = None):
         """
         Initialize Gong client.
         
@@ -24,8 +56,10 @@ class GongClient:
             access_key: Gong access key
             access_secret: Gong access secret
             mock_mode: If True, use mock data instead of API calls
+            transport: HTTP transport (defaults to the shared "gong" connection pool)
         """
         self.mock_mode = mock_mode or os.getenv("GONG_MOCK_MODE", "false").lower() == "true"
+        self.transport = transport or get_transport("gong")
         self.base_url = base_url or os.getenv("GONG_BASE_URL", "https://api.gong.io")
         self.access_key = access_key or os.getenv("GONG_ACCESS_KEY")
         self.access_secret = access_secret or os.getenv("GONG_ACCESS_SECRET")
@@ -79,7 +113,7 @@ class GongClient:
         }
         
         # Fetch call details
-        response = requests.get(
+        response = self.transport.get(
             f"{self.base_url}/v2/calls/{call_id}",
             headers=headers
         )
@@ -87,7 +121,7 @@ class GongClient:
         call_data = response.json()
         
         # Fetch transcript
-        transcript_response = requests.get(
+        transcript_response = self.transport.get(
             f"{self.base_url}/v2/calls/{call_id}/transcript",
             headers=headers
         )
@@ -100,6 +134,44 @@ class GongClient:
             "transcript": transcript_data
         }
     
+    def list_calls(self, from_date: str, to_date: str) -> List[str]:
+        """
+        List call IDs in a date range, following pagination cursors.
+        
+        Args:
+            from_date: Start of range (ISO 8601 date or datetime)
+            to_date: End of range (ISO 8601 date or datetime)
+            
+        Returns:
+            List of call IDs
+        """
+        if self.mock_mode:
+            return [self._load_mock_transcript().get("call_id", "mock_call_123")]
+        
+        headers = {
+            "Authorization": f"Bearer {self._get_access_token()}",
+            "Content-Type": "application/json"
+        }
+        params = {"fromDateTime": from_date, "toDateTime": to_date}
+        call_ids = []
+        
+        while True:
+            response = self.transport.get(
+                f"{self.base_url}/v2/calls",
+                headers=headers,
+                params=params
+            )
+            response.raise_for_status()
+            data = response.json()
+            call_ids.extend(call["id"] for call in data.get("calls", []) if call.get("id"))
+            
+            cursor = data.get("records", {}).get("cursor")
+            if not cursor:
+                break
+            params = {**params, "cursor": cursor}
+        
+        return call_ids
+    
     def _get_access_token(self) -> str:
         """
         Get access token for Gong API.
@@ -139,148 +211,93 @@ class GongClient:
             }
         }
     
-    def extract_signals(self, transcript_data: dict) -> ExtractedSignals:
+    def extract_signals(self, transcript_data: dict, index: Optional[TranscriptIndex] = None) -> ExtractedSignals:
         """
         Extract structured signals from transcript.
         Uses simple pattern matching - in production, could use LLM for better extraction.
         
         Args:
             transcript_data: Transcript data from fetch_transcript
+            index: Optional prebuilt TranscriptIndex to share with other extractors
             
         Returns:
             ExtractedSignals with evidence
         """
-        transcript_text = ""
-        speakers = []
-        
-        # Extract transcript text and speakers
-        if "transcript" in transcript_data:
-            if isinstance(transcript_data["transcript"], dict):
-                transcript_text = transcript_data["transcript"].get("text", "")
-                speakers = transcript_data["transcript"].get("speakers", [])
-            elif isinstance(transcript_data["transcript"], str):
-                transcript_text = transcript_data["transcript"]
-        
-        # Combine all text
-        full_text = transcript_text.lower()
-        if speakers:
-            speaker_text = " ".join([s.get("text", "") for s in speakers])
-            full_text = (full_text + " " + speaker_text.lower()).strip()
+        if index is None:
+            index = TranscriptIndex.from_transcript_data(transcript_data)
+        full_text = index.full_text
         
         signals = ExtractedSignals()
         evidence = []
         
+        # Detect every signal once against the combined text
+        hits = _SIGNAL_MATCHER.first_offsets(full_text, TOOLING_KEYWORDS + PAIN_KEYWORDS)
+        tools_found = [tool for tool in TOOLING_KEYWORDS if tool in hits]
+        pains_found = [keyword for keyword in PAIN_KEYWORDS if keyword in hits]
+        
+        # Patterns are tried in priority order; the first one present wins
+        team_size_pattern = _SIGNAL_MATCHER.first_present(full_text, TEAM_SIZE_PATTERNS)
+        hours_pattern = _SIGNAL_MATCHER.first_present(full_text, HOURS_PATTERNS)
+        
+        # Resolve the owning speaker turn / sentence for every hit in one pass
+        quote_signals = tools_found + pains_found
+        quote_signals += [p for p in (team_size_pattern, hours_pattern) if p]
+        quotes = index.find_quotes(_SIGNAL_MATCHER, quote_signals)
+        
         # Extract team size
-        team_size_patterns = [
-            r'(\d+)\s+engineers?',
-            r'team\s+of\s+(\d+)',
-            r'(\d+)\s+people\s+on\s+the\s+engineering\s+team',
-        ]
-        for pattern in team_size_patterns:
-            match = re.search(pattern, full_text)
-            if match:
-                signals.team_size_engineering = int(match.group(1))
-                # Find quote with timestamp
-                quote = self._find_quote_for_pattern(pattern, speakers, transcript_text)
-                if quote:
-                    evidence.append(EvidenceQuote(
-                        field_name="team_size_engineering",
-                        quote=quote["text"],
-                        timestamp_seconds=quote.get("timestamp")
-                    ))
-                break
+        if team_size_pattern:
+            match = _SIGNAL_MATCHER.match_at(team_size_pattern, full_text)
+            signals.team_size_engineering = int(match.group(1))
+            quote = quotes.get(team_size_pattern)
+            if quote:
+                evidence.append(EvidenceQuote(
+                    field_name="team_size_engineering",
+                    quote=quote["text"],
+                    timestamp_seconds=quote.get("timestamp")
+                ))
         
         # Extract current tooling
-        tooling_keywords = ["github copilot", "copilot", "cursor", "windsurf", "cody", "tabnine", "codeium"]
-        for tool in tooling_keywords:
-            if tool in full_text:
-                signals.current_tooling.append(tool.title())
-                quote = self._find_quote_for_keyword(tool, speakers, transcript_text)
-                if quote:
-                    evidence.append(EvidenceQuote(
-                        field_name="current_tooling",
-                        quote=quote["text"],
-                        timestamp_seconds=quote.get("timestamp")
-                    ))
+        for tool in tools_found:
+            signals.current_tooling.append(tool.title())
+            quote = quotes.get(tool)
+            if quote:
+                evidence.append(EvidenceQuote(
+                    field_name="current_tooling",
+                    quote=quote["text"],
+                    timestamp_seconds=quote.get("timestamp")
+                ))
         
         # Extract hours saved (only if explicitly stated)
-        hours_patterns = [
-            r'(\d+(?:\.\d+)?)\s+hours?\s+per\s+week',
-            r'spend\s+(\d+(?:\.\d+)?)\s+hours?',
-            r'(\d+(?:\.\d+)?)\s+hours?\s+saved',
-        ]
-        for pattern in hours_patterns:
-            match = re.search(pattern, full_text)
-            if match:
-                signals.hours_saved_per_engineer_per_week = float(match.group(1))
-                quote = self._find_quote_for_pattern(pattern, speakers, transcript_text)
-                if quote:
-                    evidence.append(EvidenceQuote(
-                        field_name="hours_saved_per_engineer_per_week",
-                        quote=quote["text"],
-                        timestamp_seconds=quote.get("timestamp")
-                    ))
-                break
+        if hours_pattern:
+            match = _SIGNAL_MATCHER.match_at(hours_pattern, full_text)
+            signals.hours_saved_per_engineer_per_week = float(match.group(1))
+            quote = quotes.get(hours_pattern)
+            if quote:
+                evidence.append(EvidenceQuote(
+                    field_name="hours_saved_per_engineer_per_week",
+                    quote=quote["text"],
+                    timestamp_seconds=quote.get("timestamp")
+                ))
         
         # Extract pain points (simple keyword matching)
-        pain_keywords = ["slow", "frustrating", "inefficient", "bottleneck", "problem", "issue", "challenge"]
-        for keyword in pain_keywords:
-            if keyword in full_text:
-                # Find context around keyword
-                quote = self._find_quote_for_keyword(keyword, speakers, transcript_text)
-                if quote and quote["text"] not in [e.quote for e in evidence]:
-                    signals.pain_points.append(keyword)
-                    evidence.append(EvidenceQuote(
-                        field_name="pain_points",
-                        quote=quote["text"],
-                        timestamp_seconds=quote.get("timestamp")
-                    ))
+        for keyword in pains_found:
+            # Find context around keyword
+            quote = quotes.get(keyword)
+            if quote and quote["text"] not in [e.quote for e in evidence]:
+                signals.pain_points.append(keyword)
+                evidence.append(EvidenceQuote(
+                    field_name="pain_points",
+                    quote=quote["text"],
+                    timestamp_seconds=quote.get("timestamp")
+                ))
         
         # Extract buying stage
-        if any(word in full_text for word in ["evaluating", "evaluation", "comparing", "demo"]):
-            signals.buying_stage = "evaluating"
-        elif any(word in full_text for word in ["exploring", "looking into", "researching"]):
-            signals.buying_stage = "exploring"
-        elif any(word in full_text for word in ["procurement", "purchase", "buying", "contract"]):
-            signals.buying_stage = "procurement"
+        for stage, words in BUYING_STAGE_KEYWORDS:
+            if _SIGNAL_MATCHER.first_present(full_text, words):
+                signals.buying_stage = stage
+                break
         else:
             signals.buying_stage = "unaware"
         
         signals.evidence = evidence
         return signals
-    
-    def _find_quote_for_pattern(self, pattern: str, speakers: list, transcript_text: str) -> Optional[dict]:
-        """Find a quote containing the pattern."""
-        # Check speakers first
-        for speaker in speakers:
-            text = speaker.get("text", "").lower()
-            if re.search(pattern, text):
-                return speaker
-        
-        # Check transcript text
-        if transcript_text:
-            sentences = transcript_text.split('.')
-            for sentence in sentences:
-                if re.search(pattern, sentence.lower()):
-                    return {"text": sentence.strip(), "timestamp": None}
-        
-        return None
-    
-    def _find_quote_for_keyword(self, keyword: str, speakers: list, transcript_text: str) -> Optional[dict]:
-        """Find a quote containing the keyword."""
-        keyword_lower = keyword.lower()
-        
-        # Check speakers first
-        for speaker in speakers:
-            text = speaker.get("text", "").lower()
-            if keyword_lower in text:
-                return speaker
-        
-        # Check transcript text
-        if transcript_text:
-            sentences = transcript_text.split('.')
-            for sentence in sentences:
-                if keyword_lower in sentence.lower():
-                    return {"text": sentence.strip(), "timestamp": None}
-        
-        return None
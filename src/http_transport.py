@@ -0,0 +1,230 @@
+"""
+Shared HTTP transport for API clients - pooled keep-alive sessions with
+timeouts, retry with backoff, per-host concurrency limits and metrics.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into seconds.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds to wait, or None if missing or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class HTTPTransport:
+    """Pooled HTTP session shared by every request a client makes."""
+
+    def __init__(
+        self,
+        timeout: Union[float, Tuple[float, float]] = (5.0, 30.0),
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        max_per_host: int = 8,
+        pool_maxsize: int = 16
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            timeout: Default (connect, read) timeout in seconds, or a single value
+            max_retries: Retries after the first attempt for 429/5xx and
+                connection errors on idempotent requests
+            backoff_base: First backoff delay in seconds (doubles per retry)
+            backoff_max: Upper bound for any single backoff or Retry-After wait
+            max_per_host: Maximum concurrent in-flight requests per host
+            pool_maxsize: Keep-alive connections kept per host
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_per_host = max_per_host
+
+        self.session = requests.Session()
+        self._adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "retries": 0,
+            "errors": 0,
+            "total_latency_ms": 0.0,
+            "max_latency_ms": 0.0,
+        }
+
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        """Get the concurrency semaphore for a URL's host."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_limits[host]
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Delay before the next attempt, honoring Retry-After when present."""
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        delay = self.backoff_base * (2 ** attempt)
+        return min(delay + random.uniform(0, self.backoff_base), self.backoff_max)
+
+    def _record(self, latency_ms: float, retried: bool = False, error: bool = False):
+        """Update request metrics."""
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["total_latency_ms"] += latency_ms
+            self._stats["max_latency_ms"] = max(self._stats["max_latency_ms"], latency_ms)
+            if retried:
+                self._stats["retries"] += 1
+            if error:
+                self._stats["errors"] += 1
+
+    def request(self, method: str, url: str, retry: Optional[bool] = None, **kwargs) -> requests.Response:
+        """
+        Send a request through the pooled session.
+
+        429/5xx responses and connection errors are retried with exponential
+        backoff. After the last retry the final response is returned as-is, so
+        callers keep checking status_code / raise_for_status as before.
+
+        Args:
+            method: HTTP method
+            url: Full URL
+            retry: Whether to retry (defaults to True for idempotent methods);
+                pass True for read-only POSTs such as search and batch reads
+            **kwargs: Passed to requests.Session.request (timeout defaults
+                to the transport timeout)
+
+        Returns:
+            requests.Response
+        """
+        method = method.upper()
+        if retry is None:
+            retry = method in IDEMPOTENT_METHODS
+        attempts = self.max_retries + 1 if retry else 1
+        kwargs.setdefault("timeout", self.timeout)
+        host_limit = self._host_limit(url)
+
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            start = time.perf_counter()
+            try:
+                with host_limit:
+                    response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record((time.perf_counter() - start) * 1000, retried=not last_attempt, error=True)
+                if last_attempt:
+                    raise
+                time.sleep(self._backoff(attempt, None))
+                continue
+
+            should_retry = response.status_code in RETRY_STATUS_CODES and not last_attempt
+            self._record(
+                (time.perf_counter() - start) * 1000,
+                retried=should_retry,
+                error=response.status_code >= 400
+            )
+            if not should_retry:
+                return response
+            delay = self._backoff(attempt, response)
+            response.close()
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict:
+        """
+        Get request and connection metrics.
+
+        Returns:
+            Dictionary with requests, retries, errors, avg/max latency (ms),
+            connections_opened and connections_reused
+        """
+        connections_opened = 0
+        pool_requests = 0
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                connections_opened += pool.num_connections
+                pool_requests += pool.num_requests
+
+        with self._lock:
+            stats = dict(self._stats)
+        stats["avg_latency_ms"] = round(stats["total_latency_ms"] / stats["requests"], 2) if stats["requests"] else 0.0
+        stats["total_latency_ms"] = round(stats["total_latency_ms"], 2)
+        stats["max_latency_ms"] = round(stats["max_latency_ms"], 2)
+        stats["connections_opened"] = connections_opened
+        stats["connections_reused"] = max(pool_requests - connections_opened, 0)
+        return stats
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+
+_transports: Dict[str, HTTPTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(name: str, **config) -> HTTPTransport:
+    """
+    Get the process-wide transport for a client, creating it on first use.
+
+    Clients are often constructed per request (e.g. on every Streamlit
+    rerun); sharing the transport by name keeps their connections warm.
+
+    Args:
+        name: Client name, e.g. "gong" or "hubspot"
+        **config: HTTPTransport arguments used when first created
+
+    Returns:
+        Shared HTTPTransport
+    """
+    with _transports_lock:
+        if name not in _transports:
+            _transports[name] = HTTPTransport(**config)
+        return _transports[name]
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Local stub of the HubSpot CRM endpoints HubSpotClient uses.
+
+Serves in-memory companies, contacts and deals and records every request, so
+round trips per fetch_account_context can be counted without network access.
+
+Usage:
+    python -m src.hubspot_stub --port 8765 --latency 0.05
+    HUBSPOT_BASE_URL=http://127.0.0.1:8765 HUBSPOT_PRIVATE_APP_TOKEN=stub python main.py ...
+
+Or in-process:
+    with HubSpotStubServer() as stub:
+        client = HubSpotClient(private_app_token="stub", base_url=stub.url)
+        client.fetch_account_context("Acme Corp")
+        print(stub.request_count)
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+
+OBJECT_TYPES = ("companies", "contacts", "deals")
+
+SAMPLE_DATA = {
+    "companies": {
+        "101": {"name": "Acme Corp", "domain": "acme.com", "industry": "Technology",
+                "numberofemployees": "500", "hs_analytics_region": "North America",
+                "notes_last_contacted": "Discussed rollout timeline with platform team"},
+    },
+    "contacts": {
+        str(201 + i): {"firstname": first, "lastname": last, "email": f"{first.lower()}@acme.com", "jobtitle": title}
+        for i, (first, last, title) in enumerate([
+            ("John", "Doe", "VP Engineering"),
+            ("Jane", "Smith", "CTO"),
+            ("Priya", "Patel", "Director of Platform"),
+            ("Marco", "Rossi", "Engineering Manager"),
+            ("Lena", "Fischer", "Staff Engineer"),
+            ("Sam", "Lee", "Developer Productivity Lead"),
+        ])
+    },
+    "deals": {
+        "301": {"dealstage": "qualifiedtobuy", "amount": "50000", "closedate": "2024-06-30"},
+    },
+    "associations": {
+        "101": {"contacts": ["201", "202", "203", "204", "205", "206"], "deals": ["301"]},
+    },
+}
+
+
+class HubSpotStubServer:
+    """Threaded HTTP server emulating HubSpot CRM v3 object endpoints."""
+
+    def __init__(self, data: Optional[Dict] = None, host: str = "127.0.0.1",
+                 port: int = 0, latency: float = 0.0):
+        """
+        Initialize stub server.
+
+        Args:
+            data: Dict with "companies", "contacts", "deals" (id -> properties)
+                and "associations" (company id -> {object type: [ids]});
+                defaults to SAMPLE_DATA
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Seconds added to every response, to make round trips visible
+        """
+        self.data = data or SAMPLE_DATA
+        self.latency = latency
+        self.requests: List[Dict] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to HubSpotClient."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        """Number of requests served since start or the last reset."""
+        with self._lock:
+            return len(self.requests)
+
+    def reset(self):
+        """Clear the request log."""
+        with self._lock:
+            self.requests.clear()
+
+    def start(self) -> "HubSpotStubServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "HubSpotStubServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _record(self, method: str, path: str):
+        with self._lock:
+            self.requests.append({"method": method, "path": path, "time": time.time()})
+
+    def _object(self, object_type: str, object_id: str) -> Optional[dict]:
+        properties = self.data.get(object_type, {}).get(object_id)
+        if properties is None:
+            return None
+        return {"id": object_id, "properties": dict(properties)}
+
+    def _search(self, query: str) -> List[dict]:
+        query = query.lower()
+        return [
+            self._object("companies", company_id)
+            for company_id, props in self.data.get("companies", {}).items()
+            if query in (props.get("name") or "").lower() or query in (props.get("domain") or "").lower()
+        ]
+
+    def handle(self, method: str, path: str, body: Optional[dict]) -> tuple:
+        """
+        Route a request to a (status, payload) response.
+
+        Args:
+            method: HTTP method
+            path: URL path without query string
+            body: Parsed JSON body, if any
+
+        Returns:
+            Tuple of HTTP status code and JSON-serializable payload
+        """
+        self._record(method, path)
+        if self.latency:
+            time.sleep(self.latency)
+
+        types = "|".join(OBJECT_TYPES)
+        body = body or {}
+
+        if method == "POST" and path == "/crm/v3/objects/companies/search":
+            return 200, {"results": self._search(body.get("query", ""))}
+
+        if method == "GET" and path == "/crm/v3/objects/companies":
+            return 200, {"results": [self._object("companies", cid) for cid in self.data.get("companies", {})]}
+
+        match = re.fullmatch(rf"/crm/v3/objects/companies/([^/]+)/associations/({types})", path)
+        if match and method == "GET":
+            ids = self.data.get("associations", {}).get(match.group(1), {}).get(match.group(2), [])
+            return 200, {"results": [{"id": object_id, "type": f"company_to_{match.group(2)[:-1]}"} for object_id in ids]}
+
+        match = re.fullmatch(rf"/crm/v3/objects/({types})/batch/read", path)
+        if match and method == "POST":
+            results, missing = [], []
+            for item in body.get("inputs", []):
+                obj = self._object(match.group(1), str(item.get("id")))
+                if obj is None:
+                    missing.append(str(item.get("id")))
+                else:
+                    results.append(obj)
+            payload = {"status": "COMPLETE", "results": results}
+            if missing:
+                payload["errors"] = [{"status": "error", "category": "OBJECT_NOT_FOUND", "context": {"ids": missing}}]
+                return 207, payload
+            return 200, payload
+
+        match = re.fullmatch(rf"/crm/v3/objects/({types})/([^/]+)", path)
+        if match and method == "GET":
+            obj = self._object(match.group(1), match.group(2))
+            if obj is None:
+                return 404, {"status": "error", "category": "OBJECT_NOT_FOUND"}
+            return 200, obj
+
+        return 404, {"status": "error", "message": f"No stub route for {method} {path}"}
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                try:
+                    body = json.loads(raw) if raw else None
+                except json.JSONDecodeError:
+                    body = None
+
+                status, payload = stub.handle(self.command, urlsplit(self.path).path, body)
+                encoded = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            do_GET = _respond
+            do_POST = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    """CLI entry point for the HubSpot stub server."""
+    parser = argparse.ArgumentParser(description="Run a local HubSpot CRM stub server")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind (default: 8765)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--data", type=str, help="JSON file with companies, contacts, deals and associations")
+
+    args = parser.parse_args()
+
+    data = None
+    if args.data:
+        with open(args.data, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    stub = HubSpotStubServer(data=data, host=args.host, port=args.port, latency=args.latency)
+    print(f"HubSpot stub listening on {stub.url} (Ctrl+C to stop)")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub._server.server_close()
+        print(f"Served {stub.request_count} requests")
+
+
+if __name__ == "__main__":
+    main()
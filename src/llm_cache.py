@@ -0,0 +1,238 @@
+"""
+Response cache for LLM calls - SQLite entries keyed by provider, model and a
+hash of the prompt and parameters, with a TTL, LRU eviction and a record of
+the tokens each hit saved.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+
+DEFAULT_CACHE_PATH = Path("data") / "llm_cache.db"
+
+
+def prompt_hash(system: Optional[str], prompt: str, params: Dict) -> str:
+    """
+    Hash a prompt and its generation parameters.
+
+    Args:
+        system: System prompt, if any
+        prompt: User prompt
+        params: Generation parameters (max_tokens, temperature, ...)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    payload = json.dumps({"system": system, "prompt": prompt, "params": params}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    SQLite cache of LLM completions.
+
+    Entries are keyed by (provider, model, prompt hash), where the hash
+    covers the system prompt, user prompt and generation parameters. Each
+    entry keeps the token usage of the original call, so every hit adds to
+    tokens_saved.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = 7 * 86400.0,
+        max_entries: int = 2000
+    ):
+        """
+        Initialize LLM cache.
+
+        Args:
+            db_path: SQLite file
+            ttl_seconds: Seconds a completion is reused before calling the LLM again
+            max_entries: Entries kept before least recently used are evicted
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0, "tokens_saved": 0}
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    provider TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    prompt_hash TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    input_tokens INTEGER NOT NULL DEFAULT 0,
+                    output_tokens INTEGER NOT NULL DEFAULT 0,
+                    hit_count INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (provider, model, prompt_hash)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed_at)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing and closing on exit."""
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._lock:
+            self._stats[stat] += amount
+
+    def get(self, provider: str, model: str, key: str) -> Optional[str]:
+        """
+        Look up a cached completion.
+
+        Args:
+            provider: "openai" or "anthropic"
+            model: Model name
+            key: prompt_hash() of the request
+
+        Returns:
+            Completion text, or None on a miss or expired entry
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT content, input_tokens, output_tokens, created_at FROM llm_cache "
+                "WHERE provider = ? AND model = ? AND prompt_hash = ?",
+                (provider, model, key)
+            ).fetchone()
+            if row is None or time.time() - row[3] >= self.ttl_seconds:
+                self._count("misses")
+                return None
+            conn.execute(
+                "UPDATE llm_cache SET accessed_at = ?, hit_count = hit_count + 1 "
+                "WHERE provider = ? AND model = ? AND prompt_hash = ?",
+                (time.time(), provider, model, key)
+            )
+
+        self._count("hits")
+        self._count("tokens_saved", row[1] + row[2])
+        return row[0]
+
+    def put(self, provider: str, model: str, key: str, content: str,
+            input_tokens: int = 0, output_tokens: int = 0):
+        """
+        Store a completion, evicting least recently used entries over capacity.
+
+        Args:
+            provider: "openai" or "anthropic"
+            model: Model name
+            key: prompt_hash() of the request
+            content: Completion text
+            input_tokens: Prompt tokens the call used
+            output_tokens: Completion tokens the call used
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache "
+                "(provider, model, prompt_hash, content, input_tokens, output_tokens, hit_count, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?)",
+                (provider, model, key, content, input_tokens, output_tokens, now, now)
+            )
+            evicted = conn.execute(
+                "DELETE FROM llm_cache WHERE rowid IN ("
+                "SELECT rowid FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            ).rowcount
+        self._count("writes")
+        if evicted > 0:
+            self._count("evictions", evicted)
+
+    def clear(self):
+        """Delete every cached completion."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> Dict:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dictionary with hits, misses, writes, evictions and tokens_saved
+            for this process, plus entries and lifetime_tokens_saved across
+            every run that shared the cache file
+        """
+        with self._connect() as conn:
+            entries, lifetime_saved = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hit_count * (input_tokens + output_tokens)), 0) FROM llm_cache"
+            ).fetchone()
+        with self._lock:
+            stats = dict(self._stats)
+        stats["entries"] = entries
+        stats["lifetime_tokens_saved"] = lifetime_saved
+        return stats
+
+
+_cache: Optional[LLMCache] = None
+_cache_enabled = os.getenv("LLM_CACHE", "on").lower() not in ("off", "false", "0")
+_cache_lock = threading.Lock()
+
+
+def _build_cache(
+    db_path: Optional[Union[str, Path]] = None,
+    ttl_seconds: Optional[float] = None,
+    max_entries: Optional[int] = None
+) -> LLMCache:
+    """Create an LLMCache, filling unset arguments from the environment."""
+    return LLMCache(
+        db_path=db_path or os.getenv("LLM_CACHE_PATH", str(DEFAULT_CACHE_PATH)),
+        ttl_seconds=ttl_seconds if ttl_seconds is not None else float(os.getenv("LLM_CACHE_TTL", str(7 * 86400))),
+        max_entries=max_entries if max_entries is not None else int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
+    )
+
+
+def configure_llm_cache(
+    enabled: bool = True,
+    db_path: Optional[Union[str, Path]] = None,
+    ttl_seconds: Optional[float] = None,
+    max_entries: Optional[int] = None
+):
+    """
+    Configure the process-wide LLM response cache.
+
+    Unset arguments fall back to LLM_CACHE_PATH, LLM_CACHE_TTL and
+    LLM_CACHE_MAX_ENTRIES, then to the defaults.
+
+    Args:
+        enabled: False bypasses the cache for every call
+        db_path: SQLite file
+        ttl_seconds: Entry TTL in seconds
+        max_entries: LRU capacity
+    """
+    global _cache, _cache_enabled
+    with _cache_lock:
+        _cache_enabled = enabled
+        _cache = _build_cache(db_path, ttl_seconds, max_entries) if enabled else None
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """
+    Get the process-wide LLM cache, creating it from the environment on first use.
+
+    Returns:
+        LLMCache, or None when the cache is disabled
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None and _cache_enabled:
+            _cache = _build_cache()
+        return _cache
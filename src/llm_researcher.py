@@ -2,8 +2,14 @@
 LLM-based research module for gathering persona and company information.
 """
 
+import hashlib
 import os
-from typing import Dict, List, Optional
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .llm_cache import get_llm_cache, prompt_hash
 
 try:
     import openai
@@ -18,6 +24,42 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
 
 
+# Provider clients keyed by (provider, API key hash). Each client owns an
+# HTTP connection pool and is safe to share across threads, so one per key
+# is reused by every call instead of building a new pool per request.
+MAX_CACHED_CLIENTS = 8
+_clients: "OrderedDict[tuple, object]" = OrderedDict()
+_clients_lock = threading.Lock()
+
+
+def _get_client(provider: str, api_key: str, factory: Callable[[str], object]):
+    """
+    Get the shared client for a provider and API key, building it on first use.
+    
+    A new key (e.g. entered in the app.py sidebar) gets its own client. Older
+    clients are dropped from the registry but not closed, so calls already
+    using them finish normally.
+    
+    Args:
+        provider: "openai" or "anthropic"
+        api_key: API key the client authenticates with
+        factory: Builds a client from an API key
+        
+    Returns:
+        Provider client
+    """
+    key = (provider, hashlib.sha256(api_key.encode("utf-8")).hexdigest())
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = factory(api_key)
+            _clients[key] = client
+            while len(_clients) > MAX_CACHED_CLIENTS:
+                _clients.popitem(last=False)
+        _clients.move_to_end(key)
+        return client
+
+
 def get_openai_client():
     """Get OpenAI client if API key is available."""
     if not OPENAI_AVAILABLE:
@@ -25,7 +67,7 @@ def get_openai_client():
     api_key = os.getenv('OPENAI_API_KEY')
     if not api_key:
         return None
-    return openai.OpenAI(api_key=api_key)
+    return _get_client("openai", api_key, lambda key: openai.OpenAI(api_key=key))
 
 
 def get_anthropic_client():
@@ -35,10 +77,220 @@ def get_anthropic_client():
     api_key = os.getenv('ANTHROPIC_API_KEY')
     if not api_key:
         return None
-    return anthropic.Anthropic(api_key=api_key)
+    return _get_client("anthropic", api_key, lambda key: anthropic.Anthropic(api_key=key))
+
+
+OPENAI_MODEL = "gpt-4o-mini"
+ANTHROPIC_MODEL = "claude-3-5-sonnet-20241022"
+
+
+def _cache_key(provider: str, system: Optional[str], prompt: str, max_tokens: int,
+               temperature: float = 0.7) -> str:
+    """Cache key for a request; streamed and non-streamed calls share entries."""
+    params = {"max_tokens": max_tokens}
+    if provider == "openai":
+        params["temperature"] = temperature
+    return prompt_hash(system, prompt, params)
+
+
+def _open_cache(use_cache: bool):
+    """The LLM cache, or None when bypassed or it can't be opened (e.g. a corrupt file)."""
+    if not use_cache:
+        return None
+    try:
+        return get_llm_cache()
+    except Exception as e:
+        print(f"Warning: LLM cache unavailable: {e}", file=sys.stderr)
+        return None
+
+
+def _cache_get(cache, provider: str, model: str, key: str) -> Optional[str]:
+    """Cached response, treating a cache error as a miss."""
+    if cache is None:
+        return None
+    try:
+        return cache.get(provider, model, key)
+    except Exception as e:
+        print(f"Warning: LLM cache read failed: {e}", file=sys.stderr)
+        return None
+
+
+def _cache_put(cache, provider: str, model: str, key: str, content: str, **usage):
+    """Cache a response; a cache error only skips the write, the response is still returned."""
+    if cache is None or not content:
+        return
+    try:
+        cache.put(provider, model, key, content, **usage)
+    except Exception as e:
+        print(f"Warning: LLM cache write failed: {e}", file=sys.stderr)
+
+
+def _openai_completion(client, system: str, prompt: str, max_tokens: int,
+                       temperature: float = 0.7, use_cache: bool = True) -> str:
+    """
+    Run an OpenAI chat completion, served from the LLM cache when possible.
+    
+    Args:
+        client: OpenAI client
+        system: System message
+        prompt: User message
+        max_tokens: Completion token limit
+        temperature: Sampling temperature
+        use_cache: False to bypass the cache for this call
+        
+    Returns:
+        Completion text
+    """
+    cache = _open_cache(use_cache)
+    key = _cache_key("openai", system, prompt, max_tokens, temperature)
+    cached = _cache_get(cache, "openai", OPENAI_MODEL, key)
+    if cached is not None:
+        return cached
+    
+    response = client.chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+    content = response.choices[0].message.content
+    
+    usage = getattr(response, "usage", None)
+    _cache_put(
+        cache, "openai", OPENAI_MODEL, key, content,
+        input_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+        output_tokens=getattr(usage, "completion_tokens", 0) or 0
+    )
+    return content
+
+
+def _anthropic_completion(client, prompt: str, max_tokens: int,
+                          system: Optional[str] = None, use_cache: bool = True) -> str:
+    """
+    Run an Anthropic message, served from the LLM cache when possible.
+    
+    Args:
+        client: Anthropic client
+        prompt: User message
+        max_tokens: Completion token limit
+        system: Optional system prompt
+        use_cache: False to bypass the cache for this call
+        
+    Returns:
+        Completion text
+    """
+    cache = _open_cache(use_cache)
+    key = _cache_key("anthropic", system, prompt, max_tokens)
+    cached = _cache_get(cache, "anthropic", ANTHROPIC_MODEL, key)
+    if cached is not None:
+        return cached
+    
+    kwargs = {"system": system} if system else {}
+    message = client.messages.create(
+        model=ANTHROPIC_MODEL,
+        max_tokens=max_tokens,
+        messages=[
+            {"role": "user", "content": prompt}
+        ],
+        **kwargs
+    )
+    content = message.content[0].text
+    
+    usage = getattr(message, "usage", None)
+    _cache_put(
+        cache, "anthropic", ANTHROPIC_MODEL, key, content,
+        input_tokens=getattr(usage, "input_tokens", 0) or 0,
+        output_tokens=getattr(usage, "output_tokens", 0) or 0
+    )
+    return content
+
+
+def stream_completion(provider: str, prompt: str, max_tokens: int, system: Optional[str] = None,
+                      temperature: float = 0.7, use_cache: bool = True) -> Iterator[str]:
+    """
+    Stream a completion as text chunks.
+    
+    A cached response is yielded as one chunk. Otherwise chunks are yielded
+    as the provider sends them, and the full text is cached once the stream
+    completes (an abandoned stream is not cached).
+    
+    Args:
+        provider: "openai" or "anthropic"
+        prompt: User message
+        max_tokens: Completion token limit
+        system: Optional system prompt
+        temperature: Sampling temperature (OpenAI only, as in the non-streaming calls)
+        use_cache: False to bypass the cache for this call
+        
+    Yields:
+        Text chunks
+        
+    Raises:
+        ValueError: If the provider is unknown or its API key is not set
+    """
+    if provider == "openai":
+        client, model = get_openai_client(), OPENAI_MODEL
+    elif provider == "anthropic":
+        client, model = get_anthropic_client(), ANTHROPIC_MODEL
+    else:
+        raise ValueError(f"Unknown provider: {provider}")
+    if not client:
+        raise ValueError(f"{'OpenAI' if provider == 'openai' else 'Anthropic'} API key not found")
+    
+    cache = _open_cache(use_cache)
+    key = _cache_key(provider, system, prompt, max_tokens, temperature)
+    cached = _cache_get(cache, provider, model, key)
+    if cached is not None:
+        yield cached
+        return
+    
+    chunks = []
+    usage = {"input_tokens": 0, "output_tokens": 0}
+    
+    if provider == "openai":
+        messages = [{"role": "user", "content": prompt}]
+        if system:
+            messages.insert(0, {"role": "system", "content": system})
+        stream = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                chunks.append(chunk.choices[0].delta.content)
+                yield chunk.choices[0].delta.content
+            if getattr(chunk, "usage", None):
+                usage["input_tokens"] = chunk.usage.prompt_tokens or 0
+                usage["output_tokens"] = chunk.usage.completion_tokens or 0
+    else:
+        kwargs = {"system": system} if system else {}
+        with client.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            **kwargs
+        ) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+                yield text
+            final_usage = getattr(stream.get_final_message(), "usage", None)
+            usage["input_tokens"] = getattr(final_usage, "input_tokens", 0) or 0
+            usage["output_tokens"] = getattr(final_usage, "output_tokens", 0) or 0
+    
+    _cache_put(cache, provider, model, key, "".join(chunks), **usage)
 
 
-def research_persona_with_llm(company: str, persona: str, provider: str = "openai") -> Dict[str, any]:
+def research_persona_with_llm(company: str, persona: str, provider: str = "openai",
+                              use_cache: bool = True) -> Dict[str, any]:
     """
     Research persona information using LLM.
     
@@ -46,6 +298,7 @@ def research_persona_with_llm(company: str, persona: str, provider: str = "opena
         company: Company name
         persona: Persona/role (e.g., "CTO", "VP Engineering")
         provider: LLM provider ("openai" or "anthropic")
+        use_cache: False to bypass the LLM response cache
         
     Returns:
         Dictionary with persona information including name if found
@@ -67,16 +320,13 @@ FOCUS: [key focus areas]"""
             return {"name": None, "error": "OpenAI API key not found. Set OPENAI_API_KEY environment variable."}
         
         try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a research assistant that helps find information about executives and their companies."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=500
+            content = _openai_completion(
+                client,
+                "You are a research assistant that helps find information about executives and their companies.",
+                prompt,
+                max_tokens=500,
+                use_cache=use_cache
             )
-            content = response.choices[0].message.content
             return parse_llm_response(content)
         except Exception as e:
             return {"name": None, "error": f"OpenAI API error: {str(e)}"}
@@ -87,14 +337,12 @@ FOCUS: [key focus areas]"""
             return {"name": None, "error": "Anthropic API key not found. Set ANTHROPIC_API_KEY environment variable."}
         
         try:
-            message = client.messages.create(
-                model="claude-3-5-sonnet-20241022",
+            content = _anthropic_completion(
+                client,
+                prompt,
                 max_tokens=500,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                use_cache=use_cache
             )
-            content = message.content[0].text
             return parse_llm_response(content)
         except Exception as e:
             return {"name": None, "error": f"Anthropic API error: {str(e)}"}
@@ -126,13 +374,15 @@ def parse_llm_response(content: str) -> Dict[str, any]:
     return result
 
 
-def research_company_context_with_llm(company: str, provider: str = "openai") -> Dict[str, any]:
+def research_company_context_with_llm(company: str, provider: str = "openai",
+                                      use_cache: bool = True) -> Dict[str, any]:
     """
     Research comprehensive company information for account briefing.
     
     Args:
         company: Company name
         provider: LLM provider ("openai" or "anthropic")
+        use_cache: False to bypass the LLM response cache
         
     Returns:
         Dictionary with comprehensive company information
@@ -170,16 +420,13 @@ DIFFERENTIATORS: [key unique aspects]"""
             return {"error": "OpenAI API key not found"}
         
         try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a research assistant that helps find detailed company information for sales and marketing purposes. Provide information that is specific and unique to each company - avoid generic details that could apply to any company."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=800
+            content = _openai_completion(
+                client,
+                "You are a research assistant that helps find detailed company information for sales and marketing purposes. Provide information that is specific and unique to each company - avoid generic details that could apply to any company.",
+                prompt,
+                max_tokens=800,
+                use_cache=use_cache
             )
-            content = response.choices[0].message.content
             return parse_company_context(content)
         except Exception as e:
             return {"error": f"OpenAI API error: {str(e)}"}
@@ -190,14 +437,12 @@ DIFFERENTIATORS: [key unique aspects]"""
             return {"error": "Anthropic API key not found"}
         
         try:
-            message = client.messages.create(
-                model="claude-3-5-sonnet-20241022",
+            content = _anthropic_completion(
+                client,
+                prompt,
                 max_tokens=800,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                use_cache=use_cache
             )
-            content = message.content[0].text
             return parse_company_context(content)
         except Exception as e:
             return {"error": f"Anthropic API error: {str(e)}"}
@@ -248,22 +493,9 @@ def parse_company_context(content: str) -> Dict[str, any]:
     return result
 
 
-def enhance_brief_with_llm(company: str, persona: str, competitors: List[str], 
-                           use_persona_research: bool = True, provider: str = "openai") -> Dict[str, any]:
-    """
-    Enhance account brief with LLM-generated content.
-    
-    Args:
-        company: Company name
-        persona: Persona/role
-        competitors: List of competitors
-        use_persona_research: Whether to research persona name
-        provider: LLM provider ("openai" or "anthropic")
-        
-    Returns:
-        Dictionary with enhanced content
-    """
-    enhanced = {
+def empty_enhanced_content() -> Dict[str, any]:
+    """Enhanced-content dictionary with every field unset."""
+    return {
         "persona_name": None,
         "persona_background": None,
         "persona_focus": None,
@@ -278,69 +510,106 @@ def enhance_brief_with_llm(company: str, persona: str, competitors: List[str],
         "company_tech_stack": None,
         "company_differentiators": None
     }
+
+
+def apply_company_context(enhanced: Dict[str, any], company_context: Dict[str, any], persona: str) -> None:
+    """
+    Copy company research into enhanced content, picking the persona's name
+    out of the executives list when it is there.
     
-    if use_persona_research:
-        # Research comprehensive company context first (this includes executives)
-        company_context = research_company_context_with_llm(company, provider)
-        if "error" not in company_context:
-            enhanced["company_description"] = company_context.get("description")
-            enhanced["company_employees"] = company_context.get("employees")
-            enhanced["company_engineering_team"] = company_context.get("engineering_team")
-            enhanced["company_funding"] = company_context.get("funding")
-            enhanced["company_revenue"] = company_context.get("revenue")
-            enhanced["company_headquarters"] = company_context.get("headquarters")
-            enhanced["company_executives"] = company_context.get("executives")
-            enhanced["company_recent_news"] = company_context.get("recent_news")
-            enhanced["company_tech_stack"] = company_context.get("tech_stack")
-            enhanced["company_differentiators"] = company_context.get("differentiators")
-            
-            # Extract persona name from executives list if available
-            executives_str = enhanced["company_executives"]
-            if executives_str:
-                # Try to find the persona in the executives list
-                persona_lower = persona.lower()
-                for line in executives_str.split('\n'):
-                    if persona_lower in line.lower():
-                        # Extract name (typically format: "Name, Title" or "Title: Name")
-                        parts = line.split(',')
-                        if len(parts) > 1:
-                            enhanced["persona_name"] = parts[0].strip()
-                        else:
-                            parts = line.split(':')
-                            if len(parts) > 1:
-                                enhanced["persona_name"] = parts[1].strip()
-                        break
-        
-        # Also try direct persona research as fallback
-        if not enhanced.get("persona_name"):
-            persona_info = research_persona_with_llm(company, persona, provider)
-            if persona_info.get("name"):
-                enhanced["persona_name"] = persona_info.get("name")
-            enhanced["persona_background"] = persona_info.get("background")
-            enhanced["persona_focus"] = persona_info.get("focus")
+    Args:
+        enhanced: Enhanced-content dictionary to update
+        company_context: Result of research_company_context_with_llm
+        persona: Persona/role
+    """
+    if "error" in company_context:
+        return
     
-    return enhanced
+    enhanced["company_description"] = company_context.get("description")
+    enhanced["company_employees"] = company_context.get("employees")
+    enhanced["company_engineering_team"] = company_context.get("engineering_team")
+    enhanced["company_funding"] = company_context.get("funding")
+    enhanced["company_revenue"] = company_context.get("revenue")
+    enhanced["company_headquarters"] = company_context.get("headquarters")
+    enhanced["company_executives"] = company_context.get("executives")
+    enhanced["company_recent_news"] = company_context.get("recent_news")
+    enhanced["company_tech_stack"] = company_context.get("tech_stack")
+    enhanced["company_differentiators"] = company_context.get("differentiators")
+    
+    # Extract persona name from executives list if available
+    executives_str = enhanced["company_executives"]
+    if executives_str:
+        # Try to find the persona in the executives list
+        persona_lower = persona.lower()
+        for line in executives_str.split('\n'):
+            if persona_lower in line.lower():
+                # Extract name (typically format: "Name, Title" or "Title: Name")
+                parts = line.split(',')
+                if len(parts) > 1:
+                    enhanced["persona_name"] = parts[0].strip()
+                else:
+                    parts = line.split(':')
+                    if len(parts) > 1:
+                        enhanced["persona_name"] = parts[1].strip()
+                break
+
+
+def apply_persona_research(enhanced: Dict[str, any], persona_info: Dict[str, any]) -> None:
+    """
+    Fill persona fields from direct persona research when the company
+    research didn't name the persona.
+    
+    Args:
+        enhanced: Enhanced-content dictionary to update
+        persona_info: Result of research_persona_with_llm
+    """
+    if enhanced.get("persona_name"):
+        return
+    if persona_info.get("name"):
+        enhanced["persona_name"] = persona_info.get("name")
+    enhanced["persona_background"] = persona_info.get("background")
+    enhanced["persona_focus"] = persona_info.get("focus")
 
 
-def generate_email_sequence_with_llm(company: str, persona: str, persona_name: str, 
-                                     company_info: Dict[str, any], competitors: List[str],
-                                     pain_points: List[str], provider: str = "openai") -> Dict[str, str]:
+def enhance_brief_with_llm(company: str, persona: str, competitors: List[str], 
+                           use_persona_research: bool = True, provider: str = "openai",
+                           use_cache: bool = True) -> Dict[str, any]:
     """
-    Generate complete email sequences using LLM - no placeholders, real AE-style emails.
+    Enhance account brief with LLM-generated content.
     
     Args:
         company: Company name
         persona: Persona/role
-        persona_name: Name of the persona (if known)
-        company_info: Dictionary with company research data
         competitors: List of competitors
-        pain_points: List of pain points for the persona
-        provider: LLM provider
+        use_persona_research: Whether to research persona name
+        provider: LLM provider ("openai" or "anthropic")
+        use_cache: False to bypass the LLM response cache
         
     Returns:
-        Dictionary with email subject, body, and follow-up emails
+        Dictionary with enhanced content
     """
-    greeting = persona_name if persona_name else "[First Name]"
+    enhanced = empty_enhanced_content()
+    
+    if use_persona_research:
+        # Research comprehensive company context first (this includes executives)
+        company_context = research_company_context_with_llm(company, provider, use_cache)
+        apply_company_context(enhanced, company_context, persona)
+        
+        # Also try direct persona research as fallback
+        if not enhanced.get("persona_name"):
+            persona_info = research_persona_with_llm(company, persona, provider, use_cache)
+            apply_persona_research(enhanced, persona_info)
+    
+    return enhanced
+
+
+EMAIL_SYSTEM_PROMPT = "You are an enterprise Account Executive at Cursor (product-led growth company) selling developer tools to engineering teams. Write direct, sharp, professional emails with zero placeholders. Cursor uses PLG - focus on activation, expansion, and helping existing/trial users get more value, not pure cold discovery. Target tactical, implementation-focused engineering leaders (Head of Engineering, VP Engineering, Developer Experience Lead, Platform Lead, Engineering Productivity), NOT strategic execs. Be concrete, specific, and opinionated about developer tools and engineering workflows. Avoid strategic/vague language. Assume the reader is smart and busy. Max 90 words per email. No hype, no pleasantries like 'hope you're well'. When mentioning competitors, explain how the product would be evaluated against them and what tradeoffs the persona would care about (speed vs accuracy, local vs cloud, snippets vs full repo context, etc.). CTAs must be value-driven comparisons or insights with tradeoffs, NOT generic meeting requests like 'would you be open to a call'."
+
+
+def _email_sequence_prompt(company: str, persona: str, persona_name: str,
+                           company_info: Dict[str, any], competitors: List[str],
+                           pain_points: List[str]) -> str:
+    """Build the email-sequence user prompt."""
     company_desc = company_info.get("description", "")
     recent_news = company_info.get("recent_news", "")
     funding = company_info.get("funding", "")
@@ -397,6 +666,31 @@ EMAIL3_SUBJECT: [subject line]
 EMAIL3_BODY: [complete email body, max 90 words]
 
 LINKEDIN_MESSAGE: [short, natural LinkedIn message]"""
+    return prompt
+
+
+def generate_email_sequence_with_llm(company: str, persona: str, persona_name: str, 
+                                     company_info: Dict[str, any], competitors: List[str],
+                                     pain_points: List[str], provider: str = "openai",
+                                     use_cache: bool = True) -> Dict[str, str]:
+    """
+    Generate complete email sequences using LLM - no placeholders, real AE-style emails.
+    
+    Args:
+        company: Company name
+        persona: Persona/role
+        persona_name: Name of the persona (if known)
+        company_info: Dictionary with company research data
+        competitors: List of competitors
+        pain_points: List of pain points for the persona
+        provider: LLM provider
+        use_cache: False to bypass the LLM response cache
+        
+    Returns:
+        Dictionary with email subject, body, and follow-up emails
+    """
+    greeting = persona_name if persona_name else "[First Name]"
+    prompt = _email_sequence_prompt(company, persona, persona_name, company_info, competitors, pain_points)
 
     if provider == "openai":
         client = get_openai_client()
@@ -404,16 +698,13 @@ LINKEDIN_MESSAGE: [short, natural LinkedIn message]"""
             return {"error": "OpenAI API key not found"}
         
         try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are an enterprise Account Executive at Cursor (product-led growth company) selling developer tools to engineering teams. Write direct, sharp, professional emails with zero placeholders. Cursor uses PLG - focus on activation, expansion, and helping existing/trial users get more value, not pure cold discovery. Target tactical, implementation-focused engineering leaders (Head of Engineering, VP Engineering, Developer Experience Lead, Platform Lead, Engineering Productivity), NOT strategic execs. Be concrete, specific, and opinionated about developer tools and engineering workflows. Avoid strategic/vague language. Assume the reader is smart and busy. Max 90 words per email. No hype, no pleasantries like 'hope you're well'. When mentioning competitors, explain how the product would be evaluated against them and what tradeoffs the persona would care about (speed vs accuracy, local vs cloud, snippets vs full repo context, etc.). CTAs must be value-driven comparisons or insights with tradeoffs, NOT generic meeting requests like 'would you be open to a call'."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
+            content = _openai_completion(
+                client,
+                EMAIL_SYSTEM_PROMPT,
+                prompt,
+                max_tokens=2000,
+                use_cache=use_cache
             )
-            content = response.choices[0].message.content
             return parse_email_sequence(content, greeting)
         except Exception as e:
             return {"error": f"OpenAI API error: {str(e)}"}
@@ -424,15 +715,13 @@ LINKEDIN_MESSAGE: [short, natural LinkedIn message]"""
             return {"error": "Anthropic API key not found"}
         
         try:
-            message = client.messages.create(
-                model="claude-3-5-sonnet-20241022",
+            content = _anthropic_completion(
+                client,
+                prompt,
                 max_tokens=2000,
-                system="You are an enterprise Account Executive at Cursor (product-led growth company) selling developer tools to engineering teams. Write direct, sharp, professional emails with zero placeholders. Cursor uses PLG - focus on activation, expansion, and helping existing/trial users get more value, not pure cold discovery. Target tactical, implementation-focused engineering leaders (Head of Engineering, VP Engineering, Developer Experience Lead, Platform Lead, Engineering Productivity), NOT strategic execs. Be concrete, specific, and opinionated about developer tools and engineering workflows. Avoid strategic/vague language. Assume the reader is smart and busy. Max 90 words per email. No hype, no pleasantries like 'hope you're well'. When mentioning competitors, explain how the product would be evaluated against them and what tradeoffs the persona would care about (speed vs accuracy, local vs cloud, snippets vs full repo context, etc.). CTAs must be value-driven comparisons or insights with tradeoffs, NOT generic meeting requests like 'would you be open to a call'.",
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                system=EMAIL_SYSTEM_PROMPT,
+                use_cache=use_cache
             )
-            content = message.content[0].text
             return parse_email_sequence(content, greeting)
         except Exception as e:
             return {"error": f"Anthropic API error: {str(e)}"}
@@ -440,6 +729,33 @@ LINKEDIN_MESSAGE: [short, natural LinkedIn message]"""
     return {"error": f"Unknown provider: {provider}"}
 
 
+def stream_email_sequence_with_llm(company: str, persona: str, persona_name: str,
+                                   company_info: Dict[str, any], competitors: List[str],
+                                   pain_points: List[str], provider: str = "openai",
+                                   use_cache: bool = True) -> Iterator[str]:
+    """
+    Stream the raw email-sequence response as it is generated.
+    
+    Join the chunks and pass them to parse_email_sequence for the same
+    result generate_email_sequence_with_llm returns.
+    
+    Args:
+        company: Company name
+        persona: Persona/role
+        persona_name: Name of the persona (if known)
+        company_info: Dictionary with company research data
+        competitors: List of competitors
+        pain_points: List of pain points for the persona
+        provider: LLM provider
+        use_cache: False to bypass the LLM response cache
+        
+    Yields:
+        Text chunks of the raw response
+    """
+    prompt = _email_sequence_prompt(company, persona, persona_name, company_info, competitors, pain_points)
+    yield from stream_completion(provider, prompt, max_tokens=2000, system=EMAIL_SYSTEM_PROMPT, use_cache=use_cache)
+
+
 def parse_email_sequence(content: str, greeting: str) -> Dict[str, str]:
     """Parse email sequence from LLM response."""
     result = {
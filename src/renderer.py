@@ -2,16 +2,49 @@
 Markdown renderer for account brief generation.
 """
 
+import functools
+import json
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
 
 from .prompts import format_competitors_display
-from .researcher import research_company, extract_why_now_triggers, get_persona_pain_points, generate_discovery_questions
+from .researcher import (
+    WHY_NOW_SNIPPETS, research_company, extract_why_now_triggers, get_persona_pain_points,
+    generate_discovery_questions
+)
 from .llm_researcher import enhance_brief_with_llm, generate_email_sequence_with_llm
 
+# Version of the section templates below; saved brief inputs record the
+# version they were generated with and are re-rendered with the current one
+# (2: empty optional Account Overview lines are omitted)
+BRIEF_TEMPLATE_VERSION = 2
+
+
+def email_company_info(llm_data: Dict[str, any]) -> Optional[Dict[str, any]]:
+    """
+    Company facts for LLM email generation.
+    
+    Args:
+        llm_data: Enhanced content from enhance_brief_with_llm
+        
+    Returns:
+        Company info dictionary, or None when there isn't enough company data
+        to write specific emails
+    """
+    if not (llm_data.get("company_description") or llm_data.get("company_recent_news") or llm_data.get("company_funding")):
+        return None
+    return {
+        "description": llm_data.get("company_description"),
+        "recent_news": llm_data.get("company_recent_news"),
+        "funding": llm_data.get("company_funding"),
+        "employees": llm_data.get("company_employees"),
+        "engineering_team": llm_data.get("company_engineering_team")
+    }
+
 
 def render_account_brief(company: str, persona: str, competitors: List[str], 
-                        use_research: bool = True, use_llm: bool = False, llm_provider: str = "openai") -> str:
+                        use_research: bool = True, use_llm: bool = False, llm_provider: str = "openai",
+                        use_llm_cache: bool = True) -> str:
     """
     Render a structured markdown account brief.
     
@@ -22,93 +55,172 @@ def render_account_brief(company: str, persona: str, competitors: List[str],
         use_research: Whether to use web research to populate the brief
         use_llm: Whether to use LLM to research persona names and enhance content
         llm_provider: LLM provider ("openai" or "anthropic")
+        use_llm_cache: Whether to reuse cached LLM responses for identical prompts
         
     Returns:
         A formatted markdown string containing the account brief
     """
-    competitors_display = format_competitors_display(competitors)
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     # LLM enhancement (optional)
     llm_data = {}
-    persona_name = None
-    company_description = None
-    company_employees = None
-    company_engineering_team = None
-    company_funding = None
-    company_revenue = None
-    company_headquarters = None
-    company_recent_news = None
-    company_tech_stack = None
-    company_differentiators = None
     email_sequences = {}
     
     if use_llm:
         try:
-            llm_data = enhance_brief_with_llm(company, persona, competitors, use_persona_research=True, provider=llm_provider)
-            persona_name = llm_data.get("persona_name")
-            company_description = llm_data.get("company_description")
-            company_employees = llm_data.get("company_employees")
-            company_engineering_team = llm_data.get("company_engineering_team")
-            company_funding = llm_data.get("company_funding")
-            company_revenue = llm_data.get("company_revenue")
-            company_headquarters = llm_data.get("company_headquarters")
-            company_recent_news = llm_data.get("company_recent_news")
-            company_tech_stack = llm_data.get("company_tech_stack")
-            company_differentiators = llm_data.get("company_differentiators")
+            llm_data = enhance_brief_with_llm(company, persona, competitors, use_persona_research=True,
+                                              provider=llm_provider, use_cache=use_llm_cache)
             
             # Generate real email sequences (no placeholders) if we have company data
-            if company_description or company_recent_news or company_funding:
-                company_info_dict = {
-                    "description": company_description,
-                    "recent_news": company_recent_news,
-                    "funding": company_funding,
-                    "employees": company_employees,
-                    "engineering_team": company_engineering_team
-                }
+            company_info_dict = email_company_info(llm_data)
+            if company_info_dict:
                 email_sequences = generate_email_sequence_with_llm(
-                    company, persona, persona_name or persona,
+                    company, persona, llm_data.get("persona_name") or persona,
                     company_info_dict, competitors,
                     get_persona_pain_points(persona) if use_research else [],
-                    provider=llm_provider
+                    provider=llm_provider,
+                    use_cache=use_llm_cache
                 )
         except Exception as e:
             print(f"Warning: LLM research failed: {e}", file=__import__('sys').stderr)
     
     # Research company if enabled
+    research_data = research_company(company) if use_research else None
+    
+    return assemble_account_brief(
+        company, persona, competitors, timestamp,
+        llm_data=llm_data,
+        email_sequences=email_sequences,
+        research_data=research_data,
+        use_llm=use_llm
+    )
+
+
+# Static section text is built once at import, and sections that depend only
+# on the persona and competitors are cached whole, since batch runs repeat
+# them. Per-brief slots are filled with f-strings, whose literal parts
+# CPython already compiles to constants (str.format re-parses each call).
+
+# Optional Account Overview lines after Competitors: (llm_data key, prefix, suffix), omitted when empty
+_OVERVIEW_DETAILS = (
+    ("company_headquarters", "**Headquarters:** ", ""),
+    ("company_employees", "**Company Size:** ", " employees"),
+    ("company_engineering_team", "**Engineering Team Size:** ", ""),
+    ("company_funding", "**Funding:** ", ""),
+    ("company_revenue", "**Revenue/ARR:** ", ""),
+    ("company_tech_stack", "**Technology Stack:** ", ""),
+    ("company_differentiators", "**Key Differentiators:** ", ""),
+)
+
+_PAIN_POINT_PLACEHOLDERS = (
+    "[Identify key challenges and pain points specific to the {persona} role]",
+    "[Common frustrations with current solutions or processes]",
+    "[Business impact of unresolved pain points]",
+)
+
+_DISCOVERY_QUESTION_PLACEHOLDERS = (
+    "[Question 1 - Focused on understanding current state or challenges]",
+    "[Question 2 - Exploring impact and business outcomes]",
+    "[Question 3 - Identifying decision-making process]",
+    "[Question 4 - Understanding competitive landscape or alternatives]",
+    "[Question 5 - Uncovering budget, timeline, or next steps]",
+)
+_DISCOVERY_QUESTIONS_PLACEHOLDER_SECTION = "## 5 Discovery Questions\n\n{}\n\n".format(
+    "\n".join(f"{i+1}. {q}" for i, q in enumerate(_DISCOVERY_QUESTION_PLACEHOLDERS))
+)
+
+_OBJECTION_HANDLING = """## Objection Handling
+
+### Common Objections & Responses
+
+**Objection 1: "We're not interested right now"**
+- Response: [Acknowledge, offer value, keep door open - e.g., "I understand timing might not be right. Would you be open to receiving relevant resources/insights in the meantime?"]
+
+**Objection 2: "We already have a solution"**
+- Response: [Acknowledge, differentiate, explore - e.g., "That's great you have something in place. Many {persona}s find value in understanding how we compare to {competitors_display}. Mind if I share a brief comparison?"]
+
+**Objection 3: "We don't have budget"**
+- Response: [Reframe, explore priorities, offer alternatives - e.g., "I appreciate the transparency. Often budget depends on priorities. What would need to change for this to become a priority?"]
+
+**Objection 4: "Send me information and I'll review it"**
+- Response: [Provide value, but also push for engagement - e.g., "Happy to send materials. Would a 15-minute call be helpful to ensure the info is most relevant to your situation?"]
+
+**Objection 5: "I need to discuss with my team"**
+- Response: [Support the process, offer to help, maintain momentum - e.g., "That makes sense. Would it be helpful if I joined that discussion or prepared materials you can share with your team?"]
+
+---
+
+"""
+
+
+def title_section(company: str) -> str:
+    """Brief title."""
+    return f"# Account Brief: {company}\n\n"
+
+
+def overview_section(company: str, persona: str, competitors_display: str,
+                     llm_data: Optional[Dict[str, any]] = None) -> str:
+    """Account Overview section, filled from LLM company research when available."""
+    llm_data = llm_data or {}
+    persona_name = llm_data.get("persona_name")
+    description = llm_data.get("company_description")
+    overview = f"## Account Overview\n\n**Company:** {company}\n"
+    if description:
+        overview += f"**Description:** {description}\n"
+    overview += f"**Target Persona:** {persona} ({persona_name})\n" if persona_name else f"**Target Persona:** {persona}\n"
+    overview += f"**Competitors:** {competitors_display}\n"
+    # Missing details are left out rather than leaving blank lines
+    for key, prefix, suffix in _OVERVIEW_DETAILS:
+        value = llm_data.get(key)
+        if value:
+            overview += f"{prefix}{value}{suffix}\n"
+    return overview + "\n"
+
+
+def why_now_section(company: str, research_data: Optional[Dict[str, any]]) -> str:
+    """Why Now Triggers section (placeholders when research is disabled)."""
+    if research_data is not None:
+        why_now = "\n".join(f"- {trigger}" for trigger in extract_why_now_triggers(company, research_data))
+    else:
+        why_now = (
+            f"- Research {company}'s recent funding, hiring, or expansion activities\n"
+            f"- Identify regulatory changes or market shifts affecting {company}\n"
+            "- Determine timing-related factors that make this a good time to reach out"
+        )
+    return f"## Why Now Triggers\n\n{why_now}\n\n"
+
+
+@functools.lru_cache(maxsize=256)
+def pain_points_section(persona: str, use_research: bool) -> str:
+    """Persona Pain Points section (placeholders when research is disabled)."""
     if use_research:
-        research_data = research_company(company)
-        why_now_triggers = extract_why_now_triggers(company, research_data)
         pain_points = get_persona_pain_points(persona)
-        discovery_questions = generate_discovery_questions(persona, company, competitors)
     else:
-        why_now_triggers = [
-            f"Research {company}'s recent funding, hiring, or expansion activities",
-            f"Identify regulatory changes or market shifts affecting {company}",
-            f"Determine timing-related factors that make this a good time to reach out"
-        ]
-        pain_points = [
-            f"[Identify key challenges and pain points specific to the {persona} role]",
-            f"[Common frustrations with current solutions or processes]",
-            f"[Business impact of unresolved pain points]"
-        ]
-        discovery_questions = [
-            f"[Question 1 - Focused on understanding current state or challenges]",
-            f"[Question 2 - Exploring impact and business outcomes]",
-            f"[Question 3 - Identifying decision-making process]",
-            f"[Question 4 - Understanding competitive landscape or alternatives]",
-            f"[Question 5 - Uncovering budget, timeline, or next steps]"
-        ]
-    
-    # Format sections
-    why_now_section = "\n".join(f"- {trigger}" for trigger in why_now_triggers)
-    pain_points_section = "\n".join(f"- {point}" for point in pain_points)
-    questions_section = "\n".join(f"{i+1}. {q}" for i, q in enumerate(discovery_questions))
-    
+        pain_points = [point.format(persona=persona) for point in _PAIN_POINT_PLACEHOLDERS]
+    pain_points_list = "\n".join(f"- {point}" for point in pain_points)
+    return f"## Persona Pain Points\n\n**Pain Points for {persona}:**\n{pain_points_list}\n\n"
+
+
+def discovery_questions_section(persona: str, company: str, competitors: List[str], use_research: bool) -> str:
+    """5 Discovery Questions section (placeholders when research is disabled)."""
+    if not use_research:
+        return _DISCOVERY_QUESTIONS_PLACEHOLDER_SECTION
+    discovery_questions = generate_discovery_questions(persona, company, competitors)
+    questions = "\n".join(f"{i+1}. {q}" for i, q in enumerate(discovery_questions))
+    return f"## 5 Discovery Questions\n\n{questions}\n\n"
+
+
+def email_sequence_section(company: str, persona: str, competitors_display: str,
+                           persona_name: Optional[str] = None,
+                           email_sequences: Optional[Dict[str, str]] = None,
+                           use_llm: bool = False) -> str:
+    """3-Email Outbound Sequence and LinkedIn message (templates unless LLM emails were generated)."""
     # Use persona name if found
     persona_display = persona_name if persona_name else persona
     greeting_name = persona_name if persona_name else "[First Name]"
     
+    email_sequences = email_sequences or {}
+    
     # Use generated emails if available, otherwise use templates
     use_generated_emails = use_llm and email_sequences and "error" not in email_sequences and email_sequences.get("email1_body")
     
@@ -208,61 +320,136 @@ Would love to share how we've helped other {persona}s. Open to a quick chat to s
 Best,
 [Your Name]"""
     
-    brief = f"""# Account Brief: {company}
-
-## Account Overview
-
-**Company:** {company}
-{f"**Description:** {company_description}" if company_description else ""}
-**Target Persona:** {persona}{f" ({persona_name})" if persona_name else ""}
-**Competitors:** {competitors_display}
-{f"**Headquarters:** {company_headquarters}" if company_headquarters else ""}
-{f"**Company Size:** {company_employees} employees" if company_employees else ""}
-{f"**Engineering Team Size:** {company_engineering_team}" if company_engineering_team else ""}
-{f"**Funding:** {company_funding}" if company_funding else ""}
-{f"**Revenue/ARR:** {company_revenue}" if company_revenue else ""}
-{f"**Technology Stack:** {company_tech_stack}" if company_tech_stack else ""}
-{f"**Key Differentiators:** {company_differentiators}" if company_differentiators else ""}
+    return f"## 3-Email Outbound Sequence\n{email_section}\n\n---\n\n"
 
-## Why Now Triggers
 
-{why_now_section}
+@functools.lru_cache(maxsize=256)
+def objection_handling_section(persona: str, competitors_display: str) -> str:
+    """Objection Handling section."""
+    return _OBJECTION_HANDLING.format(persona=persona, competitors_display=competitors_display)
 
-## Persona Pain Points
 
-**Pain Points for {persona}:**
-{pain_points_section}
+def footer_section(timestamp: str) -> str:
+    """Generation timestamp footer."""
+    return f"*Generated on {timestamp}*\n"
 
-## 5 Discovery Questions
 
-{questions_section}
-
-## 3-Email Outbound Sequence
-{email_section}
-
----
-
-## Objection Handling
-
-### Common Objections & Responses
-
-**Objection 1: "We're not interested right now"**
-- Response: [Acknowledge, offer value, keep door open - e.g., "I understand timing might not be right. Would you be open to receiving relevant resources/insights in the meantime?"]
-
-**Objection 2: "We already have a solution"**
-- Response: [Acknowledge, differentiate, explore - e.g., "That's great you have something in place. Many {persona}s find value in understanding how we compare to {competitors_display}. Mind if I share a brief comparison?"]
-
-**Objection 3: "We don't have budget"**
-- Response: [Reframe, explore priorities, offer alternatives - e.g., "I appreciate the transparency. Often budget depends on priorities. What would need to change for this to become a priority?"]
-
-**Objection 4: "Send me information and I'll review it"**
-- Response: [Provide value, but also push for engagement - e.g., "Happy to send materials. Would a 15-minute call be helpful to ensure the info is most relevant to your situation?"]
-
-**Objection 5: "I need to discuss with my team"**
-- Response: [Support the process, offer to help, maintain momentum - e.g., "That makes sense. Would it be helpful if I joined that discussion or prepared materials you can share with your team?"]
+def assemble_account_brief(company: str, persona: str, competitors: List[str], timestamp: str,
+                           llm_data: Optional[Dict[str, any]] = None,
+                           email_sequences: Optional[Dict[str, str]] = None,
+                           research_data: Optional[Dict[str, any]] = None,
+                           use_llm: bool = False) -> str:
+    """
+    Build the brief Markdown from already-gathered research.
+    
+    Args:
+        company: The company name
+        persona: The target persona
+        competitors: List of competitor names
+        timestamp: Generation timestamp shown in the footer
+        llm_data: Enhanced content from enhance_brief_with_llm (empty if LLM is off)
+        email_sequences: Parsed LLM email sequence (empty if not generated)
+        research_data: Web research from research_company, or None when
+            research is disabled (template placeholders are used instead)
+        use_llm: Whether LLM enhancement was requested
+        
+    Returns:
+        A formatted markdown string containing the account brief
+    """
+    llm_data = llm_data or {}
+    competitors_display = format_competitors_display(competitors)
+    use_research = research_data is not None
+    
+    return "".join([
+        title_section(company),
+        overview_section(company, persona, competitors_display, llm_data),
+        why_now_section(company, research_data),
+        pain_points_section(persona, use_research),
+        discovery_questions_section(persona, company, competitors, use_research),
+        email_sequence_section(company, persona, competitors_display, llm_data.get("persona_name"),
+                               email_sequences, use_llm),
+        objection_handling_section(persona, competitors_display),
+        footer_section(timestamp),
+    ])
+
+
+# Fields of llm_data and email_sequences the templates read
+_LLM_FIELDS = ("persona_name", "company_description") + tuple(key for key, _, _ in _OVERVIEW_DETAILS)
+_EMAIL_FIELDS = (
+    "error", "email1_subject", "email1_body", "email2_subject", "email2_body",
+    "email3_subject", "email3_body", "linkedin_message",
+)
+
+
+def brief_inputs(company: str, persona: str, competitors: List[str], timestamp: str,
+                 llm_data: Optional[Dict[str, any]] = None,
+                 email_sequences: Optional[Dict[str, str]] = None,
+                 research_data: Optional[Dict[str, any]] = None,
+                 use_llm: bool = False) -> Dict[str, any]:
+    """
+    Everything assemble_account_brief needs to rebuild a brief, as a
+    JSON-serializable dictionary (see render_brief_inputs).
+    
+    Only the fields the templates read are kept: the LLM fields shown in
+    the overview, the email sequence texts, and the research snippets the
+    why-now triggers look at, not every web result.
+    
+    Args are those of assemble_account_brief.
+    
+    Returns:
+        Dictionary of the brief's variable inputs plus "template_version"
+    """
+    llm_data = llm_data or {}
+    email_sequences = email_sequences or {}
+    return {
+        "template_version": BRIEF_TEMPLATE_VERSION,
+        "company": company,
+        "persona": persona,
+        "competitors": list(competitors),
+        "timestamp": timestamp,
+        "llm_data": {key: llm_data[key] for key in _LLM_FIELDS if llm_data.get(key)},
+        "email_sequences": {key: email_sequences[key] for key in _EMAIL_FIELDS if key in email_sequences},
+        "research_data": (
+            {"all_snippets": research_data.get("all_snippets", [])[:WHY_NOW_SNIPPETS]}
+            if research_data is not None else None
+        ),
+        "use_llm": use_llm,
+    }
+
+
+def render_brief_inputs(inputs: Dict[str, any]) -> str:
+    """
+    Re-render a brief from brief_inputs with the current templates.
+    
+    Only the already-gathered research in inputs is used, so this never
+    touches the network or an LLM, and the same inputs always give the same
+    Markdown. Recent renders are cached.
+    
+    Args:
+        inputs: Dictionary from brief_inputs (possibly from an older template version)
+        
+    Returns:
+        A formatted markdown string containing the account brief
+    """
+    return _render_inputs_json(json.dumps(inputs, sort_keys=True))
 
----
 
-*Generated on {timestamp}*
-"""
-    return brief
+def render_brief_inputs_json(inputs_json: str) -> str:
+    """
+    render_brief_inputs for inputs already serialized as
+    json.dumps(inputs, sort_keys=True), as the briefs database stores them,
+    skipping a parse and re-serialize per read.
+    """
+    return _render_inputs_json(inputs_json)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_inputs_json(inputs_json: str) -> str:
+    inputs = json.loads(inputs_json)
+    return assemble_account_brief(
+        inputs["company"], inputs["persona"], inputs["competitors"], inputs["timestamp"],
+        llm_data=inputs.get("llm_data"),
+        email_sequences=inputs.get("email_sequences"),
+        research_data=inputs.get("research_data"),
+        use_llm=inputs.get("use_llm", False)
+    )
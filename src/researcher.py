@@ -3,8 +3,14 @@ Web research module for gathering account information.
 """
 
 import re
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Dict, List, Optional
 
+from .search_cache import get_search_cache, get_search_cache_mode
+
 try:
     from duckduckgo_search import DDGS
     DDGS_AVAILABLE = True
@@ -12,55 +18,105 @@ except ImportError:
     DDGS_AVAILABLE = False
 
 
-def search_web(query: str, max_results: int = 5) -> List[Dict[str, str]]:
+# Default seconds for one search and for all of research_company
+QUERY_TIMEOUT = 8.0
+RESEARCH_DEADLINE = 12.0
+
+# Leading research snippets extract_why_now_triggers looks at
+WHY_NOW_SNIPPETS = 5
+
+# One DDGS client per worker thread: the client wraps an HTTP session that
+# isn't safe to share between concurrent searches
+_local = threading.local()
+
+# Shared, never shut down: a search that misses the deadline finishes in the
+# background instead of blocking the caller
+_search_executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="web-research")
+
+
+def _get_ddgs(timeout: float = QUERY_TIMEOUT, fresh: bool = False):
+    """Get this thread's DDGS client, creating it on first use (or when fresh or the timeout changes)."""
+    if fresh or getattr(_local, "ddgs_timeout", None) != timeout:
+        _local.ddgs = DDGS(timeout=timeout)
+        _local.ddgs_timeout = timeout
+    return _local.ddgs
+
+
+def _format_results(search_results) -> List[Dict[str, str]]:
+    """Map DDGS results to title/url/body dictionaries."""
+    return [
+        {
+            'title': result.get('title', ''),
+            'url': result.get('href', ''),
+            'body': result.get('body', '')
+        }
+        for result in search_results or []
+    ]
+
+
+def search_web(query: str, max_results: int = 5, timeout: float = QUERY_TIMEOUT) -> List[Dict[str, str]]:
     """
     Search the web using DuckDuckGo (no API key required).
     
     Args:
         query: Search query string
         max_results: Maximum number of results to return
+        timeout: HTTP timeout in seconds for the search request
         
     Returns:
         List of dictionaries with 'title', 'url', and 'body' keys
     """
-    if not DDGS_AVAILABLE:
+    replay = get_search_cache_mode() == "replay"
+    # A broken cache (locked, unreadable or corrupt file) counts as a miss
+    try:
+        cache = get_search_cache()
+    except Exception as e:
+        print(f"Warning: Search cache unavailable: {e}", file=sys.stderr)
+        cache = None
+    if cache is not None:
+        try:
+            cached = cache.get(query, max_results, allow_expired=replay)
+        except Exception as e:
+            print(f"Warning: Search cache read failed: {e}", file=sys.stderr)
+            cached = None
+        if cached is not None:
+            return cached
+    
+    if replay or not DDGS_AVAILABLE:
         return []
     
     try:
-        results = []
-        with DDGS() as ddgs:
-            search_results = ddgs.text(query, max_results=max_results)
-            for result in search_results:
-                results.append({
-                    'title': result.get('title', ''),
-                    'url': result.get('href', ''),
-                    'body': result.get('body', '')
-                })
-        return results
-    except Exception as e:
-        # Try alternative approach if DDGS context manager fails
+        results = _format_results(_get_ddgs(timeout).text(query, max_results=max_results))
+    except Exception:
+        # The client may be in a bad state; retry once with a new one
         try:
-            ddgs = DDGS()
-            search_results = ddgs.text(query, max_results=max_results)
-            results = []
-            for result in search_results:
-                results.append({
-                    'title': result.get('title', ''),
-                    'url': result.get('href', ''),
-                    'body': result.get('body', '')
-                })
-            return results
+            results = _format_results(_get_ddgs(timeout, fresh=True).text(query, max_results=max_results))
         except Exception as e2:
-            print(f"Warning: Web search failed: {e2}", file=__import__('sys').stderr)
+            print(f"Warning: Web search failed: {e2}", file=sys.stderr)
             return []
+    
+    # Empty results are often transient (rate limiting), so they aren't cached
+    if cache is not None and results:
+        try:
+            cache.put(query, max_results, results)
+        except Exception as e:
+            print(f"Warning: Search cache write failed: {e}", file=sys.stderr)
+    return results
 
 
-def research_company(company: str) -> Dict[str, any]:
+def research_company(company: str, query_timeout: float = QUERY_TIMEOUT,
+                     deadline: float = RESEARCH_DEADLINE) -> Dict[str, any]:
     """
     Research a company and gather relevant information.
     
+    News, funding and description searches run concurrently. A search that
+    hasn't finished within query_timeout of starting, or by the overall
+    deadline, contributes no results; the others are still returned.
+    
     Args:
         company: Company name
+        query_timeout: Seconds to wait for any single search
+        deadline: Seconds to wait for all searches together
         
     Returns:
         Dictionary with researched information
@@ -73,19 +129,45 @@ def research_company(company: str) -> Dict[str, any]:
         'all_snippets': []
     }
     
-    # Search for recent news
-    news_query = f"{company} news 2024"
-    research_data['recent_news'] = search_web(news_query, max_results=5)
-    
-    # Search for funding information
-    funding_query = f"{company} funding investment raised"
-    funding_results = search_web(funding_query, max_results=3)
-    research_data['funding_info'] = funding_results
+    queries = {
+        'recent_news': (f"{company} news 2024", 5),
+        'funding_info': (f"{company} funding investment raised", 3),
+        'description': (f"{company} company about", 3),
+    }
+    started = {}
+
+    def run(key, query, max_results):
+        started[key] = time.monotonic()
+        return search_web(query, max_results, query_timeout)
+
+    futures = {
+        _search_executor.submit(run, key, query, max_results): key
+        for key, (query, max_results) in queries.items()
+    }
     
-    # Search for company description/about
-    desc_query = f"{company} company about"
-    desc_results = search_web(desc_query, max_results=3)
-    research_data['description'] = desc_results
+    # query_timeout runs from when each search starts (it may queue behind
+    # other callers' searches); deadline runs from now for the whole call.
+    # A search not started yet can't time out before now + query_timeout,
+    # so waking at that point never misses its limit.
+    end = time.monotonic() + deadline
+    pending = set(futures)
+    while pending:
+        now = time.monotonic()
+        for future in [f for f in pending if f.done()]:
+            pending.discard(future)
+            research_data[futures[future]] = future.result()
+        expired = [
+            f for f in pending
+            if now >= end or (futures[f] in started and now >= started[futures[f]] + query_timeout)
+        ]
+        for future in expired:
+            pending.discard(future)
+            print(f"Warning: Web search for {futures[future]} timed out", file=sys.stderr)
+            research_data[futures[future]] = []
+        if not pending:
+            break
+        wake = min([end] + [started.get(futures[f], now) + query_timeout for f in pending])
+        wait(pending, timeout=max(wake - now, 0), return_when=FIRST_COMPLETED)
     
     # Collect all snippets for context
     all_snippets = []
@@ -112,7 +194,7 @@ def extract_why_now_triggers(company: str, research_data: Dict[str, any]) -> Lis
     snippets = research_data.get('all_snippets', [])
     
     if snippets:
-        combined_text = ' '.join(snippets[:5]).lower()  # Use first 5 snippets
+        combined_text = ' '.join(snippets[:WHY_NOW_SNIPPETS]).lower()
         
         # Look for funding keywords
         funding_keywords = ['funding', 'raised', 'investment', 'series', 'funded', 'million', 'billion', '$']
@@ -3,7 +3,11 @@ ROI Calculator for Cursor developer productivity.
 Deterministic calculations - no LLM required.
 """
 
-from .schemas import ROIInputs, ROIOutputs
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .schemas import ROIInputs, ROIOutputs, ParameterDistribution, ROISimulationOutputs
 
 
 def calculate_roi(inputs: ROIInputs) -> ROIOutputs:
@@ -49,3 +53,272 @@ def calculate_roi(inputs: ROIInputs) -> ROIOutputs:
         net_annual_value=round(net_annual_value, 2),
         payback_months=round(payback_months, 2) if payback_months != float('inf') else float('inf')
     )
+
+
+# Column defaults mirror the ROIInputs field defaults
+_BATCH_DEFAULTS = {
+    "fully_loaded_cost_per_engineer": 220000.0,
+    "adoption_rate": 0.7,
+    "weeks_per_year": 48,
+}
+
+# (min, max) bounds mirror the ROIInputs field constraints
+_BATCH_BOUNDS = {
+    "team_size_engineering": (1, None),
+    "fully_loaded_cost_per_engineer": (0, None),
+    "hours_saved_per_engineer_per_week": (0, None),
+    "adoption_rate": (0, 1),
+    "weeks_per_year": (1, 52),
+    "cursor_annual_cost": (0, None),
+}
+
+
+def inputs_to_columns(inputs_list: List[ROIInputs]) -> Dict[str, np.ndarray]:
+    """
+    Convert a list of ROIInputs into columnar arrays for calculate_roi_batch.
+    
+    Args:
+        inputs_list: List of validated ROI inputs
+        
+    Returns:
+        Dictionary mapping ROIInputs field names to float64 arrays
+    """
+    return {
+        field: np.array([getattr(inputs, field) for inputs in inputs_list], dtype=np.float64)
+        for field in _BATCH_BOUNDS
+    }
+
+
+def _round_like_python(values: np.ndarray, ndigits: int = 2) -> np.ndarray:
+    """
+    Round an array exactly the way the builtin round() does.
+    
+    np.round scales by 10**ndigits before rounding, which can disagree with the
+    builtin on values sitting right at a half-way point. Those few elements are
+    re-rounded with the builtin so batch results match calculate_roi exactly.
+    """
+    rounded = np.round(values, ndigits)
+    scaled = values * (10 ** ndigits)
+    with np.errstate(invalid="ignore"):
+        near_half = np.isfinite(values) & (np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6)
+    for i in np.flatnonzero(near_half):
+        rounded[i] = round(float(values[i]), ndigits)
+    return rounded
+
+
+def calculate_roi_batch(inputs: Union[List[ROIInputs], Dict[str, Sequence[float]]]) -> Dict[str, np.ndarray]:
+    """
+    Calculate ROI metrics for many accounts at once with vectorized math.
+    
+    Produces the same values as calling calculate_roi on each row, including
+    payback_months = inf when there are no savings, without building a
+    pydantic model per row.
+    
+    Args:
+        inputs: Either a list of ROIInputs or a dictionary of columnar arrays
+            keyed by ROIInputs field names. Columns with a default on ROIInputs
+            may be omitted.
+        
+    Returns:
+        Dictionary mapping ROIOutputs field names to float64 arrays
+        
+    Raises:
+        ValueError: If columns are missing, have mismatched lengths, or hold
+            values outside the ROIInputs constraints
+    """
+    if isinstance(inputs, list):
+        columns = inputs_to_columns(inputs)
+    else:
+        columns = {}
+        for field in _BATCH_BOUNDS:
+            if field in inputs:
+                columns[field] = np.asarray(inputs[field], dtype=np.float64)
+            elif field not in _BATCH_DEFAULTS:
+                raise ValueError(f"Missing required ROI input column: {field}")
+        
+        lengths = {column.shape for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("ROI input columns must all have the same length")
+        shape = lengths.pop()
+        
+        for field, default in _BATCH_DEFAULTS.items():
+            if field not in columns:
+                columns[field] = np.full(shape, default, dtype=np.float64)
+        
+        for field, (minimum, maximum) in _BATCH_BOUNDS.items():
+            column = columns[field]
+            if np.isnan(column).any():
+                raise ValueError(f"ROI input column {field} contains NaN")
+            if minimum is not None and (column < minimum).any():
+                raise ValueError(f"ROI input column {field} must be >= {minimum}")
+            if maximum is not None and (column > maximum).any():
+                raise ValueError(f"ROI input column {field} must be <= {maximum}")
+    
+    team_size = columns["team_size_engineering"]
+    weeks_per_year = columns["weeks_per_year"]
+    cursor_annual_cost = columns["cursor_annual_cost"]
+    
+    # Same operation order as calculate_roi so results are bit-for-bit identical
+    annual_hours_saved = (
+        team_size
+        * columns["hours_saved_per_engineer_per_week"]
+        * columns["adoption_rate"]
+        * weeks_per_year
+    )
+    
+    hours_per_week_per_engineer = 40
+    annual_hours_per_engineer = weeks_per_year * hours_per_week_per_engineer
+    equivalent_engineers_saved = annual_hours_saved / annual_hours_per_engineer
+    annual_cost_saved = equivalent_engineers_saved * columns["fully_loaded_cost_per_engineer"]
+    
+    net_annual_value = annual_cost_saved - cursor_annual_cost
+    
+    has_savings = annual_cost_saved > 0
+    payback_months = np.full(annual_cost_saved.shape, np.inf)
+    np.divide(cursor_annual_cost, annual_cost_saved, out=payback_months, where=has_savings)
+    payback_months[has_savings] *= 12
+    
+    return {
+        "annual_hours_saved": _round_like_python(annual_hours_saved),
+        "annual_cost_saved": _round_like_python(annual_cost_saved),
+        "net_annual_value": _round_like_python(net_annual_value),
+        "payback_months": _round_like_python(payback_months),
+    }
+
+
+def batch_to_outputs(batch: Dict[str, np.ndarray]) -> List[ROIOutputs]:
+    """
+    Convert calculate_roi_batch results back into ROIOutputs models.
+    
+    Args:
+        batch: Columnar results from calculate_roi_batch
+        
+    Returns:
+        List of ROIOutputs, one per row
+    """
+    fields = list(batch)
+    return [
+        ROIOutputs(**{field: float(value) for field, value in zip(fields, row)})
+        for row in zip(*(batch[field].tolist() for field in fields))
+    ]
+
+
+def _sample_distribution(
+    distribution: Optional[ParameterDistribution],
+    fallback: float,
+    bounds: tuple,
+    samples: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Draw samples for one ROI input, clipped to its ROIInputs bounds.
+    
+    Args:
+        distribution: Distribution to sample from (None = fixed at fallback)
+        fallback: Point estimate from ROIInputs
+        bounds: (min, max) allowed for the input, None for unbounded
+        samples: Number of samples to draw
+        rng: NumPy random generator
+        
+    Returns:
+        Array of samples
+    """
+    if distribution is None or distribution.kind == "fixed":
+        value = fallback if distribution is None or distribution.value is None else distribution.value
+        drawn = np.full(samples, value, dtype=np.float64)
+    elif distribution.kind == "uniform":
+        if distribution.low is None or distribution.high is None:
+            raise ValueError("Uniform distribution requires low and high")
+        drawn = rng.uniform(distribution.low, distribution.high, samples)
+    elif distribution.kind == "triangular":
+        if distribution.low is None or distribution.high is None:
+            raise ValueError("Triangular distribution requires low and high")
+        if distribution.low > distribution.high:
+            raise ValueError("Triangular distribution requires low <= high")
+        if distribution.mode is not None:
+            if not distribution.low <= distribution.mode <= distribution.high:
+                raise ValueError("Triangular distribution requires low <= mode <= high")
+            mode = distribution.mode
+        else:
+            # The point estimate may lie outside the range; use the nearest end
+            mode = min(max(fallback, distribution.low), distribution.high)
+        if distribution.low == distribution.high:
+            drawn = np.full(samples, distribution.low, dtype=np.float64)
+        else:
+            drawn = rng.triangular(distribution.low, mode, distribution.high, samples)
+    else:
+        if distribution.std is None:
+            raise ValueError("Normal distribution requires std")
+        mean = distribution.value if distribution.value is not None else fallback
+        drawn = rng.normal(mean, distribution.std, samples)
+        if distribution.low is not None or distribution.high is not None:
+            drawn = np.clip(drawn, distribution.low, distribution.high)
+    
+    minimum, maximum = bounds
+    return np.clip(drawn, minimum, maximum)
+
+
+def simulate_roi(
+    inputs: ROIInputs,
+    adoption_rate: Optional[ParameterDistribution] = None,
+    hours_saved_per_engineer_per_week: Optional[ParameterDistribution] = None,
+    fully_loaded_cost_per_engineer: Optional[ParameterDistribution] = None,
+    samples: int = 100_000,
+    percentiles: Sequence[float] = (5, 25, 50, 75, 95),
+    seed: Optional[int] = None
+) -> ROISimulationOutputs:
+    """
+    Run a Monte Carlo ROI simulation over uncertain inputs.
+    
+    Inputs without a distribution stay fixed at their ROIInputs value. All
+    samples are drawn and evaluated in one vectorized calculate_roi_batch call.
+    
+    Args:
+        inputs: Point-estimate ROI inputs
+        adoption_rate: Distribution for adoption rate (clipped to 0-1)
+        hours_saved_per_engineer_per_week: Distribution for hours saved (clipped to >= 0)
+        fully_loaded_cost_per_engineer: Distribution for engineer cost (clipped to >= 0)
+        samples: Number of samples to draw
+        percentiles: Percentiles to report (0-100)
+        seed: Optional random seed for reproducible results
+        
+    Returns:
+        ROISimulationOutputs with percentiles of net annual value and payback
+    """
+    if samples < 1:
+        raise ValueError("samples must be at least 1")
+    
+    rng = np.random.default_rng(seed)
+    columns = {
+        "team_size_engineering": np.full(samples, inputs.team_size_engineering, dtype=np.float64),
+        "weeks_per_year": np.full(samples, inputs.weeks_per_year, dtype=np.float64),
+        "cursor_annual_cost": np.full(samples, inputs.cursor_annual_cost, dtype=np.float64),
+        "adoption_rate": _sample_distribution(
+            adoption_rate, inputs.adoption_rate,
+            _BATCH_BOUNDS["adoption_rate"], samples, rng
+        ),
+        "hours_saved_per_engineer_per_week": _sample_distribution(
+            hours_saved_per_engineer_per_week, inputs.hours_saved_per_engineer_per_week,
+            _BATCH_BOUNDS["hours_saved_per_engineer_per_week"], samples, rng
+        ),
+        "fully_loaded_cost_per_engineer": _sample_distribution(
+            fully_loaded_cost_per_engineer, inputs.fully_loaded_cost_per_engineer,
+            _BATCH_BOUNDS["fully_loaded_cost_per_engineer"], samples, rng
+        ),
+    }
+    results = calculate_roi_batch(columns)
+    
+    percentiles = [float(p) for p in percentiles]
+    labels = [f"p{p:g}" for p in percentiles]
+    net_values = np.percentile(results["net_annual_value"], percentiles)
+    # Payback can be inf (no savings); interpolating between inf samples gives
+    # nan, so report the nearest actual sample instead
+    paybacks = np.percentile(results["payback_months"], percentiles, method="nearest")
+    
+    return ROISimulationOutputs(
+        samples=samples,
+        percentiles=percentiles,
+        net_annual_value={label: round(float(v), 2) for label, v in zip(labels, net_values)},
+        payback_months={label: round(float(v), 2) for label, v in zip(labels, paybacks)},
+        probability_positive_value=round(float((results["net_annual_value"] > 0).mean()), 4)
+    )
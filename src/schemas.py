@@ -3,7 +3,7 @@ Pydantic schemas for AE Copilot data models.
 """
 
 from datetime import datetime
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 from pydantic import BaseModel, Field
 
 
@@ -25,6 +25,28 @@ class ROIOutputs(BaseModel):
     payback_months: float = Field(description="Payback period in months")
 
 
+class ParameterDistribution(BaseModel):
+    """Probability distribution for an uncertain ROI input."""
+    kind: Literal["fixed", "uniform", "triangular", "normal"] = Field(
+        default="fixed",
+        description="Distribution family"
+    )
+    value: Optional[float] = Field(None, description="Value for fixed, mean for normal")
+    low: Optional[float] = Field(None, description="Lower bound (uniform/triangular, optional clip for normal)")
+    mode: Optional[float] = Field(None, description="Most likely value (triangular)")
+    high: Optional[float] = Field(None, description="Upper bound (uniform/triangular, optional clip for normal)")
+    std: Optional[float] = Field(None, ge=0, description="Standard deviation (normal)")
+
+
+class ROISimulationOutputs(BaseModel):
+    """Outputs from Monte Carlo ROI simulation."""
+    samples: int = Field(description="Number of Monte Carlo samples drawn")
+    percentiles: List[float] = Field(description="Percentiles reported (0-100)")
+    net_annual_value: Dict[str, float] = Field(description="Net annual value by percentile label, e.g. 'p50'")
+    payback_months: Dict[str, float] = Field(description="Payback period by percentile label (inf = no payback)")
+    probability_positive_value: float = Field(description="Share of samples with positive net annual value")
+
+
 class EvidenceQuote(BaseModel):
     """Evidence quote with timestamp."""
     field_name: str = Field(description="Field name this evidence supports")
@@ -0,0 +1,231 @@
+"""
+Disk-backed cache for web search results - compressed SQLite entries with a
+TTL, size-bounded LRU eviction and an offline replay-only mode.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+
+DEFAULT_CACHE_PATH = Path("data") / "search_cache.db"
+
+# "on": read and record, "off": always search live, "replay": cache only, no network
+CACHE_MODES = ("on", "off", "replay")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query for cache keys (case and whitespace insensitive)."""
+    return re.sub(r"\s+", " ", query.strip().lower())
+
+
+class SearchCache:
+    """
+    SQLite cache of search results keyed by (query, max_results).
+
+    Results are stored as zlib-compressed JSON. Lookups refresh an entry's
+    last-access time; once more than max_entries are stored the least
+    recently used are evicted.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = 86400.0,
+        max_entries: int = 5000
+    ):
+        """
+        Initialize search cache.
+
+        Args:
+            db_path: SQLite file (shared by CLI and Streamlit runs)
+            ttl_seconds: Seconds an entry is served before searching again
+            max_entries: Entries kept before least recently used are evicted
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "writes": 0, "evictions": 0}
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    query TEXT NOT NULL,
+                    max_results INTEGER NOT NULL,
+                    results BLOB NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (query, max_results)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_search_cache_accessed ON search_cache(accessed_at)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing and closing on exit."""
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._lock:
+            self._stats[stat] += amount
+
+    def get(self, query: str, max_results: int, allow_expired: bool = False) -> Optional[List[Dict[str, str]]]:
+        """
+        Look up cached results.
+
+        Args:
+            query: Search query
+            max_results: Result limit the search was made with
+            allow_expired: Return entries past their TTL (used for replay)
+
+        Returns:
+            Cached results, or None on a miss
+        """
+        key = normalize_query(query)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT results, fetched_at FROM search_cache WHERE query = ? AND max_results = ?",
+                (key, max_results)
+            ).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            if not allow_expired and time.time() - row[1] >= self.ttl_seconds:
+                self._count("expired")
+                self._count("misses")
+                return None
+            conn.execute(
+                "UPDATE search_cache SET accessed_at = ? WHERE query = ? AND max_results = ?",
+                (time.time(), key, max_results)
+            )
+
+        self._count("hits")
+        return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+
+    def put(self, query: str, max_results: int, results: List[Dict[str, str]]):
+        """
+        Store results, evicting least recently used entries over capacity.
+
+        Args:
+            query: Search query
+            max_results: Result limit the search was made with
+            results: Results from search_web
+        """
+        now = time.time()
+        payload = zlib.compress(json.dumps(results).encode("utf-8"))
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache (query, max_results, results, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (normalize_query(query), max_results, payload, now, now)
+            )
+            evicted = conn.execute(
+                "DELETE FROM search_cache WHERE rowid IN ("
+                "SELECT rowid FROM search_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            ).rowcount
+        self._count("writes")
+        if evicted > 0:
+            self._count("evictions", evicted)
+
+    def clear(self):
+        """Delete every cached entry."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM search_cache")
+
+    def stats(self) -> Dict:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dictionary with hits, misses, expired, writes, evictions,
+            entries and bytes (compressed payload size)
+        """
+        with self._connect() as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(results)), 0) FROM search_cache"
+            ).fetchone()
+        with self._lock:
+            stats = dict(self._stats)
+        stats["entries"] = entries
+        stats["bytes"] = size
+        return stats
+
+
+_cache: Optional[SearchCache] = None
+_cache_mode = os.getenv("SEARCH_CACHE_MODE", "on").lower()
+_cache_lock = threading.Lock()
+
+
+def configure_search_cache(
+    mode: Optional[str] = None,
+    db_path: Optional[Union[str, Path]] = None,
+    ttl_seconds: Optional[float] = None,
+    max_entries: Optional[int] = None
+):
+    """
+    Configure the process-wide search cache used by researcher.search_web.
+
+    Unset arguments fall back to SEARCH_CACHE_MODE, SEARCH_CACHE_PATH,
+    SEARCH_CACHE_TTL and SEARCH_CACHE_MAX_ENTRIES, then to the defaults.
+
+    Args:
+        mode: "on", "off" or "replay" (cached results only, never the network)
+        db_path: SQLite file
+        ttl_seconds: Entry TTL in seconds
+        max_entries: LRU capacity
+    """
+    global _cache, _cache_mode
+    mode = (mode or os.getenv("SEARCH_CACHE_MODE", "on")).lower()
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Search cache mode must be one of: {', '.join(CACHE_MODES)}")
+
+    with _cache_lock:
+        _cache_mode = mode
+        _cache = _build_cache(db_path, ttl_seconds, max_entries) if mode != "off" else None
+
+
+def _build_cache(
+    db_path: Optional[Union[str, Path]] = None,
+    ttl_seconds: Optional[float] = None,
+    max_entries: Optional[int] = None
+) -> SearchCache:
+    """Create a SearchCache, filling unset arguments from the environment."""
+    return SearchCache(
+        db_path=db_path or os.getenv("SEARCH_CACHE_PATH", str(DEFAULT_CACHE_PATH)),
+        ttl_seconds=ttl_seconds if ttl_seconds is not None else float(os.getenv("SEARCH_CACHE_TTL", "86400")),
+        max_entries=max_entries if max_entries is not None else int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "5000"))
+    )
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """
+    Get the process-wide search cache, creating it from the environment on first use.
+
+    Returns:
+        SearchCache, or None when caching is off
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None and _cache_mode != "off":
+            _cache = _build_cache()
+        return _cache
+
+
+def get_search_cache_mode() -> str:
+    """Current search cache mode ("on", "off" or "replay")."""
+    return _cache_mode
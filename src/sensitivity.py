@@ -0,0 +1,220 @@
+"""
+ROI sensitivity analysis - precomputed what-if grids and tornado charts.
+Every grid is computed in one vectorized calculate_roi_batch pass and cached
+by the inputs that are held fixed, so UI what-if changes become lookups.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .schemas import ROIInputs, ROIOutputs
+from .roi_calculator import calculate_roi_batch
+
+
+# Default axes match the ROI Calculator widget steps so slider values land on grid points
+DEFAULT_AXES = {
+    "adoption_rate": tuple(round(0.05 * i, 2) for i in range(21)),
+    "hours_saved_per_engineer_per_week": tuple(0.5 * i for i in range(41)),
+}
+
+GRID_FIELDS = [
+    "team_size_engineering",
+    "fully_loaded_cost_per_engineer",
+    "hours_saved_per_engineer_per_week",
+    "adoption_rate",
+    "weeks_per_year",
+    "cursor_annual_cost",
+]
+
+
+class SensitivityGrid:
+    """2-D ROI surface over two inputs with the remaining inputs held fixed."""
+
+    def __init__(self, x_field: str, y_field: str, x_values: np.ndarray,
+                 y_values: np.ndarray, results: Dict[str, np.ndarray]):
+        """
+        Initialize sensitivity grid.
+
+        Args:
+            x_field: ROIInputs field varied along columns
+            y_field: ROIInputs field varied along rows
+            x_values: Column axis values
+            y_values: Row axis values
+            results: ROIOutputs field name -> array of shape (len(y_values), len(x_values))
+        """
+        self.x_field = x_field
+        self.y_field = y_field
+        self.x_values = x_values
+        self.y_values = y_values
+        self.results = results
+
+    def _index(self, axis: np.ndarray, value: float) -> Optional[int]:
+        """Find the grid index for a value, or None if it is off-grid."""
+        i = int(np.searchsorted(axis, value))
+        for candidate in (i - 1, i):
+            if 0 <= candidate < len(axis) and np.isclose(axis[candidate], value):
+                return candidate
+        return None
+
+    def lookup(self, x: float, y: float) -> Optional[ROIOutputs]:
+        """
+        Look up precomputed ROI outputs for a grid point.
+
+        Args:
+            x: Value of x_field
+            y: Value of y_field
+
+        Returns:
+            ROIOutputs if (x, y) is on the grid, None otherwise
+        """
+        col = self._index(self.x_values, x)
+        row = self._index(self.y_values, y)
+        if col is None or row is None:
+            return None
+        return ROIOutputs(**{
+            field: float(values[row, col]) for field, values in self.results.items()
+        })
+
+    def table(self, metric: str = "net_annual_value") -> List[Dict]:
+        """
+        Flatten one metric into rows for display (one row per y value).
+
+        Args:
+            metric: ROIOutputs field to tabulate
+
+        Returns:
+            List of dicts keyed by y_field and formatted x values
+        """
+        rows = []
+        for row, y in enumerate(self.y_values):
+            entry = {self.y_field: float(y)}
+            for col, x in enumerate(self.x_values):
+                entry[f"{x:g}"] = float(self.results[metric][row, col])
+            rows.append(entry)
+        return rows
+
+
+@lru_cache(maxsize=64)
+def _cached_grid(fixed: Tuple[Tuple[str, float], ...], x_field: str, y_field: str,
+                 x_values: Tuple[float, ...], y_values: Tuple[float, ...]) -> SensitivityGrid:
+    """Compute a grid for hashable fixed inputs and axes (cached)."""
+    x_axis = np.asarray(x_values, dtype=np.float64)
+    y_axis = np.asarray(y_values, dtype=np.float64)
+    xx, yy = np.meshgrid(x_axis, y_axis)
+
+    columns = {field: np.full(xx.size, value, dtype=np.float64) for field, value in fixed}
+    columns[x_field] = xx.ravel()
+    columns[y_field] = yy.ravel()
+
+    flat = calculate_roi_batch(columns)
+    results = {field: values.reshape(xx.shape) for field, values in flat.items()}
+    return SensitivityGrid(x_field, y_field, x_axis, y_axis, results)
+
+
+def get_sensitivity_grid(
+    inputs: ROIInputs,
+    x_field: str = "adoption_rate",
+    y_field: str = "hours_saved_per_engineer_per_week",
+    x_values: Optional[Sequence[float]] = None,
+    y_values: Optional[Sequence[float]] = None
+) -> SensitivityGrid:
+    """
+    Get a (cached) sensitivity grid varying two inputs.
+
+    The cache key is the fields and axis values plus the inputs held fixed,
+    so editing x_field's or y_field's own input reuses the same grid, while
+    choosing a different axis pair computes a new one.
+
+    Args:
+        inputs: Current ROI inputs (x_field and y_field values are ignored)
+        x_field: ROIInputs field for the grid columns
+        y_field: ROIInputs field for the grid rows
+        x_values: Column axis values (defaults to DEFAULT_AXES)
+        y_values: Row axis values (defaults to DEFAULT_AXES)
+
+    Returns:
+        SensitivityGrid
+    """
+    if x_field not in GRID_FIELDS or y_field not in GRID_FIELDS or x_field == y_field:
+        raise ValueError(f"Grid axes must be two different ROI inputs: {', '.join(GRID_FIELDS)}")
+
+    if x_values is None:
+        x_values = DEFAULT_AXES.get(x_field)
+    if y_values is None:
+        y_values = DEFAULT_AXES.get(y_field)
+    if x_values is None or y_values is None:
+        raise ValueError("Axis values are required for inputs without a default axis")
+
+    fixed = tuple(
+        (field, float(getattr(inputs, field)))
+        for field in GRID_FIELDS
+        if field not in (x_field, y_field)
+    )
+    return _cached_grid(
+        fixed, x_field, y_field,
+        tuple(sorted(float(v) for v in x_values)),
+        tuple(sorted(float(v) for v in y_values))
+    )
+
+
+def tornado_analysis(inputs: ROIInputs, swing: float = 0.2,
+                     metric: str = "net_annual_value") -> List[Dict]:
+    """
+    One-at-a-time sensitivity of a metric to each ROI input.
+
+    Each input is moved down and up by `swing` (clipped to its valid range)
+    while the others stay fixed. All scenarios run in one batch call.
+
+    Args:
+        inputs: Baseline ROI inputs
+        swing: Relative change applied to each input (0.2 = +/-20%)
+        metric: ROIOutputs field to measure
+
+    Returns:
+        List of dicts with field, low/high input values and metric values,
+        sorted by impact (largest spread first)
+    """
+    baseline = {field: float(getattr(inputs, field)) for field in GRID_FIELDS}
+    bounds = {
+        "team_size_engineering": (1, None),
+        "adoption_rate": (0, 1),
+        "weeks_per_year": (1, 52),
+    }
+
+    scenarios = []
+    for field in GRID_FIELDS:
+        minimum, maximum = bounds.get(field, (0, None))
+        for factor in (1 - swing, 1 + swing):
+            value = baseline[field] * factor
+            if field in ("team_size_engineering", "weeks_per_year"):
+                value = float(round(value))
+            value = max(value, minimum)
+            if maximum is not None:
+                value = min(value, maximum)
+            scenarios.append((field, value))
+
+    columns = {
+        field: np.array(
+            [value if scenario_field == field else baseline[field] for scenario_field, value in scenarios],
+            dtype=np.float64
+        )
+        for field in GRID_FIELDS
+    }
+    results = calculate_roi_batch(columns)[metric]
+
+    bars = []
+    for i, field in enumerate(GRID_FIELDS):
+        low_value, high_value = scenarios[2 * i][1], scenarios[2 * i + 1][1]
+        low_metric, high_metric = float(results[2 * i]), float(results[2 * i + 1])
+        bars.append({
+            "field": field,
+            "low_value": low_value,
+            "high_value": high_value,
+            "low_metric": low_metric,
+            "high_metric": high_metric,
+            "spread": abs(high_metric - low_metric),
+        })
+
+    return sorted(bars, key=lambda bar: bar["spread"], reverse=True)
@@ -0,0 +1,92 @@
+"""
+Compiled matcher for transcript keyword and regex signals.
+"""
+
+import re
+from typing import Dict, Iterable, Optional
+
+
+class SignalMatcher:
+    """
+    Finds keyword and regex signals in transcript text.
+
+    Keyword and pattern tables are compiled once and shared by every call.
+    Detection uses str.find for keywords and precompiled regexes for patterns.
+    Single-pass alternation and trie regexes (overlap-correct, checked
+    against str.find) measure about 2x slower in CPython's backtracking
+    engine; see scripts/benchmark_signal_matcher.py. Owner
+    resolution (which speaker turn or sentence first contains each signal)
+    is done against a TranscriptIndex.
+    """
+
+    def __init__(self, keywords: Iterable[str] = (), patterns: Iterable[str] = ()):
+        """
+        Compile the matcher.
+
+        Args:
+            keywords: Literal substrings to find
+            patterns: Regex patterns to find
+        """
+        self.keywords = list(dict.fromkeys(keywords))
+        self.patterns = list(dict.fromkeys(patterns))
+        self._compiled_patterns = {pattern: re.compile(pattern) for pattern in self.patterns}
+
+    def _offset(self, signal: str, text: str, start: int = 0) -> int:
+        """Return the first offset of a signal at or after start, or -1."""
+        compiled = self._compiled_patterns.get(signal)
+        if compiled is None:
+            return text.find(signal, start)
+        match = compiled.search(text, start)
+        return match.start() if match else -1
+
+    def first_offsets(self, text: str, wanted: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Find the first start offset of each signal in the text.
+
+        Args:
+            text: Text to scan (callers lowercase it for keyword matching)
+            wanted: Optional signals of interest (defaults to all signals)
+
+        Returns:
+            Dictionary mapping keyword or pattern -> first start offset, only
+            for signals that occur
+        """
+        signals = self.keywords + self.patterns if wanted is None else wanted
+        found: Dict[str, int] = {}
+        for signal in signals:
+            offset = self._offset(signal, text)
+            if offset >= 0:
+                found[signal] = offset
+        return found
+
+    def first_present(self, text: str, candidates: Iterable[str]) -> Optional[str]:
+        """
+        Return the first candidate (in priority order) that occurs in the text.
+
+        Lower-priority candidates are not scanned once a match is found.
+
+        Args:
+            text: Text to scan
+            candidates: Signals in priority order
+
+        Returns:
+            The first signal present, or None
+        """
+        for signal in candidates:
+            if self._offset(signal, text) >= 0:
+                return signal
+        return None
+
+    def match_at(self, pattern: str, text: str, offset: int = 0) -> Optional[re.Match]:
+        """
+        Run a single compiled pattern to read its capture groups.
+
+        Args:
+            pattern: One of the matcher's patterns
+            text: Text to search
+            offset: Offset to start searching from
+
+        Returns:
+            The first match at or after offset, or None
+        """
+        return self._compiled_patterns[pattern].search(text, offset)
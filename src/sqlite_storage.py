@@ -0,0 +1,352 @@
+"""
+SQLite storage backend for ROI calculators and business cases.
+
+Keeps ROI inputs/outputs, Gong signals, CRM context and business case text
+in indexed tables, so company/version/date queries and cross-company totals
+are single SQL statements. Enable with STORAGE_BACKEND=sqlite and copy an
+existing outputs/ tree in with:
+
+    python -m src.sqlite_storage --migrate
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from .storage import StorageBackend, sanitize_filename
+
+
+DEFAULT_DB_PATH = Path("data") / "artifacts.db"
+
+
+class SQLiteStorageBackend(StorageBackend):
+    """
+    Storage backend over two SQLite tables, roi_calculators and business_cases.
+
+    Each row is unique per (company_key, version). Saved artifacts are
+    identified by opaque ids such as "sqlite:roi_calculators/Acme-Corp/v3",
+    returned as file_path and accepted by the load methods; they are keys,
+    not files on disk. Paths from the file layout are accepted too.
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize SQLite storage.
+
+        Args:
+            db_path: SQLite file (default: STORAGE_DB_PATH or data/artifacts.db)
+        """
+        self.db_path = Path(db_path or os.getenv("STORAGE_DB_PATH", str(DEFAULT_DB_PATH)))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS roi_calculators (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    company TEXT NOT NULL,
+                    company_key TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    roi_inputs TEXT NOT NULL,
+                    roi_outputs TEXT NOT NULL,
+                    gong_signals TEXT,
+                    crm_context TEXT,
+                    net_annual_value REAL,
+                    annual_cost_saved REAL,
+                    annual_hours_saved REAL,
+                    payback_months REAL,
+                    UNIQUE (company_key, version)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_roi_created ON roi_calculators(created_at)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS business_cases (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    company TEXT NOT NULL,
+                    company_key TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    UNIQUE (company_key, version)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_business_cases_created ON business_cases(created_at)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection inside a write-locked transaction, committing and closing on exit."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        try:
+            # Lock up front so allocating MAX(version) + 1 can't race another writer
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        """Open a read connection, closing on exit."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _ref(table: str, company_key: str, version: int) -> str:
+        return f"sqlite:{table}/{company_key}/v{version}"
+
+    @staticmethod
+    def _parse_ref(file_path: str, table: Optional[str] = None) -> Tuple[str, int]:
+        """Company key and version from an artifact id (or a file layout path)."""
+        match = re.fullmatch(r"sqlite:(\w+)/([^/]+)/v(\d+)", str(file_path))
+        if match:
+            if table and match.group(1) != table:
+                raise ValueError(f"Not a {table} artifact id: {file_path}")
+            return match.group(2), int(match.group(3))
+        path = Path(file_path)
+        match = re.fullmatch(rf"{re.escape(path.parent.name)}-v(\d+)\.\w+", path.name)
+        if not match:
+            raise ValueError(f"Not a versioned artifact id or path: {file_path}")
+        return path.parent.name, int(match.group(1))
+
+    @staticmethod
+    def _insert_roi(conn: sqlite3.Connection, company_key: str, data: Dict, replace: bool = True):
+        outputs = data.get("roi_outputs") or {}
+
+        def dumps(value):
+            return json.dumps(value, default=str) if value is not None else None
+
+        conn.execute(
+            f"INSERT OR {'REPLACE' if replace else 'IGNORE'} INTO roi_calculators "
+            "(company, company_key, version, created_at, roi_inputs, roi_outputs, gong_signals, crm_context, "
+            "net_annual_value, annual_cost_saved, annual_hours_saved, payback_months) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (data.get("company_name", company_key), company_key, data.get("version", 1), data.get("created_at", ""),
+             dumps(data.get("roi_inputs") or {}), dumps(outputs), dumps(data.get("gong_signals")),
+             dumps(data.get("crm_context")), outputs.get("net_annual_value"), outputs.get("annual_cost_saved"),
+             outputs.get("annual_hours_saved"), outputs.get("payback_months"))
+        )
+
+    def save_roi_calculator(self, company_name: str, data: Dict) -> str:
+        company_key = sanitize_filename(company_name)
+        with self._connect() as conn:
+            version = conn.execute(
+                "SELECT COALESCE(MAX(version), 0) + 1 FROM roi_calculators WHERE company_key = ?", (company_key,)
+            ).fetchone()[0]
+            self._insert_roi(conn, company_key, {**data, "version": version})
+        return self._ref("roi_calculators", company_key, version)
+
+    def save_business_case(self, company_name: str, content: str, version: Optional[int] = None) -> str:
+        company_key = sanitize_filename(company_name)
+        with self._connect() as conn:
+            if version is None:
+                version = conn.execute(
+                    "SELECT COALESCE(MAX(version), 0) + 1 FROM business_cases WHERE company_key = ?", (company_key,)
+                ).fetchone()[0]
+            conn.execute(
+                "INSERT OR REPLACE INTO business_cases (company, company_key, version, created_at, content) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (company_name, company_key, version, datetime.now().isoformat(), content)
+            )
+        return self._ref("business_cases", company_key, version)
+
+    def _list(self, table: str, columns: str, company_name: Optional[str],
+              since: Optional[str], until: Optional[str]) -> List[tuple]:
+        query = f"SELECT company_key, company, version, created_at{columns} FROM {table} WHERE 1 = 1"
+        params = []
+        if company_name:
+            query += " AND company_key = ?"
+            params.append(sanitize_filename(company_name))
+        if since:
+            query += " AND created_at >= ?"
+            params.append(since)
+        if until:
+            query += " AND created_at < ?"
+            params.append(until)
+        query += " ORDER BY company_key, version DESC"
+
+        with self._read() as conn:
+            return conn.execute(query, params).fetchall()
+
+    def list_roi_calculators(self, company_name: Optional[str] = None,
+                             since: Optional[str] = None, until: Optional[str] = None) -> List[Dict]:
+        return [
+            {
+                "company": company,
+                "version": version,
+                "created_at": created_at,
+                "file_path": self._ref("roi_calculators", company_key, version),
+                "roi_outputs": json.loads(roi_outputs),
+            }
+            for company_key, company, version, created_at, roi_outputs
+            in self._list("roi_calculators", ", roi_outputs", company_name, since, until)
+        ]
+
+    def list_business_cases(self, company_name: Optional[str] = None,
+                            since: Optional[str] = None, until: Optional[str] = None) -> List[Dict]:
+        return [
+            {
+                "company": company,
+                "version": version,
+                "created_at": created_at,
+                "file_path": self._ref("business_cases", company_key, version),
+            }
+            for company_key, company, version, created_at
+            in self._list("business_cases", "", company_name, since, until)
+        ]
+
+    def load_roi_calculator(self, file_path: str) -> Dict:
+        company_key, version = self._parse_ref(file_path, "roi_calculators")
+        with self._read() as conn:
+            row = conn.execute(
+                "SELECT company, version, created_at, roi_inputs, roi_outputs, gong_signals, crm_context "
+                "FROM roi_calculators WHERE company_key = ? AND version = ?",
+                (company_key, version)
+            ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"No ROI calculator {company_key} v{version} in {self.db_path}")
+
+        return {
+            "company_name": row[0],
+            "version": row[1],
+            "created_at": row[2],
+            "roi_inputs": json.loads(row[3]),
+            "roi_outputs": json.loads(row[4]),
+            "gong_signals": json.loads(row[5]) if row[5] else None,
+            "crm_context": json.loads(row[6]) if row[6] else None,
+        }
+
+    def load_business_case(self, file_path: str) -> str:
+        company_key, version = self._parse_ref(file_path, "business_cases")
+        with self._read() as conn:
+            row = conn.execute(
+                "SELECT content FROM business_cases WHERE company_key = ? AND version = ?",
+                (company_key, version)
+            ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"No business case {company_key} v{version} in {self.db_path}")
+        return row[0]
+
+    def companies(self) -> List[str]:
+        with self._read() as conn:
+            rows = conn.execute(
+                "SELECT company FROM roi_calculators UNION SELECT company FROM business_cases"
+            ).fetchall()
+        return sorted(row[0] for row in rows)
+
+    def pipeline_summary(self) -> Dict:
+        with self._read() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM roi_calculators").fetchone()[0]
+            companies, net_value, cost_saved, hours_saved, payback = conn.execute("""
+                SELECT COUNT(*), COALESCE(SUM(net_annual_value), 0), COALESCE(SUM(annual_cost_saved), 0),
+                       COALESCE(SUM(annual_hours_saved), 0),
+                       AVG(CASE WHEN payback_months < 9e999 THEN payback_months END)  -- 9e999 is +inf (no savings)
+                FROM roi_calculators AS r
+                WHERE version = (SELECT MAX(version) FROM roi_calculators WHERE company_key = r.company_key)
+            """).fetchone()
+        return {
+            "companies": companies,
+            "roi_calculators": total,
+            "total_net_annual_value": net_value,
+            "total_annual_cost_saved": cost_saved,
+            "total_annual_hours_saved": hours_saved,
+            "avg_payback_months": payback,
+        }
+
+    def migrate_from_files(self, outputs_dir: Union[str, Path] = Path("outputs")) -> Dict[str, int]:
+        """
+        Copy ROI calculators and business cases from the file layout.
+
+        Versions and creation dates are kept. Rows that already exist are
+        left alone, so the migration can be re-run after more files appear.
+
+        Args:
+            outputs_dir: Directory holding roi_calculators/ and business_cases/
+
+        Returns:
+            Dictionary with the number of roi and business_case files read
+        """
+        outputs_dir = Path(outputs_dir)
+        counts = {"roi": 0, "business_case": 0}
+
+        with self._connect() as conn:
+            roi_dir = outputs_dir / "roi_calculators"
+            for file in sorted(roi_dir.glob("*/*.json")) if roi_dir.exists() else []:
+                try:
+                    with open(file, 'r') as f:
+                        data = json.load(f)
+                except Exception as e:
+                    print(f"Warning: skipping {file}: {e}", file=sys.stderr)
+                    continue
+                self._insert_roi(conn, file.parent.name, data, replace=False)
+                counts["roi"] += 1
+
+            cases_dir = outputs_dir / "business_cases"
+            for file in sorted(cases_dir.glob("*/*.md")) if cases_dir.exists() else []:
+                try:
+                    company_key, version = self._parse_ref(str(file))
+                except ValueError:
+                    continue
+                # Markdown files don't record the company; prefer the name its ROI calculators saved
+                conn.execute(
+                    "INSERT OR IGNORE INTO business_cases (company, company_key, version, created_at, content) "
+                    "VALUES (COALESCE((SELECT company FROM roi_calculators WHERE company_key = ? LIMIT 1), ?), "
+                    "?, ?, ?, ?)",
+                    (company_key, company_key.replace("-", " "), company_key, version,
+                     datetime.fromtimestamp(file.stat().st_mtime).isoformat(), file.read_text(encoding='utf-8'))
+                )
+                counts["business_case"] += 1
+
+        return counts
+
+
+def main():
+    """CLI entry point for migrating file storage into SQLite."""
+    parser = argparse.ArgumentParser(
+        description="Migrate saved ROI calculators and business cases from outputs/ into SQLite",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m src.sqlite_storage --migrate
+  python -m src.sqlite_storage --migrate --outputs old/outputs --db data/artifacts.db
+
+Then run the app with STORAGE_BACKEND=sqlite.
+        """
+    )
+
+    parser.add_argument("--migrate", action="store_true", help="Copy files from the outputs directory")
+    parser.add_argument("--outputs", type=str, default="outputs", help="Outputs directory to read")
+    parser.add_argument("--db", type=str, default=None, help="SQLite file (default: STORAGE_DB_PATH or data/artifacts.db)")
+
+    args = parser.parse_args()
+
+    if not args.migrate:
+        parser.error("Nothing to do; pass --migrate")
+
+    try:
+        backend = SQLiteStorageBackend(args.db)
+        counts = backend.migrate_from_files(args.outputs)
+    except Exception as e:
+        print(f"Error migrating storage: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"Migrated {counts['roi']} ROI calculators and {counts['business_case']} business cases into {backend.db_path}",
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
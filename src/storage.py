@@ -1,13 +1,23 @@
 """
 Storage module for ROI calculators and business cases with versioning.
+
+Artifacts are kept by a pluggable backend: loose JSON/Markdown files under
+outputs/ (the default) or SQLite tables (src.sqlite_storage). Select it
+with STORAGE_BACKEND=files|sqlite or configure_storage_backend().
 """
 
 import json
+import math
+import os
 import re
+import threading
+from abc import ABC, abstractmethod
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union
 from .schemas import ROIInputs, ROIOutputs, ExtractedSignals, CRMContext
+from .storage_index import get_storage_index
+from .version_allocator import get_version_allocator
 
 
 def sanitize_filename(name: str) -> str:
@@ -20,7 +30,7 @@ def sanitize_filename(name: str) -> str:
 
 def get_next_version(company_dir: Path, company_name: str, file_type: str = "roi") -> int:
     """
-    Get the next version number for a company's files.
+    Reserve the next version number for a company's files.
     
     Args:
         company_dir: Path to the company's directory
@@ -30,33 +40,226 @@ def get_next_version(company_dir: Path, company_name: str, file_type: str = "roi
     Returns:
         Next version number (1 if no existing versions)
     """
-    if not company_dir.exists():
-        return 1
+    extension = "json" if file_type == "roi" else "md"
+    return get_version_allocator().allocate(company_dir, company_name, extension)
+
+
+class StorageBackend(ABC):
+    """Abstract base class for ROI calculator and business case storage."""
     
-    # Pattern depends on file type
-    if file_type == "roi":
-        pattern = f"{company_name}-v*.json"
-    else:
-        pattern = f"{company_name}-v*.md"
+    @abstractmethod
+    def save_roi_calculator(self, company_name: str, data: Dict) -> Union[Path, str]:
+        """
+        Store an ROI calculator under the company's next version.
+        
+        Args:
+            company_name: Company name
+            data: Calculator record without "version" (set by the backend)
+            
+        Returns:
+            Reference to the saved calculator for load_roi_calculator: a file
+            path for file storage, an opaque artifact id otherwise
+        """
+        pass
+    
+    @abstractmethod
+    def save_business_case(self, company_name: str, content: str,
+                           version: Optional[int] = None) -> Union[Path, str]:
+        """
+        Store a business case, under the given or the next version.
+        
+        Returns:
+            Reference to the saved business case for load_business_case: a
+            file path for file storage, an opaque artifact id otherwise
+        """
+        pass
+    
+    @abstractmethod
+    def list_roi_calculators(self, company_name: Optional[str] = None,
+                             since: Optional[str] = None, until: Optional[str] = None) -> List[Dict]:
+        """List ROI calculator metadata (company, version, created_at, file_path, roi_outputs)."""
+        pass
+    
+    @abstractmethod
+    def list_business_cases(self, company_name: Optional[str] = None,
+                            since: Optional[str] = None, until: Optional[str] = None) -> List[Dict]:
+        """List business case metadata (company, version, created_at, file_path)."""
+        pass
+    
+    @abstractmethod
+    def load_roi_calculator(self, file_path: str) -> Dict:
+        """Load a full ROI calculator record."""
+        pass
+    
+    @abstractmethod
+    def load_business_case(self, file_path: str) -> str:
+        """Load business case Markdown."""
+        pass
+    
+    @abstractmethod
+    def companies(self) -> List[str]:
+        """Names of all companies with saved artifacts, sorted."""
+        pass
+    
+    def pipeline_summary(self) -> Dict:
+        """
+        Aggregate the latest ROI calculator of every company.
+        
+        Returns:
+            Dictionary with companies, roi_calculators (all versions),
+            total_net_annual_value, total_annual_cost_saved,
+            total_annual_hours_saved and avg_payback_months (over finite
+            paybacks only; None if there are none)
+        """
+        calculators = self.list_roi_calculators()
+        latest = {}
+        for calc in calculators:
+            key = sanitize_filename(calc["company"])
+            if key not in latest or calc["version"] > latest[key]["version"]:
+                latest[key] = calc
+        outputs = [calc.get("roi_outputs") or {} for calc in latest.values()]
+        # No savings means an infinite payback, which would swamp the average
+        paybacks = [
+            o["payback_months"] for o in outputs
+            if o.get("payback_months") is not None and math.isfinite(o["payback_months"])
+        ]
+        return {
+            "companies": len(latest),
+            "roi_calculators": len(calculators),
+            "total_net_annual_value": sum(o.get("net_annual_value", 0) for o in outputs),
+            "total_annual_cost_saved": sum(o.get("annual_cost_saved", 0) for o in outputs),
+            "total_annual_hours_saved": sum(o.get("annual_hours_saved", 0) for o in outputs),
+            "avg_payback_months": sum(paybacks) / len(paybacks) if paybacks else None,
+        }
+
+
+class FileStorageBackend(StorageBackend):
+    """Versioned JSON/Markdown files under outputs/, listed through the storage index."""
     
-    existing_files = list(company_dir.glob(pattern))
+    def __init__(self, outputs_dir: Path = Path("outputs")):
+        """
+        Initialize file storage.
+        
+        Args:
+            outputs_dir: Directory holding roi_calculators/ and business_cases/
+        """
+        self.outputs_dir = Path(outputs_dir)
+    
+    def save_roi_calculator(self, company_name: str, data: Dict) -> Path:
+        outputs_dir = self.outputs_dir / "roi_calculators"
+        outputs_dir.mkdir(parents=True, exist_ok=True)
+        
+        sanitized_company = sanitize_filename(company_name)
+        company_dir = outputs_dir / sanitized_company
+        company_dir.mkdir(exist_ok=True)
+        
+        version = get_next_version(company_dir, sanitized_company, "roi")
+        filename = f"{sanitized_company}-v{version}.json"
+        file_path = company_dir / filename
+        
+        data = {"company_name": data["company_name"], "version": version, **data}
+        
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+        
+        get_storage_index(self.outputs_dir).add(
+            "roi", company_name, sanitized_company, version, data["created_at"], file_path, data["roi_outputs"]
+        )
+        
+        return file_path
     
-    if not existing_files:
-        return 1
+    def save_business_case(self, company_name: str, content: str, version: Optional[int] = None) -> Path:
+        outputs_dir = self.outputs_dir / "business_cases"
+        outputs_dir.mkdir(parents=True, exist_ok=True)
+        
+        sanitized_company = sanitize_filename(company_name)
+        company_dir = outputs_dir / sanitized_company
+        company_dir.mkdir(exist_ok=True)
+        
+        if version is None:
+            version = get_next_version(company_dir, sanitized_company, "business_case")
+        else:
+            get_version_allocator().record(company_dir, sanitized_company, "md", version)
+        
+        filename = f"{sanitized_company}-v{version}.md"
+        file_path = company_dir / filename
+        
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        get_storage_index(self.outputs_dir).add(
+            "business_case", company_name, sanitized_company, version, datetime.now().isoformat(), file_path
+        )
+        
+        return file_path
     
-    # Extract version numbers
-    versions = []
-    version_pattern = re.compile(rf"{re.escape(company_name)}-v(\d+)\.(json|md)")
+    def list_roi_calculators(self, company_name: Optional[str] = None,
+                             since: Optional[str] = None, until: Optional[str] = None) -> List[Dict]:
+        company_key = sanitize_filename(company_name) if company_name else None
+        return get_storage_index(self.outputs_dir).list("roi", company_key, since, until)
     
-    for file in existing_files:
-        match = version_pattern.match(file.name)
-        if match:
-            versions.append(int(match.group(1)))
+    def list_business_cases(self, company_name: Optional[str] = None,
+                            since: Optional[str] = None, until: Optional[str] = None) -> List[Dict]:
+        company_key = sanitize_filename(company_name) if company_name else None
+        return get_storage_index(self.outputs_dir).list("business_case", company_key, since, until)
+    
+    def load_roi_calculator(self, file_path: str) -> Dict:
+        with open(file_path, 'r') as f:
+            return json.load(f)
+    
+    def load_business_case(self, file_path: str) -> str:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def companies(self) -> List[str]:
+        return get_storage_index(self.outputs_dir).companies()
+
+
+STORAGE_BACKENDS = ("files", "sqlite")
+
+_backend: Optional[StorageBackend] = None
+_backend_lock = threading.Lock()
+
+
+def _build_backend(name: str) -> StorageBackend:
+    """Create a storage backend by name."""
+    if name == "files":
+        return FileStorageBackend()
+    if name == "sqlite":
+        # Imported lazily: sqlite_storage builds on this module
+        from .sqlite_storage import SQLiteStorageBackend
+        return SQLiteStorageBackend()
+    raise ValueError(f"Storage backend must be one of: {', '.join(STORAGE_BACKENDS)}")
+
+
+def configure_storage_backend(backend) -> StorageBackend:
+    """
+    Set the process-wide storage backend.
     
-    if not versions:
-        return 1
+    Args:
+        backend: "files", "sqlite" or a StorageBackend instance
+        
+    Returns:
+        The backend now in use
+    """
+    global _backend
+    with _backend_lock:
+        _backend = backend if isinstance(backend, StorageBackend) else _build_backend(backend)
+        return _backend
+
+
+def get_storage_backend() -> StorageBackend:
+    """
+    Get the process-wide storage backend, chosen by STORAGE_BACKEND (default "files").
     
-    return max(versions) + 1
+    Returns:
+        StorageBackend
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = _build_backend(os.getenv("STORAGE_BACKEND", "files").lower())
+        return _backend
 
 
 def save_roi_calculator(
@@ -65,7 +268,7 @@ def save_roi_calculator(
     roi_outputs: ROIOutputs,
     gong_signals: Optional[ExtractedSignals] = None,
     crm_context: Optional[CRMContext] = None
-) -> Path:
+) -> Union[Path, str]:
     """
     Save ROI calculator with versioning.
     
@@ -77,41 +280,25 @@ def save_roi_calculator(
         crm_context: Optional CRM context
         
     Returns:
-        Path to saved file
+        Reference to pass to the matching load function (a file path for
+        file storage, an opaque artifact id for SQLite)
     """
-    outputs_dir = Path("outputs") / "roi_calculators"
-    outputs_dir.mkdir(parents=True, exist_ok=True)
-    
-    sanitized_company = sanitize_filename(company_name)
-    company_dir = outputs_dir / sanitized_company
-    company_dir.mkdir(exist_ok=True)
-    
-    version = get_next_version(company_dir, sanitized_company, "roi")
-    filename = f"{sanitized_company}-v{version}.json"
-    file_path = company_dir / filename
-    
-    # Prepare data for saving
     data = {
         "company_name": company_name,
-        "version": version,
         "created_at": datetime.now().isoformat(),
         "roi_inputs": roi_inputs.model_dump(),
         "roi_outputs": roi_outputs.model_dump(),
         "gong_signals": gong_signals.model_dump() if gong_signals else None,
         "crm_context": crm_context.model_dump() if crm_context else None
     }
-    
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
-    
-    return file_path
+    return get_storage_backend().save_roi_calculator(company_name, data)
 
 
 def save_business_case(
     company_name: str,
     business_case_content: str,
     version: Optional[int] = None
-) -> Path:
+) -> Union[Path, str]:
     """
     Save business case with versioning.
     
@@ -121,143 +308,48 @@ def save_business_case(
         version: Optional version number (auto-incremented if not provided)
         
     Returns:
-        Path to saved file
+        Reference to pass to the matching load function (a file path for
+        file storage, an opaque artifact id for SQLite)
     """
-    outputs_dir = Path("outputs") / "business_cases"
-    outputs_dir.mkdir(parents=True, exist_ok=True)
-    
-    sanitized_company = sanitize_filename(company_name)
-    company_dir = outputs_dir / sanitized_company
-    company_dir.mkdir(exist_ok=True)
-    
-    if version is None:
-        version = get_next_version(company_dir, sanitized_company, "business_case")
-    
-    filename = f"{sanitized_company}-v{version}.md"
-    file_path = company_dir / filename
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(business_case_content)
-    
-    return file_path
+    return get_storage_backend().save_business_case(company_name, business_case_content, version)
 
 
-def get_roi_calculators(company_name: Optional[str] = None) -> List[Dict]:
+def get_roi_calculators(
+    company_name: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None
+) -> List[Dict]:
     """
     Get list of saved ROI calculators.
     
     Args:
         company_name: Optional company name to filter by
+        since: Optional ISO date/time; only calculators created at or after it
+        until: Optional ISO date/time; only calculators created before it
         
     Returns:
         List of ROI calculator metadata
     """
-    roi_dir = Path("outputs") / "roi_calculators"
-    
-    if not roi_dir.exists():
-        return []
-    
-    calculators = []
-    
-    if company_name:
-        # Get calculators for specific company
-        sanitized = sanitize_filename(company_name)
-        company_dir = roi_dir / sanitized
-        if company_dir.exists():
-            for file in sorted(company_dir.glob("*.json"), reverse=True):
-                try:
-                    with open(file, 'r') as f:
-                        data = json.load(f)
-                    calculators.append({
-                        "company": data.get("company_name", company_name),
-                        "version": data.get("version", 1),
-                        "created_at": data.get("created_at", ""),
-                        "file_path": str(file),
-                        "roi_outputs": data.get("roi_outputs", {})
-                    })
-                except Exception:
-                    continue
-    else:
-        # Get all calculators
-        for company_dir in roi_dir.iterdir():
-            if company_dir.is_dir():
-                for file in sorted(company_dir.glob("*.json"), reverse=True):
-                    try:
-                        with open(file, 'r') as f:
-                            data = json.load(f)
-                        calculators.append({
-                            "company": data.get("company_name", company_dir.name),
-                            "version": data.get("version", 1),
-                            "created_at": data.get("created_at", ""),
-                            "file_path": str(file),
-                            "roi_outputs": data.get("roi_outputs", {})
-                        })
-                    except Exception:
-                        continue
-    
-    return calculators
+    return get_storage_backend().list_roi_calculators(company_name, since, until)
 
 
-def get_business_cases(company_name: Optional[str] = None) -> List[Dict]:
+def get_business_cases(
+    company_name: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None
+) -> List[Dict]:
     """
     Get list of saved business cases.
     
     Args:
         company_name: Optional company name to filter by
+        since: Optional ISO date/time; only business cases created at or after it
+        until: Optional ISO date/time; only business cases created before it
         
     Returns:
         List of business case metadata
     """
-    cases_dir = Path("outputs") / "business_cases"
-    
-    if not cases_dir.exists():
-        return []
-    
-    cases = []
-    
-    if company_name:
-        # Get cases for specific company
-        sanitized = sanitize_filename(company_name)
-        company_dir = cases_dir / sanitized
-        if company_dir.exists():
-            for file in sorted(company_dir.glob("*.md"), reverse=True):
-                try:
-                    # Extract version from filename
-                    match = re.match(rf"{re.escape(sanitized)}-v(\d+)\.md", file.name)
-                    version = int(match.group(1)) if match else 1
-                    
-                    stat = file.stat()
-                    cases.append({
-                        "company": company_name,
-                        "version": version,
-                        "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        "file_path": str(file)
-                    })
-                except Exception:
-                    continue
-    else:
-        # Get all cases
-        for company_dir in cases_dir.iterdir():
-            if company_dir.is_dir():
-                for file in sorted(company_dir.glob("*.md"), reverse=True):
-                    try:
-                        # Extract company and version from filename
-                        match = re.match(r"(.+)-v(\d+)\.md", file.name)
-                        if match:
-                            company = match.group(1).replace("-", " ")
-                            version = int(match.group(2))
-                            
-                            stat = file.stat()
-                            cases.append({
-                                "company": company,
-                                "version": version,
-                                "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                                "file_path": str(file)
-                            })
-                    except Exception:
-                        continue
-    
-    return cases
+    return get_storage_backend().list_business_cases(company_name, since, until)
 
 
 def load_roi_calculator(file_path: str) -> Dict:
@@ -265,13 +357,13 @@ def load_roi_calculator(file_path: str) -> Dict:
     Load ROI calculator from file.
     
     Args:
-        file_path: Path to ROI calculator JSON file
+        file_path: Reference from save_roi_calculator or the file_path of
+            get_roi_calculators
         
     Returns:
         Dictionary with ROI data
     """
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    return get_storage_backend().load_roi_calculator(file_path)
 
 
 def load_business_case(file_path: str) -> str:
@@ -279,40 +371,27 @@ def load_business_case(file_path: str) -> str:
     Load business case from file.
     
     Args:
-        file_path: Path to business case Markdown file
+        file_path: Reference from save_business_case or the file_path of
+            get_business_cases
         
     Returns:
         Business case content as string
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return get_storage_backend().load_business_case(file_path)
 
 
 def get_companies() -> List[str]:
     """Get list of all companies with saved ROI calculators or business cases."""
-    companies = set()
-    
-    # From ROI calculators
-    roi_dir = Path("outputs") / "roi_calculators"
-    if roi_dir.exists():
-        for company_dir in roi_dir.iterdir():
-            if company_dir.is_dir():
-                # Try to get company name from first file
-                for file in company_dir.glob("*.json"):
-                    try:
-                        with open(file, 'r') as f:
-                            data = json.load(f)
-                            companies.add(data.get("company_name", company_dir.name))
-                            break
-                    except Exception:
-                        companies.add(company_dir.name.replace("-", " "))
-                        break
-    
-    # From business cases
-    cases_dir = Path("outputs") / "business_cases"
-    if cases_dir.exists():
-        for company_dir in cases_dir.iterdir():
-            if company_dir.is_dir():
-                companies.add(company_dir.name.replace("-", " "))
+    return get_storage_backend().companies()
+
+
+def get_pipeline_summary() -> Dict:
+    """
+    Get totals across every company's latest ROI calculator.
     
-    return sorted(list(companies))
+    Returns:
+        Dictionary with companies, roi_calculators, total_net_annual_value,
+        total_annual_cost_saved, total_annual_hours_saved and avg_payback_months
+        (None when no calculator has a finite payback)
+    """
+    return get_storage_backend().pipeline_summary()
@@ -0,0 +1,283 @@
+"""
+Metadata index for saved ROI calculators and business cases.
+
+Each save adds one compact row (company, version, date, ROI outputs, path)
+to a SQLite index, so listing and filtering saved artifacts never opens the
+files themselves. Trees saved before the index existed are indexed on first
+use, or explicitly with:
+
+    python -m src.storage_index --rebuild
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+
+DEFAULT_OUTPUTS_DIR = Path("outputs")
+DEFAULT_INDEX_PATH = DEFAULT_OUTPUTS_DIR / ".storage_index.db"
+
+KINDS = ("roi", "business_case")
+
+
+class StorageIndex:
+    """
+    SQLite index of saved artifacts, one row per file.
+
+    Rows carry what the saved-artifact pages display (company, version,
+    created_at and, for ROI calculators, roi_outputs) keyed by file path.
+    company_key is the sanitized company name used for directory names,
+    which is what filters match on.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_INDEX_PATH):
+        """
+        Initialize storage index.
+
+        Args:
+            db_path: SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS artifacts (
+                    file_path TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    company TEXT NOT NULL,
+                    company_key TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    roi_outputs TEXT
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_artifacts_kind_company ON artifacts(kind, company_key, version)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing and closing on exit."""
+        conn = sqlite3.connect(self.db_path, timeout=10.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def add(
+        self,
+        kind: str,
+        company: str,
+        company_key: str,
+        version: int,
+        created_at: str,
+        file_path: Union[str, Path],
+        roi_outputs: Optional[Dict] = None
+    ):
+        """
+        Index a saved artifact (replacing any row for the same file).
+
+        Args:
+            kind: "roi" or "business_case"
+            company: Company name as entered
+            company_key: Sanitized company name (the directory name)
+            version: Version number
+            created_at: ISO timestamp
+            file_path: Path of the saved file
+            roi_outputs: ROI outputs to show in listings (ROI calculators only)
+        """
+        with self._connect() as conn:
+            self._insert(conn, kind, company, company_key, version, created_at, file_path, roi_outputs)
+
+    @staticmethod
+    def _insert(conn, kind, company, company_key, version, created_at, file_path, roi_outputs):
+        conn.execute(
+            "INSERT OR REPLACE INTO artifacts "
+            "(file_path, kind, company, company_key, version, created_at, roi_outputs) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (str(file_path), kind, company, company_key, version, created_at,
+             json.dumps(roi_outputs, default=str) if roi_outputs is not None else None)
+        )
+
+    def list(
+        self,
+        kind: str,
+        company_key: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        List indexed artifacts, newest version first within each company.
+
+        Args:
+            kind: "roi" or "business_case"
+            company_key: Optional sanitized company name to filter by
+            since: Optional ISO date/time; only artifacts created at or after it
+            until: Optional ISO date/time; only artifacts created before it
+
+        Returns:
+            List of dicts with company, version, created_at, file_path and,
+            for ROI calculators, roi_outputs
+        """
+        query = "SELECT company, version, created_at, file_path, roi_outputs FROM artifacts WHERE kind = ?"
+        params = [kind]
+        if company_key is not None:
+            query += " AND company_key = ?"
+            params.append(company_key)
+        if since:
+            query += " AND created_at >= ?"
+            params.append(since)
+        if until:
+            query += " AND created_at < ?"
+            params.append(until)
+        query += " ORDER BY company_key, version DESC"
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        entries = []
+        for company, version, created_at, file_path, roi_outputs in rows:
+            entry = {"company": company, "version": version, "created_at": created_at, "file_path": file_path}
+            if kind == "roi":
+                entry["roi_outputs"] = json.loads(roi_outputs) if roi_outputs else {}
+            entries.append(entry)
+        return entries
+
+    def companies(self) -> List[str]:
+        """Names of every company with an indexed artifact, sorted."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT DISTINCT company FROM artifacts").fetchall()
+        return sorted(row[0] for row in rows)
+
+    def is_built(self) -> bool:
+        """Whether the index has been built from disk at least once."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM index_meta WHERE key = 'built_at'").fetchone()
+        return row is not None
+
+    def rebuild(self, outputs_dir: Union[str, Path] = DEFAULT_OUTPUTS_DIR) -> Dict[str, int]:
+        """
+        Replace the index with a scan of the saved files under outputs_dir.
+
+        Args:
+            outputs_dir: Directory holding roi_calculators/ and business_cases/
+
+        Returns:
+            Dictionary with the number of roi and business_case files indexed
+        """
+        outputs_dir = Path(outputs_dir)
+        counts = {kind: 0 for kind in KINDS}
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM artifacts")
+
+            roi_dir = outputs_dir / "roi_calculators"
+            for file in sorted(roi_dir.glob("*/*.json")) if roi_dir.exists() else []:
+                try:
+                    with open(file, 'r') as f:
+                        data = json.load(f)
+                except Exception:
+                    continue
+                self._insert(
+                    conn, "roi", data.get("company_name", file.parent.name), file.parent.name,
+                    data.get("version", 1), data.get("created_at", ""), file, data.get("roi_outputs", {})
+                )
+                counts["roi"] += 1
+
+            cases_dir = outputs_dir / "business_cases"
+            for file in sorted(cases_dir.glob("*/*.md")) if cases_dir.exists() else []:
+                match = re.fullmatch(rf"{re.escape(file.parent.name)}-v(\d+)\.md", file.name)
+                if not match:
+                    continue
+                self._insert(
+                    conn, "business_case", file.parent.name.replace("-", " "), file.parent.name,
+                    int(match.group(1)), datetime.fromtimestamp(file.stat().st_mtime).isoformat(), file, None
+                )
+                counts["business_case"] += 1
+
+            conn.execute(
+                "INSERT OR REPLACE INTO index_meta (key, value) VALUES ('built_at', ?)",
+                (datetime.now().isoformat(),)
+            )
+
+        return counts
+
+
+_indexes: Dict[Path, StorageIndex] = {}
+_index_lock = threading.Lock()
+
+
+def get_storage_index(outputs_dir: Union[str, Path] = DEFAULT_OUTPUTS_DIR) -> StorageIndex:
+    """
+    Get the process-wide storage index for an outputs directory
+    (STORAGE_INDEX_PATH, default <outputs_dir>/.storage_index.db), indexing
+    the files under outputs_dir on first use.
+
+    Args:
+        outputs_dir: Directory holding roi_calculators/ and business_cases/
+
+    Returns:
+        StorageIndex
+    """
+    outputs_dir = Path(outputs_dir)
+    index_path = Path(os.getenv("STORAGE_INDEX_PATH", str(outputs_dir / DEFAULT_INDEX_PATH.name)))
+    with _index_lock:
+        index = _indexes.get(index_path)
+        if index is None:
+            index = StorageIndex(index_path)
+            if not index.is_built():
+                index.rebuild(outputs_dir)
+            _indexes[index_path] = index
+        return index
+
+
+def main():
+    """CLI entry point for rebuilding the storage index."""
+    parser = argparse.ArgumentParser(
+        description="Rebuild the metadata index of saved ROI calculators and business cases",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m src.storage_index --rebuild
+  python -m src.storage_index --rebuild --outputs /data/ae-copilot/outputs
+        """
+    )
+
+    parser.add_argument("--rebuild", action="store_true", help="Rescan saved files and replace the index")
+    parser.add_argument("--outputs", type=str, default=str(DEFAULT_OUTPUTS_DIR), help="Outputs directory to scan")
+    parser.add_argument(
+        "--index", type=str, default=os.getenv("STORAGE_INDEX_PATH"),
+        help="Index file (default: STORAGE_INDEX_PATH or .storage_index.db in the outputs directory)"
+    )
+
+    args = parser.parse_args()
+
+    if not args.rebuild:
+        parser.error("Nothing to do; pass --rebuild")
+    if not args.index:
+        args.index = str(Path(args.outputs) / DEFAULT_INDEX_PATH.name)
+
+    try:
+        counts = StorageIndex(args.index).rebuild(args.outputs)
+    except Exception as e:
+        print(f"Error rebuilding storage index: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"Indexed {counts['roi']} ROI calculators and {counts['business_case']} business cases into {args.index}",
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Per-transcript index for signal extraction and evidence lookup.
+"""
+
+from bisect import bisect_right
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional
+
+from .signal_matcher import SignalMatcher
+
+
+# Joins per-turn and per-sentence texts; signals never match it, so a hit
+# can't span two turns or two sentences
+SEPARATOR = "\x00"
+
+
+def _join_with_offsets(texts: List[str]) -> tuple:
+    """Join texts with SEPARATOR and return (joined, start offset of each text)."""
+    starts = []
+    position = 0
+    for text in texts:
+        starts.append(position)
+        position += len(text) + len(SEPARATOR)
+    return SEPARATOR.join(texts), starts
+
+
+class TranscriptIndex:
+    """
+    Lowercased, offset-indexed view of one transcript.
+
+    Built once per transcript and shared by extractors: the combined text is
+    lowercased once, speaker turns and sentences are each joined into one
+    searchable string, and any match offset maps back to its turn, timestamp
+    or sentence with a bisect instead of a scan over every turn.
+    """
+
+    def __init__(self, transcript_text: str = "", speakers: Optional[List[dict]] = None):
+        """
+        Initialize transcript index.
+
+        Args:
+            transcript_text: Full transcript text
+            speakers: Speaker turns with "text" and optional "timestamp"
+        """
+        self.transcript_text = transcript_text
+        self.speakers = speakers or []
+
+    @classmethod
+    def from_transcript_data(cls, transcript_data: dict) -> "TranscriptIndex":
+        """
+        Build an index from GongClient.fetch_transcript output.
+
+        Args:
+            transcript_data: Transcript data from fetch_transcript
+
+        Returns:
+            TranscriptIndex
+        """
+        transcript_text = ""
+        speakers = []
+
+        if "transcript" in transcript_data:
+            if isinstance(transcript_data["transcript"], dict):
+                transcript_text = transcript_data["transcript"].get("text", "")
+                speakers = transcript_data["transcript"].get("speakers", [])
+            elif isinstance(transcript_data["transcript"], str):
+                transcript_text = transcript_data["transcript"]
+
+        return cls(transcript_text, speakers)
+
+    @cached_property
+    def full_text(self) -> str:
+        """Lowercased transcript text followed by all speaker text."""
+        full_text = self.transcript_text.lower()
+        if self.speakers:
+            speaker_text = " ".join([s.get("text", "") for s in self.speakers])
+            full_text = (full_text + " " + speaker_text.lower()).strip()
+        return full_text
+
+    @cached_property
+    def _turns(self) -> tuple:
+        """Joined lowercased speaker turns and their start offsets."""
+        return _join_with_offsets([speaker.get("text", "").lower() for speaker in self.speakers])
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Transcript text split on '.' (unstripped, as in the source)."""
+        return self.transcript_text.split('.') if self.transcript_text else []
+
+    @cached_property
+    def _sentences(self) -> tuple:
+        """Joined lowercased sentences and their start offsets."""
+        return _join_with_offsets([sentence.lower() for sentence in self.sentences])
+
+    @property
+    def turns_text(self) -> str:
+        """All lowercased speaker turns joined by SEPARATOR."""
+        return self._turns[0]
+
+    @property
+    def sentences_text(self) -> str:
+        """All lowercased sentences joined by SEPARATOR."""
+        return self._sentences[0]
+
+    def turn_at(self, offset: int) -> int:
+        """Index of the speaker turn containing an offset into turns_text."""
+        return bisect_right(self._turns[1], offset) - 1
+
+    def timestamp_at(self, offset: int) -> Optional[int]:
+        """Timestamp of the speaker turn containing an offset into turns_text."""
+        return self.speakers[self.turn_at(offset)].get("timestamp")
+
+    def sentence_at(self, offset: int) -> int:
+        """Index of the sentence containing an offset into sentences_text."""
+        return bisect_right(self._sentences[1], offset) - 1
+
+    def find_quotes(self, matcher: SignalMatcher, signals: Iterable[str]) -> Dict[str, dict]:
+        """
+        Find the evidence quote for each signal.
+
+        The quote is the first speaker turn containing the signal, falling back
+        to the first transcript sentence containing it.
+
+        Args:
+            matcher: Matcher that knows the signals
+            signals: Keywords or patterns to resolve
+
+        Returns:
+            Dictionary mapping signal -> speaker turn dict, or
+            {"text": sentence, "timestamp": None} for sentence fallbacks
+        """
+        quotes = {}
+        signals = list(dict.fromkeys(signals))
+        if not signals:
+            return quotes
+
+        if self.speakers:
+            for signal, offset in matcher.first_offsets(self.turns_text, signals).items():
+                quotes[signal] = self.speakers[self.turn_at(offset)]
+
+        remaining = [signal for signal in signals if signal not in quotes]
+        if remaining and self.transcript_text:
+            for signal, offset in matcher.first_offsets(self.sentences_text, remaining).items():
+                quotes[signal] = {"text": self.sentences[self.sentence_at(offset)].strip(), "timestamp": None}
+
+        return quotes
@@ -0,0 +1,165 @@
+"""
+Version allocator for versioned outputs - a per-directory counter in SQLite
+so saves don't glob the directory, and concurrent saves never share a vN.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+
+DEFAULT_DB_PATH = Path("outputs") / ".versions.db"
+
+
+def scan_versions(directory: Path, name: str, extension: str) -> int:
+    """
+    Find the highest "<name>-v<N>.<extension>" version already on disk.
+
+    Used once per directory to seed its counter from legacy outputs.
+
+    Args:
+        directory: Directory holding the versioned files
+        name: Sanitized file name prefix
+        extension: File extension without the dot
+
+    Returns:
+        Highest version found (0 if none)
+    """
+    if not directory.exists():
+        return 0
+
+    version_pattern = re.compile(rf"{re.escape(name)}-v(\d+)\.{re.escape(extension)}")
+    versions = [
+        int(match.group(1))
+        for file in directory.glob(f"{name}-v*.{extension}")
+        if (match := version_pattern.fullmatch(file.name))
+    ]
+    return max(versions, default=0)
+
+
+class VersionAllocator:
+    """
+    Hands out monotonic version numbers per (directory, name, extension).
+
+    Each allocation is one row update inside a SQLite write transaction, so
+    it costs the same however many versions exist and is unique across
+    threads and processes (Streamlit sessions, batch workers, the CLI)
+    sharing the database file. A key seen for the first time is seeded from
+    the files already in its directory.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_DB_PATH):
+        """
+        Initialize version allocator.
+
+        Args:
+            db_path: SQLite file holding the counters
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS version_counters (
+                    directory TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    extension TEXT NOT NULL,
+                    last_version INTEGER NOT NULL,
+                    PRIMARY KEY (directory, name, extension)
+                )
+            """)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection inside a write transaction, committing and closing on exit."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        try:
+            # Take the write lock up front so read-then-increment can't interleave
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+    def _bump(self, directory: Path, name: str, extension: str, at_least: int) -> int:
+        """Advance a counter to max(last + 1, at_least) and return it."""
+        key = (directory.as_posix(), name, extension)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT last_version FROM version_counters WHERE directory = ? AND name = ? AND extension = ?",
+                key
+            ).fetchone()
+            last = row[0] if row else scan_versions(directory, name, extension)
+            version = max(last + 1, at_least)
+            conn.execute(
+                "INSERT OR REPLACE INTO version_counters (directory, name, extension, last_version) "
+                "VALUES (?, ?, ?, ?)",
+                (*key, version)
+            )
+        return version
+
+    def allocate(self, directory: Path, name: str, extension: str) -> int:
+        """
+        Reserve the next version for "<name>-v<N>.<extension>" in a directory.
+
+        Args:
+            directory: Directory holding the versioned files
+            name: Sanitized file name prefix
+            extension: File extension without the dot
+
+        Returns:
+            A version no other caller has been or will be given
+        """
+        version = self._bump(directory, name, extension, 1)
+        # A file written outside the allocator (copied in, older code) is skipped over
+        while (directory / f"{name}-v{version}.{extension}").exists():
+            version = self._bump(directory, name, extension, version + 1)
+        return version
+
+    def record(self, directory: Path, name: str, extension: str, version: int):
+        """
+        Note a version chosen by the caller so later allocations come after it.
+
+        Args:
+            directory: Directory holding the versioned files
+            name: Sanitized file name prefix
+            extension: File extension without the dot
+            version: Version the caller wrote
+        """
+        key = (directory.as_posix(), name, extension)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT last_version FROM version_counters WHERE directory = ? AND name = ? AND extension = ?",
+                key
+            ).fetchone()
+            last = row[0] if row else scan_versions(directory, name, extension)
+            conn.execute(
+                "INSERT OR REPLACE INTO version_counters (directory, name, extension, last_version) "
+                "VALUES (?, ?, ?, ?)",
+                (*key, max(last, version))
+            )
+
+
+_allocator: Optional[VersionAllocator] = None
+_allocator_lock = threading.Lock()
+
+
+def get_version_allocator() -> VersionAllocator:
+    """
+    Get the process-wide version allocator (VERSION_DB_PATH, default outputs/.versions.db).
+
+    Returns:
+        VersionAllocator
+    """
+    global _allocator
+    with _allocator_lock:
+        if _allocator is None:
+            _allocator = VersionAllocator(os.getenv("VERSION_DB_PATH", str(DEFAULT_DB_PATH)))
+        return _allocator
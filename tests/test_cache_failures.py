@@ -0,0 +1,94 @@
+"""A corrupt cache file must only cost cache hits, never research or LLM results."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from src import llm_cache, llm_researcher, researcher, search_cache
+
+
+class FakeDDGS:
+    def text(self, query, max_results=5):
+        return [{"title": query, "href": "https://example.com", "body": f"{query} snippet"}]
+
+
+class CorruptSearchCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        cache_path = Path(self.tmp.name) / "search_cache.db"
+        cache_path.write_bytes(b"this is not a sqlite database" * 100)
+        patches = [
+            mock.patch.dict(os.environ, {"SEARCH_CACHE_PATH": str(cache_path)}),
+            mock.patch.object(search_cache, "_cache", None),
+            mock.patch.object(search_cache, "_cache_mode", "on"),
+            mock.patch.object(researcher, "DDGS_AVAILABLE", True),
+            mock.patch.object(researcher, "_get_ddgs", lambda *args, **kwargs: FakeDDGS()),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_research_returns_results(self):
+        with mock.patch("sys.stderr"):
+            data = researcher.research_company("Acme Corp")
+
+        self.assertEqual(len(data["all_snippets"]), 3)
+        self.assertIn("Acme Corp news 2024 snippet", data["all_snippets"])
+
+
+class CorruptLLMCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        cache_path = Path(self.tmp.name) / "llm_cache.db"
+        cache_path.write_bytes(b"this is not a sqlite database" * 100)
+        patches = [
+            mock.patch.dict(os.environ, {"LLM_CACHE_PATH": str(cache_path)}),
+            mock.patch.object(llm_cache, "_cache", None),
+            mock.patch.object(llm_cache, "_cache_enabled", True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_completion_is_returned(self):
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="NAME: Jordan Lee"))],
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5),
+        )
+        client = mock.Mock()
+        client.chat.completions.create.return_value = response
+
+        with mock.patch("sys.stderr"):
+            content = llm_researcher._openai_completion(client, "system", "prompt", max_tokens=50)
+
+        self.assertEqual(content, "NAME: Jordan Lee")
+
+    def test_failed_write_keeps_response(self):
+        cache = mock.Mock()
+        cache.get.return_value = None
+        cache.put.side_effect = OSError("disk full")
+        message = SimpleNamespace(
+            content=[SimpleNamespace(text="NAME: Jordan Lee")],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+        )
+        client = mock.Mock()
+        client.messages.create.return_value = message
+
+        with mock.patch.object(llm_researcher, "get_llm_cache", return_value=cache), mock.patch("sys.stderr"):
+            content = llm_researcher._anthropic_completion(client, "prompt", max_tokens=50)
+
+        self.assertEqual(content, "NAME: Jordan Lee")
+        cache.put.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
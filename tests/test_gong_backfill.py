@@ -0,0 +1,61 @@
+"""A dead extraction pool must not abort a backfill."""
+
+import json
+import tempfile
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest import mock
+
+from src import gong_backfill
+from src.gong_client import GongClient
+
+
+class DyingPool:
+    """ProcessPoolExecutor stand-in whose workers die after the first submit."""
+
+    def __init__(self, *args, **kwargs):
+        self.submits = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args):
+        self.submits += 1
+        if self.submits > 1:
+            raise BrokenProcessPool("A child process terminated abruptly")
+        future = Future()
+        future.set_exception(BrokenProcessPool("A child process terminated abruptly"))
+        return future
+
+
+class BrokenPoolBackfillTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_path = Path(self.tmp.name) / "backfill.jsonl"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_remaining_calls_extract_in_process(self):
+        call_ids = [f"call-{i}" for i in range(4)]
+        with mock.patch.object(gong_backfill, "ProcessPoolExecutor", DyingPool), \
+                mock.patch("sys.stderr"):
+            stats = gong_backfill.run_backfill(
+                call_ids, self.output_path, client=GongClient(mock_mode=True), fetch_concurrency=1
+            )
+
+        self.assertEqual(stats["succeeded"], 4)
+        self.assertEqual(stats["failed"], 0)
+        with open(self.output_path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(sorted(r["call_id"] for r in records), call_ids)
+        self.assertTrue(all(r["status"] == "ok" and r["signals"] for r in records))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Round-trip tests for HubSpotClient against the local HubSpot stub."""
+
+import unittest
+
+from src.crm_client import HubSpotClient
+from src.http_transport import HTTPTransport
+from src.hubspot_stub import HubSpotStubServer
+
+
+class FetchAccountContextTest(unittest.TestCase):
+    def setUp(self):
+        self.stub = HubSpotStubServer().start()
+        self.client = HubSpotClient(private_app_token="stub", base_url=self.stub.url, transport=HTTPTransport())
+
+    def tearDown(self):
+        self.stub.stop()
+
+    def test_fetch_by_name_takes_six_requests(self):
+        context = self.client.fetch_account_context("Acme Corp")
+
+        self.assertEqual(context.account_name, "Acme Corp")
+        self.assertEqual(len(context.key_contacts), 5)  # capped at five
+        # search, company properties, and associations + batch read for contacts and deals
+        self.assertEqual(self.stub.request_count, 6)
+
+    def test_search_is_post(self):
+        self.client.fetch_account_context("Acme Corp")
+
+        searches = [r for r in self.stub.requests if r["path"] == "/crm/v3/objects/companies/search"]
+        self.assertEqual([r["method"] for r in searches], ["POST"])
+
+    def test_stub_rejects_get_search(self):
+        status, _ = self.stub.handle("GET", "/crm/v3/objects/companies/search", {"query": "Acme"})
+
+        self.assertEqual(status, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
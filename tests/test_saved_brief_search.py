@@ -0,0 +1,99 @@
+"""Search, pagination and deletion against the contentless saved-brief index."""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src import database, renderer
+
+
+class SavedBriefSearchTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / "briefs.db"
+        patches = [
+            mock.patch.object(database, "DB_PATH", self.db_path),
+            mock.patch.object(database, "_schema_ready", set()),
+            mock.patch.object(database, "BRIEF_STORAGE", "inputs"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        database.close_db_connection()
+        self.addCleanup(database.close_db_connection)
+
+        database.create_user("alice", "password")
+        database.create_user("bob", "password")
+        self.alice = database.authenticate_user("alice", "password")
+        self.bob = database.authenticate_user("bob", "password")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def save(self, user_id, company, persona="CTO", as_inputs=False):
+        args = (company, persona, ["Globex"], "2024-01-01 00:00")
+        content = renderer.assemble_account_brief(*args)
+        inputs = renderer.brief_inputs(*args) if as_inputs else None
+        return database.save_brief(user_id, company, persona, ["Globex"], content, inputs)
+
+    def test_index_is_contentless(self):
+        sql = database.get_db_connection().execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'saved_briefs_fts'"
+        ).fetchone()[0]
+        self.assertIn("content=''", sql)
+
+    def test_search_returns_highlighted_snippets(self):
+        markdown_id = self.save(self.alice, "Initech")
+        inputs_id = self.save(self.alice, "Initrode", as_inputs=True)
+        self.save(self.bob, "Initech")
+
+        results = database.search_user_briefs(self.alice, "globex")
+
+        self.assertEqual({r["id"] for r in results}, {markdown_id, inputs_id})
+        for result in results:
+            self.assertIn("<mark>Globex</mark>", result["snippet"])
+        self.assertEqual([r["id"] for r in database.search_user_briefs(self.alice, "initrode")], [inputs_id])
+
+    def test_search_and_list_paginate(self):
+        ids = [self.save(self.alice, f"Company {i}") for i in range(5)]
+
+        self.assertEqual(len(database.search_user_briefs(self.alice, "company", limit=2)), 2)
+        self.assertEqual(len(database.search_user_briefs(self.alice, "company", limit=10)), 5)
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = database.list_user_briefs(self.alice, limit=2, cursor=cursor)
+            seen += [brief["id"] for brief in page]
+            if cursor is None:
+                break
+        self.assertEqual(seen, ids[::-1])
+
+    def test_deleted_briefs_leave_search(self):
+        kept = self.save(self.alice, "Initech")
+        deleted = self.save(self.alice, "Initech", persona="CFO", as_inputs=True)
+
+        self.assertFalse(database.delete_brief(deleted, self.bob))
+        self.assertTrue(database.delete_brief(deleted, self.alice))
+
+        self.assertEqual([r["id"] for r in database.search_user_briefs(self.alice, "initech")], [kept])
+        self.assertEqual(database.search_user_briefs(self.alice, "cfo"), [])
+
+    def test_delete_outside_the_app_leaves_search(self):
+        kept = self.save(self.alice, "Initech")
+        deleted = self.save(self.alice, "Initech", persona="CFO")
+
+        # A plain connection, with none of the app's Python functions registered
+        conn = sqlite3.connect(str(self.db_path))
+        with conn:
+            conn.execute("DELETE FROM saved_briefs WHERE id = ?", (deleted,))
+        conn.close()
+
+        self.assertEqual([r["id"] for r in database.search_user_briefs(self.alice, "initech")], [kept])
+        self.assertEqual(database.rebuild_search_index(), 1)
+        self.assertEqual([r["id"] for r in database.search_user_briefs(self.alice, "initech")], [kept])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""The storage index is built from the backend's own outputs directory."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src import storage_index
+from src.storage import FileStorageBackend
+
+
+class FileBackendIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.outputs_dir = Path(self.tmp.name) / "outputs"
+        env = {key: value for key, value in os.environ.items() if key != "STORAGE_INDEX_PATH"}
+        patches = [
+            mock.patch.dict(os.environ, env, clear=True),
+            mock.patch.dict(storage_index._indexes, clear=True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_existing_files_are_indexed_on_first_use(self):
+        company_dir = self.outputs_dir / "roi_calculators" / "Acme-Corp"
+        company_dir.mkdir(parents=True)
+        (company_dir / "Acme-Corp-v1.json").write_text(json.dumps({
+            "company_name": "Acme Corp",
+            "version": 1,
+            "created_at": "2024-01-01T00:00:00",
+            "roi_outputs": {"net_annual_value": 1000.0},
+        }))
+
+        calculators = FileStorageBackend(self.outputs_dir).list_roi_calculators()
+
+        self.assertEqual([c["company"] for c in calculators], ["Acme Corp"])
+        self.assertTrue((self.outputs_dir / ".storage_index.db").exists())
+
+    def test_saves_land_in_the_backend_index(self):
+        backend = FileStorageBackend(self.outputs_dir)
+        backend.save_business_case("Globex", "# Business Case")
+
+        self.assertEqual([c["company"] for c in backend.list_business_cases()], ["Globex"])
+        self.assertEqual(FileStorageBackend(Path(self.tmp.name) / "other").list_business_cases(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()